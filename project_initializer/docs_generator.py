@@ -601,7 +601,7 @@ def _fastapi_api_claude(auth: str | None, async_db: bool) -> str:
         "├── main.py                     # App factory: load_configuration → logging → lifespan → CORS → router",
         "├── domain/                     # Pure core — NO framework/ORM imports",
         "│   ├── entities/               # Plain dataclasses (e.g. Item) — no SQLAlchemy/Pydantic",
-        "│   ├── ports/                  # Abstract repository interfaces (e.g. ItemRepositoryPort)",
+        "│   ├── ports/                  # Abstract interfaces (ItemRepositoryPort, CachePort)",
         "│   ├── services/               # Pure domain logic",
         "│   └── exceptions.py           # Domain exception types (framework-free)",
         "├── application/                # Use-case orchestration — depends on domain only",
@@ -611,15 +611,23 @@ def _fastapi_api_claude(auth: str | None, async_db: bool) -> str:
         "├── infrastructure/             # The ONLY tech layer",
         "│   ├── config.py               # Walk-up .env loader (load_configuration)",
         "│   ├── settings.py             # Settings (pydantic-settings, reads os.environ)",
-        "│   ├── database.py             # DatabaseManager: sync SQLAlchemy + psycopg2 pooling",
+        "│   ├── database.py             # DatabaseManager: sync SQLAlchemy + psycopg2/psycopg 3 pooling",
         "│   ├── orm/                    # SQLAlchemy models (Base in base.py)",
         "│   ├── repositories/           # Port adapters (e.g. ItemRepository) + BaseRepository",
+        "│   ├── startup.py              # Lifespan startup: DB fast path, pool + BAML warm-up",
+        "│   ├── rate_limiter.py         # Sliding-window limiter; redis/shared-memory backends",
+        "│   ├── logging_setup.py        # Queue-based logging, JSON formatter, request-id context",
+        "│   ├── metrics.py              # Prometheus HTTP/BAML/rate-limit metrics (multiprocess-aware)",
+        "│   ├── tracing.py              # Request/dependency/SQL/BAML spans, traceparent, OTLP-file export",
+        "│   ├── profiling.py            # X-Profile sampling profiler, speedscope files (debug/staging)",
+        "│   ├── loop_watchdog.py        # Event-loop lag histogram, blocking-frame reports",
+        "│   ├── cache.py                # TTL+LRU or Redis cache with single-flight loads (CachePort)",
         "│   └── audit.py                # Audit-log helper",
         "└── api/                        # HTTP surface",
         "    ├── deps.py                 # FastAPI deps (auth, pagination, rate limiting)",
         "    ├── handlers.py             # Centralized exception handlers",
         "    ├── schemas/                # Pydantic request/response schemas",
-        "    ├── middleware/             # Security, logging, rate limiting",
+        "    ├── middleware/             # Security, logging, rate limiting, compression",
         "    └── v1/                     # router.py aggregates endpoints/ (all under /api/v1)",
         "",
         "baml_src/                       # BAML definitions for LLM functions",
@@ -629,7 +637,14 @@ def _fastapi_api_claude(auth: str | None, async_db: bool) -> str:
         "\n- An opt-in async DB path (async engine + `AsyncSession`) is included, gated "
         "behind the `--async-db` generator flag "
         "(`infrastructure/database_async.py`, `infrastructure/repositories/base_async.py`); "
-        "the sync path above stays the default."
+        "the sync path above stays the default. In this project the items CRUD and "
+        "`/users/me` routes are `async def` over `get_async_db` → `AsyncItemService` → "
+        "`AsyncItemRepositoryPort` (`AsyncItemRepository`). The item reads (list, search, "
+        "get) and their dependencies never take a threadpool thread. Two things still do. "
+        "The bulk `POST /items/import` (blocking `COPY`) stays a sync `def`. The write routes "
+        "and `/users/me` depend on `CurrentUser` from `app/api/deps.py`, which runs in the "
+        "threadpool wherever it is a sync `def`; without auth it also reads the default "
+        "user through a sync `DBSession`."
         if async_db
         else ""
     )
@@ -0,0 +1,54 @@
+"""add trigram search indexes on items
+
+Revision ID: 0003_item_search
+Revises: 0002_create_users
+Create Date: 2026-10-19
+
+Hand-written (scaffold ships without a live DB connection). PostgreSQL only:
+it enables ``pg_trgm`` (a trusted extension since PostgreSQL 13, so the
+database owner may create it) and adds GIN trigram indexes on ``items.name``
+and ``items.description``. They serve the ``ILIKE '%q%'`` filter and the
+``word_similarity`` ranking of ``GET /items/search``. The indexes are built
+``CONCURRENTLY`` in an autocommit block, so writes to ``items`` are not
+blocked while they build. Other dialects (SQLite in tests) skip the revision.
+The downgrade drops the indexes but keeps the extension, which other objects
+may use.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0003_item_search"
+down_revision: Union[str, Sequence[str], None] = "0002_create_users"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = {"ix_items_name_trgm": "name", "ix_items_description_trgm": "description"}
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        for name, column in _INDEXES.items():
+            op.create_index(
+                name,
+                "items",
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        for name in _INDEXES:
+            op.drop_index(
+                name, table_name="items", postgresql_concurrently=True, if_exists=True
+            )
@@ -0,0 +1,134 @@
+"""HTTP conditional GETs: ETag / Last-Modified validators and 304 responses.
+
+HTTP-edge helper for read routes (``GET /items``, ``GET /items/{id}``). The
+validators are computed from the rows the service returned, before anything is
+serialized. When the client's ``If-None-Match`` (or, without one,
+``If-Modified-Since``) still matches, the handler returns an empty 304 and
+skips Pydantic validation and JSON encoding. With the item cache warm, no
+database query runs either.
+
+* An item's ETag hashes its fields (``id``, ``updated_at`` and the rest).
+  ``updated_at`` alone is not enough on SQLite, where ``CURRENT_TIMESTAMP``
+  has one-second resolution.
+* A page's ETag hashes the query, the total and every row's validator. It is
+  a digest of what the body is built from, not of the body itself. A sparse
+  fieldset (``?fields=``) is part of the query, so each one gets its own ETag.
+* ``Last-Modified`` is sent for single items only. For a page, a deleted row
+  or a new row with an old timestamp would not move the newest ``updated_at``,
+  so it could answer 304 for a page that changed.
+
+``Cache-Control`` comes from ``settings.http_cache_control`` by handler name.
+The default ``private, no-cache`` lets the browser keep the body and
+revalidate every time, which suits polling: unchanged pages cost a 304.
+"""
+
+import hashlib
+from dataclasses import fields, is_dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Iterable, Optional
+
+from fastapi import Request, Response, status
+from sqlalchemy import Row
+
+from app.infrastructure.settings import settings
+
+
+def _digest(parts: Iterable[Any]) -> str:
+    hasher = hashlib.blake2b(digest_size=12)
+    for part in parts:
+        hasher.update(str(part).encode())
+        hasher.update(b"\x1f")
+    return f'"{hasher.hexdigest()}"'
+
+
+def _row_parts(row: Any) -> Iterable[Any]:
+    if is_dataclass(row):
+        return [getattr(row, f.name) for f in fields(row)]
+    if isinstance(row, Row):
+        # Read-only rows (get_multi_rows): already the mapped columns, in order
+        return tuple(row)
+    # ORM rows: the mapped columns, in table order
+    return [getattr(row, c.key) for c in row.__table__.columns]
+
+
+def row_etag(row: Any, *variant: Any) -> str:
+    """Strong ETag for one row (entity, ORM instance or ``Row``).
+
+    ``variant`` is whatever else shapes the body (e.g. a sparse fieldset).
+    """
+    return _digest([*variant, *_row_parts(row)])
+
+
+def page_etag(rows: Iterable[Any], *query: Any) -> str:
+    """ETag for a page of rows plus whatever shapes the response (skip, total...)."""
+    return _digest([*query, *(row_etag(row) for row in rows)])
+
+
+def _as_utc(moment: datetime) -> datetime:
+    # SQLite hands back naive datetimes; they are UTC (server_default now())
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    # Weak comparison (RFC 9110 13.1.2): W/ prefixes are ignored
+    if header.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in header.split(",")
+    )
+
+
+def validators(
+    handler: str, etag: str, last_modified: Optional[datetime] = None
+) -> Dict[str, str]:
+    """Headers carrying the validators and the route's Cache-Control policy."""
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            _as_utc(last_modified).replace(microsecond=0), usegmt=True
+        )
+    policy = settings.http_cache_control.get(handler)
+    if policy:
+        headers["Cache-Control"] = policy
+    return headers
+
+
+def is_fresh(
+    request: Request, etag: str, last_modified: Optional[datetime] = None
+) -> bool:
+    """True when the client's cached copy is still current (answer 304).
+
+    ``If-None-Match`` wins when present; ``If-Modified-Since`` is only
+    consulted without it (RFC 9110 13.2.2).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return _as_utc(last_modified).replace(microsecond=0) <= since
+
+
+def conditional(
+    request: Request,
+    response: Response,
+    handler: str,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+) -> Optional[Response]:
+    """Return a 304 if the client is current; otherwise tag ``response`` and return None."""
+    headers = validators(handler, etag, last_modified)
+    if is_fresh(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,64 @@
+"""Opaque keyset cursors: ``?cursor=`` for pages that are not addressed by offset.
+
+A keyset page starts right after the last row of the previous page. That row's
+sort key, for example ``(rank, id)`` for ``/items/search``, is sent back to the
+client as URL-safe base64 of a JSON array. The client echoes it unchanged. It
+is not signed: a forged cursor only moves the page start, and the values are
+bound as query parameters.
+
+A cursor that does not decode to one value per expected type is reported as a
+normal 422 ``VALIDATION_ERROR`` on ``query.cursor``, like a bad ``?fields=``.
+The types are checked here because the values are bound straight into the
+keyset comparison: PostgreSQL would reject ``rank < 'x'`` with a 500.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Optional, Tuple, Union
+
+from fastapi.exceptions import RequestValidationError
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode a keyset position (JSON-serializable values) as an opaque token."""
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _matches(value: Any, expected: Union[type, Tuple[type, ...]]) -> bool:
+    # JSON true/false decode to bool, which isinstance() also counts as int
+    return isinstance(value, expected) and not isinstance(value, bool)
+
+
+def decode_cursor(
+    cursor: Optional[str], *types: Union[type, Tuple[type, ...]]
+) -> Optional[Tuple[Any, ...]]:
+    """Decode ``encode_cursor`` output to values of ``types`` (None: first page).
+
+    ``decode_cursor(cursor, (int, float), str)`` accepts ``[0.5, "id"]`` but
+    rejects ``["x", "y"]``, ``[1, 2]`` and ``[true, "id"]``.
+    """
+    if cursor is None:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError):
+        values = None
+    if (
+        not isinstance(values, list)
+        or len(values) != len(types)
+        or not all(map(_matches, values, types))
+    ):
+        raise RequestValidationError(
+            [
+                {
+                    "type": "value_error",
+                    "loc": ("query", "cursor"),
+                    "msg": "Invalid cursor; pass next_cursor from a previous page",
+                    "input": cursor,
+                }
+            ]
+        )
+    return tuple(values)
@@ -1,22 +1,53 @@
 """Global dependencies for the application"""
 
 import logging
-import time
 from typing import Any, Annotated, Optional
 
 from fastapi import Depends, Header, Query, Request
 from sqlalchemy.orm import Session
 
-from app.infrastructure.database import get_db
+from app.infrastructure.admission import admit_db_request
+from app.infrastructure.cache import MemoryBackend
+from app.infrastructure.database import get_db, get_db_readonly
+from app.infrastructure.metrics import RATE_LIMIT_REJECTED_TOTAL
+from app.infrastructure.rate_limiter import create_rate_limiter
+from app.infrastructure.settings import settings
+from app.infrastructure.tracing import traced
 
 logger = logging.getLogger(__name__)
 
 
+# ===========================
+# Database Sessions
+# ===========================
+# Routes depend on these rather than on get_db/get_db_readonly: the request
+# takes a DB admission slot (app.infrastructure.admission) before its session
+# is opened, so a saturated pool sheds it with 503 instead of parking a worker
+# thread in the pool queue. ``async def`` so the wrapper costs no thread hop.
+
+
+async def get_admitted_db(
+    _slot: None = Depends(admit_db_request), db: Session = Depends(get_db)
+) -> Session:
+    """Primary-database session, opened once the request holds a DB slot."""
+    return db
+
+
+async def get_admitted_db_readonly(
+    _slot: None = Depends(admit_db_request),
+    db: Session = Depends(get_db_readonly),
+) -> Session:
+    """Read-only session (replica-routed), opened once the request holds a slot."""
+    return db
+
+
 # ===========================
 # Simple User Authentication
 # ===========================
-# Cache for default user to avoid repeated database queries
-_DEFAULT_USER_CACHE: Optional[dict] = None
+# Cache for default user to avoid repeated database queries; the entry expires
+# after cache_ttl_users seconds, so a replaced first user is picked up again.
+_DEFAULT_USER_KEY = "default_user"
+_default_user_cache = MemoryBackend(max_entries=1)
 
 
 def get_default_user_from_db(db: Session) -> dict:
@@ -29,11 +60,10 @@ def get_default_user_from_db(db: Session) -> dict:
     Returns:
         User data dictionary
     """
-    global _DEFAULT_USER_CACHE
-
     # Return cached user if available
-    if _DEFAULT_USER_CACHE is not None:
-        return _DEFAULT_USER_CACHE.copy()
+    cached = _default_user_cache.get(_DEFAULT_USER_KEY)
+    if cached is not None:
+        return cached.copy()
 
     # Query for the first user in the database
     from app.infrastructure.orm import User
@@ -63,19 +93,24 @@ def get_default_user_from_db(db: Session) -> dict:
         user = default_user
 
     # Cache the user
-    _DEFAULT_USER_CACHE = {
+    default_user_data = {
         "id": user.id,
         "email": user.email,
         "username": user.email.split("@")[0],
         "is_active": True,
     }
+    _default_user_cache.set(
+        _DEFAULT_USER_KEY, default_user_data, settings.cache_ttl_users
+    )
 
     logger.debug(f"Using default user from database: {user.email} ({user.id})")
-    return _DEFAULT_USER_CACHE.copy()
+    return default_user_data.copy()
 
 
+@traced("auth.get_current_user")
 def get_current_user(
-    x_user_id: Annotated[Optional[str], Header()] = None, db: Session = Depends(get_db)
+    x_user_id: Annotated[Optional[str], Header()] = None,
+    db: Session = Depends(get_admitted_db),
 ) -> dict:
     """
     Get current user - simplified for local development.
@@ -103,8 +138,10 @@ def get_current_user(
     return get_default_user_from_db(db)
 
 
+@traced("auth.get_optional_user")
 def get_optional_user(
-    x_user_id: Annotated[Optional[str], Header()] = None, db: Session = Depends(get_db)
+    x_user_id: Annotated[Optional[str], Header()] = None,
+    db: Session = Depends(get_admitted_db),
 ) -> Optional[dict]:
     """
     Get optional user (returns None if no user context).
@@ -159,10 +196,10 @@ AdminUser = Annotated[
 
 class RateLimiter:
     """
-    In-memory rate limiting dependency for local development
+    Rate limiting dependency (backend chosen by ``rate_limit_backend``)
 
     Features:
-    - Sliding window rate limiting
+    - Sliding-window counter: O(1) per request, bounded LRU of client keys
     - IP-based and user-based limiting
     - Configurable requests per window
     """
@@ -171,46 +208,36 @@ class RateLimiter:
         self.requests = requests
         self.window = window
         self.per_user = per_user
-        self._in_memory_cache = {}
+        self._limiter = create_rate_limiter(
+            requests, window, namespace=f"deps:{requests}/{window}"
+        )
 
-    def __call__(self, request: Request, current_user: Optional[dict] = None):
+    async def __call__(self, request: Request, current_user: Optional[dict] = None):
         """Check rate limit for the request"""
-        return self._check_memory_rate_limit(request, current_user)
+        return await self._check_rate_limit(request, current_user)
 
-    def _check_memory_rate_limit(
+    async def _check_rate_limit(
         self, request: Request, current_user: Optional[dict] = None
     ) -> bool:
-        """In-memory rate limiting"""
         # Determine rate limit key
         if self.per_user and current_user:
             key = f"user:{current_user['id']}"
         else:
             key = f"ip:{self._get_client_ip(request)}"
 
-        current_time = time.time()
-        window_start = current_time - self.window
-
-        # Clean old entries and check current count
-        if key not in self._in_memory_cache:
-            self._in_memory_cache[key] = []
-
-        # Remove old entries
-        self._in_memory_cache[key] = [
-            timestamp
-            for timestamp in self._in_memory_cache[key]
-            if timestamp > window_start
-        ]
-
-        # Check rate limit
-        if len(self._in_memory_cache[key]) >= self.requests:
+        # Budgets are per route, so shared backends keep routes apart too.
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", request.url.path)
+        decision = await self._limiter.check(f"{route_path}|{key}")
+        if not decision.allowed:
             from app.domain.exceptions import RateLimitError
 
+            RATE_LIMIT_REJECTED_TOTAL.labels(limiter="dependency").inc()
+
             raise RateLimitError(
-                message=f"Rate limit exceeded: {len(self._in_memory_cache[key])}/{self.requests} requests per {self.window}s"
+                message=f"Rate limit exceeded: {self.requests} requests per {self.window}s",
+                retry_after=decision.retry_after_seconds,
             )
-
-        # Add current request
-        self._in_memory_cache[key].append(current_time)
         return True
 
     def _get_client_ip(self, request: Request) -> str:
@@ -234,7 +261,9 @@ def get_rate_limiter(requests: int = 100, window: int = 60) -> RateLimiter:
 
 
 # Common dependency injections
-DBSession = Annotated[Session, Depends(get_db)]
+DBSession = Annotated[Session, Depends(get_admitted_db)]
+# Replica-routed session for handlers that only read (see get_db_readonly)
+ReadOnlyDBSession = Annotated[Session, Depends(get_admitted_db_readonly)]
 # CurrentUser, OptionalUser, RequireAuth imported from auth module above
 
 
@@ -0,0 +1,65 @@
+"""Sparse fieldsets: ``?fields=id,name,price`` limits a response to those fields.
+
+``field_selector(ItemResponse)`` builds the query dependency. It splits the
+list, drops duplicates and rejects names the response model does not have. An
+unknown name is reported as a normal 422 ``VALIDATION_ERROR`` on
+``query.fields``. The result is a tuple in the model's field order, so
+``fields=price,id`` and ``fields=id,price`` give the same keys, the same
+serializer and the same cache key. Without the parameter the dependency
+returns ``None``, which means the full model.
+
+The tuple is handed down as a column projection. The repository selects only
+those columns (``select(Item.id, Item.name)``) and ``row_page(model, fields)``
+serializes only those keys. A client that renders names never fetches or
+sends ``description`` and the timestamps.
+"""
+
+from typing import Awaitable, Callable, Optional, Tuple, Type
+
+from fastapi import Query
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel
+
+FieldSet = Optional[Tuple[str, ...]]
+
+
+def field_selector(model: Type[BaseModel]) -> Callable[..., Awaitable[FieldSet]]:
+    """Dependency parsing ``?fields=`` against ``model``'s fields.
+
+    ``async def`` although it never awaits: FastAPI runs a sync dependency in the
+    threadpool, and parsing a string is not worth a thread hop.
+    """
+    allowed = tuple(model.model_fields)
+
+    async def select_fields(
+        fields: Optional[str] = Query(
+            default=None,
+            description=(
+                "Comma-separated fields to return (default: all). "
+                f"One or more of: {', '.join(allowed)}."
+            ),
+            examples=["id,name,price"],
+        ),
+    ) -> FieldSet:
+        if fields is None:
+            return None
+        requested = {name.strip() for name in fields.split(",")} - {""}
+        unknown = sorted(requested - set(allowed))
+        if unknown or not requested:
+            raise RequestValidationError(
+                [
+                    {
+                        "type": "value_error",
+                        "loc": ("query", "fields"),
+                        "msg": (
+                            f"Unknown field(s): {', '.join(unknown)}"
+                            if unknown
+                            else "Name at least one field"
+                        ),
+                        "input": fields,
+                    }
+                ]
+            )
+        return tuple(name for name in allowed if name in requested)
+
+    return select_fields
@@ -219,7 +219,11 @@ def setup_exception_handlers(app: FastAPI) -> None:
     ):
         """Handle database timeout errors with specific monitoring"""
 
-        logger.error(
+        # Admission sheds (they carry retry_after) are expected under load and
+        # counted by db_admission_rejected_total, so they only warrant a WARNING.
+        shed = "retry_after" in exc.details
+        logger.log(
+            logging.WARNING if shed else logging.ERROR,
             f"Database timeout error: {exc.message}",
             extra={
                 "error_code": exc.error_code,
@@ -239,7 +243,8 @@ def setup_exception_handlers(app: FastAPI) -> None:
         )
 
         response.headers["X-Database-Error"] = "timeout"
-        response.headers["Retry-After"] = "5"  # Suggest retry after 5 seconds
+        # Suggest a retry after 5 seconds unless the raiser knows better
+        response.headers["Retry-After"] = str(exc.details.get("retry_after", 5))
 
         return response
 
@@ -0,0 +1,152 @@
+"""Streaming reader for bulk item uploads (CSV or NDJSON).
+
+HTTP-edge adapter for ``POST /items/import``: it decodes the uploaded file row by
+row, validates each row against the same ``ItemCreate`` rules the single-item
+endpoint uses, and yields the valid rows in fixed-size batches. The repository
+consumes those batches lazily (``COPY`` into a staging table on PostgreSQL), so
+the upload is never materialised in memory and validation overlaps the load.
+
+Rejected rows are collected on the reader instead of aborting the import; only
+the first ``MAX_REPORTED_ERRORS`` carry their messages back to the client, while
+``rejected`` always holds the full count.
+
+The upload must be UTF-8. Bytes that do not decode are kept as lone surrogates
+(``surrogateescape``) only long enough to reject the row that holds them, so a
+mis-encoded export is reported rather than imported with ``U+FFFD`` in place of
+its accented names.
+"""
+
+import codecs
+import csv
+import json
+import re
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from app.api.schemas.item import ItemCreate, ItemImportRowError
+
+# Rows per COPY batch — large enough to amortise the round trip, small enough
+# that one batch of validated dicts stays a few MB.
+IMPORT_BATCH_SIZE = 5000
+
+# Cap on per-row error details returned to the client.
+MAX_REPORTED_ERRORS = 100
+
+# Lone surrogates left by ``surrogateescape`` for bytes that are not UTF-8
+_UNDECODABLE = re.compile("[\udc80-\udcff]")
+_INVALID_UTF8 = "row: invalid UTF-8 bytes"
+
+CSV_FORMAT = "csv"
+NDJSON_FORMAT = "ndjson"
+
+_NDJSON_CONTENT_TYPES = (
+    "application/x-ndjson",
+    "application/ndjson",
+    "application/jsonl",
+)
+_NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+_CSV_CONTENT_TYPES = ("text/csv", "application/csv", "application/vnd.ms-excel")
+
+
+def detect_import_format(
+    filename: Optional[str], content_type: Optional[str]
+) -> Optional[str]:
+    """Return ``"csv"``/``"ndjson"`` from the upload's name or type, else None."""
+    name = (filename or "").lower()
+    media = (content_type or "").split(";")[0].strip().lower()
+    if media in _NDJSON_CONTENT_TYPES or name.endswith(_NDJSON_SUFFIXES):
+        return NDJSON_FORMAT
+    if media in _CSV_CONTENT_TYPES or name.endswith(".csv"):
+        return CSV_FORMAT
+    return None
+
+
+def _clean(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop blank CSV cells so optional fields fall back to their defaults."""
+    return {
+        key.strip(): value
+        for key, value in record.items()
+        if key and value is not None and value != ""
+    }
+
+
+def _format_errors(exc: ValidationError) -> List[str]:
+    """Flatten a pydantic ValidationError into ``"field: message"`` strings."""
+    return [
+        f"{'.'.join(str(loc) for loc in err['loc']) or 'row'}: {err['msg']}"
+        for err in exc.errors()
+    ]
+
+
+class ItemImportReader:
+    """Validate an uploaded item file and yield the accepted rows in batches."""
+
+    def __init__(
+        self,
+        stream: IO[bytes],
+        fmt: str,
+        batch_size: int = IMPORT_BATCH_SIZE,
+    ):
+        self.stream = stream
+        self.fmt = fmt
+        self.batch_size = batch_size
+        self.rejected = 0
+        self.errors: List[ItemImportRowError] = []
+
+    def _records(self) -> Iterator[Tuple[int, Any]]:
+        """Yield ``(row_number, raw_record)`` pairs from the decoded stream."""
+        # utf-8-sig strips the BOM spreadsheet exports prepend to CSV files.
+        text = codecs.getreader("utf-8-sig")(self.stream, errors="surrogateescape")
+        if self.fmt == CSV_FORMAT:
+            for number, record in enumerate(csv.DictReader(text), start=1):
+                values = [v for v in record.values() if isinstance(v, str)]
+                if any(_UNDECODABLE.search(value) for value in values):
+                    yield number, UnicodeError(_INVALID_UTF8)
+                else:
+                    yield number, _clean(record)
+            return
+
+        number = 0
+        for line in text:
+            if not line.strip():
+                continue
+            number += 1
+            if _UNDECODABLE.search(line):
+                yield number, UnicodeError(_INVALID_UTF8)
+                continue
+            try:
+                yield number, json.loads(line)
+            except json.JSONDecodeError as exc:
+                yield number, exc
+
+    def _reject(self, row: int, errors: List[str]) -> None:
+        """Count a rejected row, keeping its details while under the cap."""
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(ItemImportRowError(row=row, errors=errors))
+
+    def batches(self) -> Iterator[List[Dict[str, Any]]]:
+        """Yield lists of validated ``ItemCreate`` dicts, ``batch_size`` at a time."""
+        batch: List[Dict[str, Any]] = []
+        for row, record in self._records():
+            if isinstance(record, UnicodeError):
+                self._reject(row, [str(record)])
+                continue
+            if isinstance(record, json.JSONDecodeError):
+                self._reject(row, [f"row: invalid JSON ({record.msg})"])
+                continue
+            if not isinstance(record, dict):
+                self._reject(row, ["row: expected a JSON object"])
+                continue
+            try:
+                item = ItemCreate.model_validate(record)
+            except ValidationError as exc:
+                self._reject(row, _format_errors(exc))
+                continue
+            batch.append(item.model_dump())
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
@@ -10,7 +10,10 @@ middleware/
 ├── __init__.py       # This file - exports middleware classes
 ├── logging.py        # Request/response logging middleware
 ├── security.py       # Security headers middleware
-└── rate_limiting.py  # Rate limiting middleware
+├── rate_limiting.py  # Rate limiting middleware
+├── query_stats.py    # Per-request SQL count/time and N+1 warnings
+├── metrics.py        # Prometheus request rate/errors/latency per route
+└── compression.py    # gzip/brotli responses; SSE and small bodies pass through
 
 Creating Custom Middleware
 --------------------------
@@ -90,9 +93,19 @@ Best Practices
 from app.api.middleware.logging import LoggingMiddleware
 from app.api.middleware.security import SecurityHeadersMiddleware
 from app.api.middleware.rate_limiting import RateLimitingMiddleware
+from app.api.middleware.query_stats import QueryStatsMiddleware
+from app.api.middleware.metrics import MetricsMiddleware
+from app.api.middleware.tracing import TracingMiddleware
+from app.api.middleware.profiling import ProfilingMiddleware
+from app.api.middleware.compression import CompressionMiddleware
 
 __all__ = [
     "LoggingMiddleware",
     "SecurityHeadersMiddleware",
     "RateLimitingMiddleware",
+    "QueryStatsMiddleware",
+    "MetricsMiddleware",
+    "TracingMiddleware",
+    "ProfilingMiddleware",
+    "CompressionMiddleware",
 ]
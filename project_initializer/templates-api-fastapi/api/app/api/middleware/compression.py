@@ -0,0 +1,196 @@
+"""Response compression: gzip, or brotli when installed (pure ASGI).
+
+The coding comes from the request's ``Accept-Encoding`` (q-values honoured).
+``br`` wins a tie when the ``brotli`` package is importable; otherwise ``gzip``
+is used. The decision is made at ``http.response.start``, and these responses
+go through untouched, headers and body, as soon as they arrive:
+
+* ``text/event-stream`` (``/chat/stream``). SSE is never compressed, so no
+  event ever waits in a compressor buffer.
+* Media types that do not start with an entry of ``content_types``, responses
+  that already have a ``Content-Encoding``, ``Cache-Control: no-transform``,
+  ``HEAD`` requests and bodiless statuses (204, 304).
+* Routes that opted out with ``dependencies=[Depends(no_compression)]``.
+* Single-message bodies shorter than ``minimum_size`` bytes.
+
+Other streamed bodies (``more_body``) are compressed chunk by chunk with a sync
+flush, so each chunk reaches the client as soon as the app sends it. A
+compressed response gets ``Vary: Accept-Encoding`` and a weak ETag. The bytes
+differ from the identity encoding, and ``app.api.conditional`` compares weakly,
+so a later ``If-None-Match`` still matches.
+"""
+
+import zlib
+from typing import Dict, Iterable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:  # Optional: without brotli only gzip is offered
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+EVENT_STREAM = "text/event-stream"
+_NO_BODY_STATUSES = frozenset({204, 304})
+# Key a route dependency sets in the ASGI scope to turn compression off
+_SCOPE_KEY = "compression"
+
+
+def no_compression(request: Request) -> None:
+    """Route dependency: send this route's responses uncompressed."""
+    request.scope[_SCOPE_KEY] = False
+
+
+def _accepted(accept_encoding: str) -> Dict[str, float]:
+    codings: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        if coding:
+            codings[coding.strip().lower()] = quality
+    return codings
+
+
+def negotiate(accept_encoding: str, brotli_available: bool = True) -> Optional[str]:
+    """Pick ``br`` or ``gzip`` for an ``Accept-Encoding`` value (None: neither)."""
+    codings = _accepted(accept_encoding)
+    wildcard = codings.get("*", 0.0)
+    gzip_q = codings.get("gzip", wildcard)
+    br_q = codings.get("br", wildcard) if brotli_available else 0.0
+    if br_q > 0 and br_q >= gzip_q:
+        return "br"
+    if gzip_q > 0:
+        return "gzip"
+    return None
+
+
+class _Compressor:
+    """One response's compression stream; ``chunk`` flushes, ``finish`` ends."""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+            self._gzip = None
+        else:
+            self._brotli = None
+            # wbits=31: zlib stream with a gzip header and trailer
+            self._gzip = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def chunk(self, data: bytes) -> bytes:
+        if self._brotli is not None:
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._gzip.compress(data) + self._gzip.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes) -> bytes:
+        if self._brotli is not None:
+            return self._brotli.process(data) + self._brotli.finish()
+        return self._gzip.compress(data) + self._gzip.flush()
+
+
+class CompressionMiddleware:
+    """Compress eligible responses; never delays or buffers the others."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        content_types: Iterable[str] = ("application/json", "text/"),
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = tuple(content_types)
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def _compressible(self, scope: Scope, headers: Headers, status: int) -> bool:
+        if status in _NO_BODY_STATUSES or scope.get(_SCOPE_KEY) is False:
+            return False
+        if "content-encoding" in headers:
+            return False
+        if "no-transform" in headers.get("cache-control", "").lower():
+            return False
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        if not media_type or media_type == EVENT_STREAM:
+            return False
+        return media_type.startswith(self.content_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(
+            Headers(scope=scope).get("accept-encoding", ""), brotli is not None
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if passthrough or message["type"] not in (
+                "http.response.start",
+                "http.response.body",
+            ):
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message.get("headers", []))
+                length = headers.get("content-length")
+                too_small = length is not None and int(length) < self.minimum_size
+                if too_small or not self._compressible(
+                    scope, headers, message["status"]
+                ):
+                    passthrough = True
+                    await send(message)
+                    return
+                start = message  # held until the first body shows its shape
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                compressor = _Compressor(encoding, self.gzip_level, self.brotli_quality)
+                start.setdefault("headers", [])
+                headers = MutableHeaders(scope=start)
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                etag = headers.get("etag")
+                if etag is not None and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+                if more_body:
+                    if "content-length" in headers:
+                        del headers["Content-Length"]
+                    body = compressor.chunk(body)
+                else:
+                    body = compressor.finish(body)
+                    headers["Content-Length"] = str(len(body))
+                await send(start)
+            elif more_body:
+                body = compressor.chunk(body)
+            else:
+                body = compressor.finish(body)
+            await send(
+                {"type": "http.response.body", "body": body, "more_body": more_body}
+            )
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,28 +1,80 @@
 """Request logging middleware"""
 
-import time
 import logging
+import random
+import time
 import uuid
-import json
+from typing import Optional, Sequence
+
 from starlette.types import ASGIApp, Scope, Receive, Send, Message
 
+from app.infrastructure.logging_setup import reset_request_id, set_request_id
+
 logger = logging.getLogger(__name__)
 
+# Content types whose bodies are worth logging
+_TEXTUAL_TYPES = (b"application/json", b"text/", b"application/problem+json")
+
+# Longest incoming X-Request-ID accepted; anything longer gets a fresh id
+_MAX_REQUEST_ID_LENGTH = 128
+
+
+def _incoming_request_id(scope: Scope) -> Optional[str]:
+    for name, value in scope["headers"]:
+        if name == b"x-request-id":
+            if 0 < len(value) <= _MAX_REQUEST_ID_LENGTH and value.isascii():
+                request_id = value.decode()
+                if request_id.isprintable():
+                    return request_id
+            return None
+    return None
 
-class LoggingMiddleware:
-    """Middleware to log all requests and responses for monitoring and debugging"""
 
-    def __init__(self, app: ASGIApp):
+class LoggingMiddleware:
+    """Middleware to log all requests and responses for monitoring and debugging
+
+    Every request gets a start and a completion line. Response bodies are not
+    logged unless sampled in: a ``body_sample_rate`` fraction of requests, every
+    5xx when ``body_on_5xx`` is set, and every path under a ``body_paths``
+    prefix. A sampled body (JSON or text only) is copied into a ``bytearray``
+    of ``body_max_bytes``, allocated once per sampled response, and logged as
+    sent.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        body_sample_rate: float = 0.0,
+        body_on_5xx: bool = False,
+        body_paths: Sequence[str] = (),
+        body_max_bytes: int = 4096,
+    ):
         self.app = app
+        self.body_sample_rate = body_sample_rate
+        self.body_on_5xx = body_on_5xx
+        self.body_paths = tuple(body_paths)
+        self.body_max_bytes = body_max_bytes
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
             await self.app(scope, receive, send)
             return
 
-        # Generate request ID for tracing
-        request_id = str(uuid.uuid4())
-
+        # Reuse the caller's X-Request-ID (so one id spans several services) or
+        # generate one; every record logged while the request is in flight
+        # carries it (see logging_setup), and exception handlers read it from
+        # request.state
+        request_id = _incoming_request_id(scope) or str(uuid.uuid4())
+        scope.setdefault("state", {})["request_id"] = request_id
+        token = set_request_id(request_id)
+        try:
+            await self._handle(scope, receive, send, request_id)
+        finally:
+            reset_request_id(token)
+
+    async def _handle(
+        self, scope: Scope, receive: Receive, send: Send, request_id: str
+    ) -> None:
         start_time = time.time()
 
         # Extract request information from scope
@@ -51,28 +103,32 @@ class LoggingMiddleware:
             },
         )
 
-        # Capture response data (cap at 64KB to prevent OOM on large responses)
-        _MAX_LOG_BODY_SIZE = 64 * 1024
-        response_body = b""
         response_status = 200
-        response_headers = {}
+        capture: Optional[bytearray] = None
+        captured = 0
+        truncated = False
 
         async def send_wrapper(message: Message) -> None:
-            nonlocal response_body, response_status, response_headers
+            nonlocal response_status, capture, captured, truncated
 
             if message["type"] == "http.response.start":
                 response_status = message["status"]
-                response_headers = dict(message.get("headers", []))
+                if self._should_capture(path, response_status, message):
+                    capture = bytearray(self.body_max_bytes)
                 # Add request ID to response headers
-                new_headers = list(message.get("headers", []))
-                new_headers.append((b"x-request-id", request_id.encode()))
-                new_headers.append(
-                    (b"x-process-time", f"{time.time() - start_time:.3f}s".encode())
-                )
-                message["headers"] = new_headers
-            elif message["type"] == "http.response.body":
-                if len(response_body) < _MAX_LOG_BODY_SIZE:
-                    response_body += message.get("body", b"")
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-request-id", request_id.encode()),
+                    (b"x-process-time", f"{time.time() - start_time:.3f}s".encode()),
+                ]
+            elif capture is not None and message["type"] == "http.response.body":
+                body = message.get("body", b"")
+                room = self.body_max_bytes - captured
+                if len(body) > room:
+                    truncated = True
+                    body = body[:room]
+                capture[captured : captured + len(body)] = body
+                captured += len(body)
 
             await send(message)
 
@@ -82,52 +138,33 @@ class LoggingMiddleware:
         # Calculate processing time
         process_time = time.time() - start_time
 
-        # Parse response JSON if available
-        response_json = None
-
-        if response_body:
-            try:
-                # Check if it's JSON content
-                content_type = (
-                    response_headers.get(b"content-type", b"").decode().lower()
-                )
-                if "application/json" in content_type:
-                    response_text = response_body.decode("utf-8")
-                    response_json = json.loads(response_text)
-            except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                logger.debug(f"Failed to parse response JSON for {request_id}: {e}")
-
-        # Prepare log extra data
         log_extra = {
             "request_id": request_id,
             "status_code": response_status,
             "process_time": process_time,
             "event_type": "request_complete",
         }
-
-        # Add response JSON if available
-        if response_json is not None:
-            log_extra["response_json"] = response_json
-
-        # Log response with JSON if available
-        if response_json is not None:
-            try:
-                # Format JSON beautifully with indentation - never truncate
-                formatted_json = json.dumps(
-                    response_json, indent=2, ensure_ascii=False, separators=(",", ": ")
-                )
-
-                logger.info(
-                    f"Response {request_id}: {response_status} in {process_time:.3f}s - JSON:\n{formatted_json}",
-                    extra=log_extra,
-                )
-            except (TypeError, ValueError) as e:
-                logger.info(
-                    f"Response {request_id}: {response_status} in {process_time:.3f}s - JSON: [serialization error: {e}]",
-                    extra=log_extra,
-                )
-        else:
-            logger.info(
-                f"Response {request_id}: {response_status} in {process_time:.3f}s",
-                extra=log_extra,
+        if capture is not None:
+            # Raw bytes as sent, not re-parsed or re-serialised
+            log_extra["response_body"] = capture[:captured].decode(
+                "utf-8", errors="replace"
             )
+            log_extra["response_body_truncated"] = truncated
+
+        logger.info(
+            f"Response {request_id}: {response_status} in {process_time:.3f}s",
+            extra=log_extra,
+        )
+
+    def _should_capture(self, path: str, status: int, message: Message) -> bool:
+        """Sample this response's body for the log? Textual bodies only."""
+        if not (
+            (self.body_on_5xx and status >= 500)
+            or (self.body_paths and path.startswith(self.body_paths))
+            or (self.body_sample_rate and random.random() < self.body_sample_rate)
+        ):
+            return False
+        for name, value in message.get("headers", ()):
+            if name.lower() == b"content-type":
+                return value.startswith(_TEXTUAL_TYPES)
+        return False
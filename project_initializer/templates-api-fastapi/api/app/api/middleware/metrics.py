@@ -0,0 +1,50 @@
+"""Prometheus HTTP metrics middleware"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.metrics import UNMATCHED_ROUTE, http_metrics
+
+
+class MetricsMiddleware:
+    """Count requests and time them per route template (pure ASGI).
+
+    The route template is read from ``scope["route"]`` after the app ran, so
+    ``/items/42`` and ``/items/43`` are one series. A request that raises is
+    counted as a 500. ``skip_paths`` (the scrape endpoint itself) are not
+    measured.
+    """
+
+    def __init__(self, app: ASGIApp, skip_paths: frozenset = frozenset()):
+        self.app = app
+        self.skip_paths = skip_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        in_progress = http_metrics.in_progress(method)
+        in_progress.inc()
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_progress.dec()
+            route = scope.get("route")
+            http_metrics.observe(
+                method,
+                route.path if route is not None else UNMATCHED_ROUTE,
+                status,
+                time.perf_counter() - start,
+            )
@@ -0,0 +1,99 @@
+"""On-demand request profiling middleware (``X-Profile: 1``)"""
+
+import logging
+import threading
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.profiling import ProfileStore, SamplingProfiler
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilingMiddleware:
+    """Profile requests that send ``X-Profile: 1`` (pure ASGI).
+
+    Only add it in debug or staging (see ``profiling_allowed``). The response
+    itself is unchanged, apart from an ``X-Profile-Id`` header naming the
+    stored speedscope file (``GET /debug/profiles/{id}``). The profile covers
+    the whole response, including a streamed body.
+    """
+
+    def __init__(self, app: ASGIApp, store: ProfileStore, interval_ms: float = 1.0):
+        self.app = app
+        self.store = store
+        self.interval = interval_ms / 1000
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (b"x-profile", b"1") not in scope["headers"]:
+            await self.app(scope, receive, send)
+            return
+        if not self.store.try_acquire():
+            logger.info(f"Profile skipped (another one is running): {scope['path']}")
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self._profile(scope, receive, send)
+        finally:
+            self.store.release()
+
+    async def _profile(self, scope: Scope, receive: Receive, send: Send) -> None:
+        method, path = scope["method"], scope["path"]
+        profiler = SamplingProfiler(threading.get_ident(), self.interval)
+        status_code = 500
+        response_start = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_start
+            if message["type"] == "http.response.start":
+                # Hold the start until the profile id exists (end of body)
+                status_code = message["status"]
+                response_start = message
+                return
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                profiler.stop()
+                profile_id = self._save(profiler, method, path, status_code)
+                if response_start is not None:
+                    response_start["headers"] = [
+                        *response_start.get("headers", ()),
+                        (b"x-profile-id", profile_id.encode()),
+                    ]
+                    await send(response_start)
+                await send(message)
+                return
+            if response_start is not None:
+                # Streaming: release the start with the first chunk, no id header
+                await send(response_start)
+                response_start = None
+            await send(message)
+
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if profiler.elapsed == 0.0:
+                # Stream ended without a final empty chunk, or the app raised
+                profiler.stop()
+                self._save(profiler, method, path, status_code)
+
+    def _save(
+        self, profiler: SamplingProfiler, method: str, path: str, status_code: int
+    ) -> str:
+        name = f"{method} {path}"
+        profile_id = self.store.save(
+            profiler.to_speedscope(name),
+            {
+                "name": name,
+                "status_code": status_code,
+                "duration_ms": round(profiler.elapsed * 1000, 2),
+                "samples": sum(len(s) for s in profiler.samples.values()),
+            },
+        )
+        logger.info(
+            f"Profiled {name} in {profiler.elapsed:.3f}s: {profile_id}",
+            extra={"event_type": "request_profiled", "profile_id": profile_id},
+        )
+        return profile_id
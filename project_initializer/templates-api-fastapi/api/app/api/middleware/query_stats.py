@@ -0,0 +1,64 @@
+"""Per-request SQL instrumentation middleware"""
+
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.query_stats import reset_query_stats, start_query_stats
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """Collect SQL count/time per request, warn on N+1 patterns.
+
+    With ``expose_headers`` (debug) the totals are sent as ``Server-Timing`` and
+    ``X-DB-Queries`` so they show up in the browser's network panel. Only
+    statements run before the response starts are in the headers; the N+1
+    check after the response covers the whole request.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        expose_headers: bool = False,
+        n_plus_one_threshold: int = 10,
+    ):
+        self.app = app
+        self.expose_headers = expose_headers
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_query_stats()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.expose_headers:
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (
+                        b"server-timing",
+                        f'db;dur={stats.total_time_ms:.1f};desc="{stats.count} queries"'.encode(),
+                    )
+                )
+                headers.append((b"x-db-queries", str(stats.count).encode()))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            reset_query_stats(token)
+            for shape, times in stats.repeated(self.n_plus_one_threshold):
+                logger.warning(
+                    f"Possible N+1 on {scope.get('method', '')} {scope.get('path', '')}: "
+                    f"statement ran {times} times: {shape}",
+                    extra={
+                        "event_type": "n_plus_one",
+                        "path": scope.get("path", ""),
+                        "repeat_count": times,
+                    },
+                )
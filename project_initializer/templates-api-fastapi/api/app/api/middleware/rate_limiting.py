@@ -1,105 +1,107 @@
 """Rate limiting middleware for API protection"""
 
-import time
+import json
 import logging
-from typing import Dict, List
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.infrastructure.metrics import RATE_LIMIT_REJECTED_TOTAL
+from app.infrastructure.rate_limiter import RateLimitDecision, create_rate_limiter
 from app.infrastructure.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Probes and scrapes are never limited.
+EXEMPT_PATHS = frozenset({"/health", "/health/live", "/health/ready", "/", "/metrics"})
 
-class RateLimitingMiddleware(BaseHTTPMiddleware):
-    """Simple in-memory rate limiting middleware for basic protection"""
-
-    def __init__(self, app, requests: int = 100, window: int = 60):
-        super().__init__(app)
-        self.requests = requests
-        self.window = window
-        self.client_requests: Dict[str, List[float]] = {}
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        # Skip rate limiting in development
-        if settings.is_development:
-            return await call_next(request)
+class RateLimitingMiddleware:
+    """Per-IP sliding-window rate limiting (pure ASGI, O(1) per request).
 
-        # Get client identifier
-        client_ip = request.client.host if request.client else "unknown"
+    Counting is delegated to the backend from ``create_rate_limiter``, the same
+    engine as the ``deps.RateLimiter`` dependency. Allowed responses get ``X-RateLimit-*``
+    headers; over-limit requests get a 429 with ``Retry-After`` and never reach
+    the app.
+    """
 
-        # Skip rate limiting for health checks
-        if request.url.path in ["/health", "/", "/metrics"]:
-            return await call_next(request)
-
-        current_time = time.time()
-
-        # Clean old entries for this client
-        if client_ip in self.client_requests:
-            self.client_requests[client_ip] = [
-                timestamp
-                for timestamp in self.client_requests[client_ip]
-                if timestamp > current_time - self.window
-            ]
-        else:
-            self.client_requests[client_ip] = []
-
-        # Check rate limit
-        request_count = len(self.client_requests[client_ip])
-
-        if request_count >= self.requests:
+    def __init__(
+        self,
+        app: ASGIApp,
+        requests: int = 100,
+        window: int = 60,
+        max_keys: int = 10_000,
+    ):
+        self.app = app
+        self.requests = requests
+        self.window = window
+        self.limiter = create_rate_limiter(
+            requests, window, namespace="middleware", max_keys=max_keys
+        )
+        self._limit_header = (b"x-ratelimit-limit", str(requests).encode())
+        self._rejected = RATE_LIMIT_REJECTED_TOTAL.labels(limiter="middleware")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or settings.is_development
+            or scope["path"] in EXEMPT_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        decision = await self.limiter.check(f"ip:{client_ip}")
+        reset_at = str(int(time.time() + decision.reset_after)).encode()
+
+        if not decision.allowed:
+            self._rejected.inc()
             logger.warning(
-                f"Rate limit exceeded for client {client_ip}: {request_count} requests in {self.window}s"
-            )
-
-            # Calculate retry after time
-            oldest_request = min(self.client_requests[client_ip])
-            retry_after = int(oldest_request + self.window - current_time) + 1
-
-            return JSONResponse(
-                content={
-                    "error": {
-                        "code": "RATE_LIMIT_EXCEEDED",
-                        "message": f"Rate limit exceeded. Maximum {self.requests} requests per {self.window} seconds.",
-                        "retry_after": retry_after,
-                    }
-                },
-                status_code=429,
-                headers={
-                    "Retry-After": str(retry_after),
-                    "X-RateLimit-Limit": str(self.requests),
-                    "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(int(oldest_request + self.window)),
-                },
+                f"Rate limit exceeded for client {client_ip}: "
+                f"{self.requests} requests per {self.window}s"
             )
-
-        # Record this request
-        self.client_requests[client_ip].append(current_time)
-
-        # Process the request
-        response = await call_next(request)
-
-        # Add rate limit headers to response
-        remaining = max(0, self.requests - len(self.client_requests[client_ip]))
-        response.headers["X-RateLimit-Limit"] = str(self.requests)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Reset"] = str(int(current_time + self.window))
-
-        return response
-
-    def cleanup_old_entries(self) -> None:
-        """Cleanup old entries from all clients to prevent memory leaks"""
-        current_time = time.time()
-
-        for client_ip in list(self.client_requests.keys()):
-            # Filter out old requests
-            self.client_requests[client_ip] = [
-                timestamp
-                for timestamp in self.client_requests[client_ip]
-                if timestamp > current_time - self.window
-            ]
-
-            # Remove client if no recent requests
-            if not self.client_requests[client_ip]:
-                del self.client_requests[client_ip]
+            await self._reject(send, decision, reset_at)
+            return
+
+        rate_headers = [
+            self._limit_header,
+            (b"x-ratelimit-remaining", str(decision.remaining).encode()),
+            (b"x-ratelimit-reset", reset_at),
+        ]
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), *rate_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _reject(
+        self, send: Send, decision: RateLimitDecision, reset_at: bytes
+    ) -> None:
+        retry_after = decision.retry_after_seconds
+        body = json.dumps(
+            {
+                "error": {
+                    "code": "RATE_LIMIT_EXCEEDED",
+                    "message": f"Rate limit exceeded. Maximum {self.requests} requests per {self.window} seconds.",
+                    "retry_after": retry_after,
+                }
+            }
+        ).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(retry_after).encode()),
+                    self._limit_header,
+                    (b"x-ratelimit-remaining", b"0"),
+                    (b"x-ratelimit-reset", reset_at),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
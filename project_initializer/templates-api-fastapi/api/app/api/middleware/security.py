@@ -1,75 +1,99 @@
 """Security middleware for adding security headers"""
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from typing import Dict
-from app.infrastructure.settings import settings
+from typing import Dict, List, Tuple
 
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware to add security headers to all responses"""
+from app.infrastructure.settings import settings
 
-    @staticmethod
-    def get_security_headers(request: Request) -> Dict[str, str]:
-        """Get security headers dictionary based on request path and environment"""
+DOCS_PATHS = frozenset({"/docs", "/redoc", "/openapi.json"})
 
-        # Check if this is a documentation endpoint
-        is_docs_endpoint = request.url.path in ["/docs", "/redoc", "/openapi.json"]
+# Allows the external resources Swagger UI / ReDoc load (docs in debug only)
+DOCS_CSP = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://unpkg.com; "
+    "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://unpkg.com; "
+    "img-src 'self' data: https://fastapi.tiangolo.com; "
+    "font-src 'self' https://cdn.jsdelivr.net https://unpkg.com; "
+    "connect-src 'self'; "
+    "frame-ancestors 'none'"
+)
+# Restrictive CSP for API endpoints
+API_CSP = "default-src 'none'; frame-ancestors 'none'; upgrade-insecure-requests"
 
-        # Base security headers
-        headers = {
-            # XSS Protection
-            "X-XSS-Protection": "1; mode=block",
-            # Content Type Options
-            "X-Content-Type-Options": "nosniff",
-            # Frame Options
-            "X-Frame-Options": "DENY",
-            # Referrer Policy
-            "Referrer-Policy": "strict-origin-when-cross-origin",
-            # HSTS (HTTPS only)
-            "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
-            # Permissions Policy (disable unnecessary features)
-            "Permissions-Policy": (
-                "geolocation=(), "
-                "microphone=(), "
-                "camera=(), "
-                "payment=(), "
-                "usb=(), "
-                "magnetometer=(), "
-                "gyroscope=(), "
-                "fullscreen=()"
-            ),
-            # Custom security headers
-            "X-API-Version": settings.version,
-        }
 
+def build_security_headers(is_docs_endpoint: bool, debug: bool) -> Dict[str, str]:
+    """Security headers for one (docs vs API, debug) variant"""
+    return {
+        # XSS Protection
+        "X-XSS-Protection": "1; mode=block",
+        # Content Type Options
+        "X-Content-Type-Options": "nosniff",
+        # Frame Options
+        "X-Frame-Options": "DENY",
+        # Referrer Policy
+        "Referrer-Policy": "strict-origin-when-cross-origin",
+        # HSTS (HTTPS only)
+        "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+        # Permissions Policy (disable unnecessary features)
+        "Permissions-Policy": (
+            "geolocation=(), "
+            "microphone=(), "
+            "camera=(), "
+            "payment=(), "
+            "usb=(), "
+            "magnetometer=(), "
+            "gyroscope=(), "
+            "fullscreen=()"
+        ),
+        # Custom security headers
+        "X-API-Version": settings.version,
         # Content Security Policy based on endpoint and environment
-        if is_docs_endpoint and settings.debug:
-            # Allow external resources for Swagger UI in development
-            headers["Content-Security-Policy"] = (
-                "default-src 'self'; "
-                "script-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://unpkg.com; "
-                "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://unpkg.com; "
-                "img-src 'self' data: https://fastapi.tiangolo.com; "
-                "font-src 'self' https://cdn.jsdelivr.net https://unpkg.com; "
-                "connect-src 'self'; "
-                "frame-ancestors 'none'"
-            )
-        else:
-            # Restrictive CSP for API endpoints
-            headers["Content-Security-Policy"] = (
-                "default-src 'none'; frame-ancestors 'none'; upgrade-insecure-requests"
-            )
+        "Content-Security-Policy": (
+            DOCS_CSP if is_docs_endpoint and debug else API_CSP
+        ),
+    }
+
+
+class SecurityHeadersMiddleware:
+    """Add security headers to all responses (pure ASGI).
+
+    The four (docs vs API, debug) header lists are encoded once, here, and
+    appended to ``http.response.start``. Body messages pass through untouched,
+    so streaming responses (``/chat/stream`` SSE) are never buffered. Headers
+    the app already set under the same names are replaced, as before.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._variants: Dict[Tuple[bool, bool], List[Tuple[bytes, bytes]]] = {
+            (is_docs, debug): [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in build_security_headers(is_docs, debug).items()
+            ]
+            for is_docs in (False, True)
+            for debug in (False, True)
+        }
+        self._names = frozenset(name for name, _ in self._variants[(False, False)])
 
-        return headers
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """Add security headers to all responses"""
-        response = await call_next(request)
+        security_headers = self._variants[(scope["path"] in DOCS_PATHS, settings.debug)]
+        names = self._names
 
-        # Add all security headers based on request context
-        security_headers = self.get_security_headers(request)
-        for header_name, header_value in security_headers.items():
-            response.headers[header_name] = header_value
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *(
+                        header
+                        for header in message.get("headers", ())
+                        if header[0].lower() not in names
+                    ),
+                    *security_headers,
+                ]
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,70 @@
+"""Request tracing middleware (W3C ``traceparent`` in and out)"""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.tracing import parse_traceparent, tracer
+
+
+class TracingMiddleware:
+    """Server span per HTTP request, with ``traceparent`` in and out (pure ASGI)."""
+
+    def __init__(self, app: ASGIApp, skip_paths: frozenset = frozenset()):
+        self.app = app
+        self.skip_paths = skip_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not tracer.enabled
+            or scope["path"] in self.skip_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        remote_parent = None
+        for name, value in scope["headers"]:
+            if name == b"traceparent":
+                parsed = parse_traceparent(value.decode("latin-1"))
+                if parsed is not None:
+                    trace_id, parent_id, sampled = parsed
+                    if not sampled:
+                        # Caller decided not to sample: keep its decision
+                        await self.app(scope, receive, send)
+                        return
+                    remote_parent = (trace_id, parent_id)
+                break
+
+        method = scope["method"]
+        with tracer.span(
+            f"{method} {scope['path']}",
+            kind="server",
+            attributes={"http.method": method, "url.path": scope["path"]},
+            remote_parent=remote_parent,
+        ) as span:
+            if span is None:
+                await self.app(scope, receive, send)
+                return
+
+            traceparent = span.traceparent.encode()
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.attributes["http.status_code"] = message["status"]
+                    message["headers"] = [
+                        *message.get("headers", ()),
+                        (b"traceparent", traceparent),
+                    ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    span.name = f"{method} {route.path}"
+                    span.attributes["http.route"] = route.path
+                request_id = scope.get("state", {}).get("request_id")
+                if request_id:
+                    span.attributes["http.request_id"] = request_id
+                if span.attributes.get("http.status_code", 500) >= 500:
+                    span.error = span.error or "server error"
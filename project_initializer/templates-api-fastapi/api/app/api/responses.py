@@ -0,0 +1,113 @@
+"""Fast JSON responses: orjson for plain payloads, pre-shaped bytes for row pages.
+
+Routes that declare a ``response_model`` are already serialized by Pydantic's
+Rust encoder: FastAPI validates the return value against the model and calls
+``dump_json``. Such routes only pay extra when the handler builds the model
+itself, as ``ItemListResponse(items=rows)`` does: each row is validated
+``from_attributes`` (every ORM attribute read goes through SQLAlchemy's
+instrumentation), and then FastAPI checks the result again in a second
+threadpool hop.
+
+* ``FastJSONResponse`` is the app's ``default_response_class``. It encodes with
+  orjson, which replaces ``json.dumps`` for routes without a response model
+  (health checks, plain dicts). ``response_model`` routes keep Pydantic's encoder.
+* ``RowPage`` writes ``{"items": [...], "total": n}`` straight from rows (domain
+  entities, ORM instances or ``Row`` tuples). It reads the response model's
+  fields off each row into a dict, then dumps them with a ``TypeAdapter`` over
+  a ``TypedDict`` that has the same fields. Nothing is validated, so the bytes
+  match what the response model would produce (same keys and order, same
+  datetime format). Only use it for trusted rows from our own database, and
+  keep the route's ``response_model`` so the OpenAPI schema is unchanged.
+  ``RowPage(model, fields)`` is the partial model for a sparse fieldset
+  (``?fields=``, see ``app.api.fieldsets``): only those keys, in model order.
+"""
+
+import operator
+from functools import lru_cache
+from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple, Type
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Row
+from typing_extensions import TypedDict
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` encoded with orjson (same compact, UTF-8 output)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _tuple_getter(getter: Callable[..., Any], keys: Sequence[Any]) -> Callable:
+    # operator's getters return a bare value, not a 1-tuple, for a single key
+    if len(keys) == 1:
+        get = getter(keys[0])
+        return lambda row: (get(row),)
+    return getter(*keys)
+
+
+class RowPage:
+    """Serialize rows as ``model`` (or its ``fields`` subset) would, unvalidated."""
+
+    def __init__(self, model: Type[BaseModel], fields: Optional[Sequence[str]] = None):
+        self.fields = tuple(fields or model.model_fields)
+        self._values = _tuple_getter(operator.attrgetter, self.fields)
+        row = TypedDict(
+            f"{model.__name__}Row",
+            {name: model.model_fields[name].annotation for name in self.fields},
+        )
+        page = TypedDict(f"{model.__name__}Page", {"items": List[row], "total": int})
+        self._row_adapter = TypeAdapter(row)
+        self._adapter = TypeAdapter(page)
+
+    def _getter(self, rows: Sequence[Any]) -> Callable[[Any], Tuple[Any, ...]]:
+        if rows and isinstance(rows[0], Row):
+            # By position: a Row attribute lookup costs more than the dump
+            positions = [rows[0]._fields.index(name) for name in self.fields]
+            return _tuple_getter(operator.itemgetter, positions)
+        return self._values
+
+    def dump_json(self, rows: Sequence[Any], total: int) -> bytes:
+        """JSON bytes for ``{"items": rows, "total": total}``."""
+        fields, values = self.fields, self._getter(rows)
+        items = [dict(zip(fields, values(row))) for row in rows]
+        return self._adapter.dump_json({"items": items, "total": total})
+
+    def dump_row_json(self, row: Any) -> bytes:
+        """JSON bytes for a single row."""
+        values = self._getter([row])(row)
+        return self._row_adapter.dump_json(dict(zip(self.fields, values)))
+
+    def response(
+        self,
+        rows: Sequence[Any],
+        total: int,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        """A ready ``application/json`` page response; FastAPI sends it as-is."""
+        return _json_response(self.dump_json(rows, total), headers)
+
+    def row_response(
+        self, row: Any, headers: Optional[Mapping[str, str]] = None
+    ) -> Response:
+        """A ready ``application/json`` response for one row."""
+        return _json_response(self.dump_row_json(row), headers)
+
+
+def _json_response(body: bytes, headers: Optional[Mapping[str, str]]) -> Response:
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=dict(headers) if headers else None,
+    )
+
+
+@lru_cache(maxsize=128)
+def row_page(
+    model: Type[BaseModel], fields: Optional[Tuple[str, ...]] = None
+) -> RowPage:
+    """Shared ``RowPage`` per (model, fieldset); building a TypeAdapter is costly."""
+    return RowPage(model, fields)
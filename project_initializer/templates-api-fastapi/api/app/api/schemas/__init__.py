@@ -146,8 +146,11 @@ from app.api.schemas.chatbot import (
 from app.api.schemas.item import (
     ItemBase,
     ItemCreate,
+    ItemImportResponse,
+    ItemImportRowError,
     ItemListResponse,
     ItemResponse,
+    ItemSearchResponse,
     ItemUpdate,
 )
 from app.api.schemas.user import (
@@ -228,6 +231,9 @@ __all__ = [
     "ItemUpdate",
     "ItemResponse",
     "ItemListResponse",
+    "ItemSearchResponse",
+    "ItemImportResponse",
+    "ItemImportRowError",
     "ErrorResponse",
     "SuccessResponse",
     "ConversationHistory",
@@ -47,3 +47,31 @@ class ItemListResponse(BaseModel):
 
     items: List[ItemResponse]
     total: int = Field(..., description="Total number of items")
+
+
+class ItemSearchResponse(BaseModel):
+    """One page of ranked search results, best match first."""
+
+    items: List[ItemResponse]
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Pass as ``cursor`` to get the next page; null on the last page",
+    )
+
+
+class ItemImportRowError(BaseModel):
+    """A rejected row from a bulk import, with its validation messages."""
+
+    row: int = Field(..., description="1-based data row number in the upload")
+    errors: List[str] = Field(..., description="Why the row was rejected")
+
+
+class ItemImportResponse(BaseModel):
+    """Summary of a bulk CSV/NDJSON item import."""
+
+    accepted: int = Field(..., description="Rows validated and loaded")
+    rejected: int = Field(..., description="Rows that failed validation")
+    errors: List[ItemImportRowError] = Field(
+        default_factory=list,
+        description="Per-row errors (capped; ``rejected`` holds the full count)",
+    )
@@ -22,10 +22,9 @@ Each domain module should follow this pattern:
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.infrastructure.database import get_db
 from app.api.schemas.user import UserCreate, UserResponse, UserUpdate
 from app.application.services.user_service import UserService
-from app.api.deps import get_current_user
+from app.api.deps import get_admitted_db, get_current_user
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -34,7 +33,7 @@ router = APIRouter(prefix="/users", tags=["Users"])
 def list_users(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_admitted_db),
 ):
     \"\"\"
     List all users with pagination.
@@ -49,7 +48,7 @@ def list_users(
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 def create_user(
     user_in: UserCreate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_admitted_db),
 ):
     \"\"\"Create a new user.\"\"\"
     service = UserService(db)
@@ -59,7 +58,7 @@ def create_user(
 @router.get("/{user_id}", response_model=UserResponse)
 def get_user(
     user_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_admitted_db),
 ):
     \"\"\"Get a specific user by ID.\"\"\"
     service = UserService(db)
@@ -76,7 +75,7 @@ def get_user(
 def update_user(
     user_id: str,
     user_in: UserUpdate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_admitted_db),
     current_user: dict = Depends(get_current_user),
 ):
     \"\"\"Update an existing user.\"\"\"
@@ -93,7 +92,7 @@ def update_user(
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_user(
     user_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_admitted_db),
     current_user: dict = Depends(get_current_user),
 ):
     \"\"\"Delete a user.\"\"\"
@@ -6,16 +6,21 @@ API endpoints for chatbot interactions.
 Supports both standard and streaming responses.
 """
 
-from typing import Annotated
+from typing import Annotated, Iterator
+from baml_py import Collector
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
 
+from baml_client.async_client import b as baml_async_client
+
 from app.api.schemas import (
     ChatRequest,
     ChatResponse,
     StreamChunk,
 )
 from app.application.services.chatbot_service import ChatbotService
+from app.infrastructure.metrics import record_baml_usage
+from app.infrastructure.tracing import record_baml_spans
 
 
 router = APIRouter(prefix="/chat", tags=["Chatbot"])
@@ -26,18 +31,24 @@ router = APIRouter(prefix="/chat", tags=["Chatbot"])
 # ===========================
 
 
-def get_chatbot_service() -> ChatbotService:
+def get_chatbot_service() -> Iterator[ChatbotService]:
     """
     Dependency that provides a ChatbotService instance.
 
-    Returns:
-        ChatbotService instance
+    Yields:
+        ChatbotService whose BAML client reports to a per-request Collector
 
     Note:
-        Currently creates a new instance per request.
-        Can be modified to use caching or singleton pattern if needed.
+        Creates a new instance per request. After the response (including a
+        whole SSE stream) the collected calls are recorded as BAML latency
+        and token metrics, and as ``baml.<Function>`` spans when tracing.
     """
-    return ChatbotService()
+    collector = Collector(name="chat")
+    try:
+        yield ChatbotService(client=baml_async_client.with_options(collector=collector))
+    finally:
+        record_baml_usage(collector)
+        record_baml_spans(collector)
 
 
 # ===========================
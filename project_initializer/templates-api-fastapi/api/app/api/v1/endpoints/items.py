@@ -4,19 +4,50 @@ Sync handlers: the service, repository, and ``get_db`` session are all
 synchronous, so FastAPI runs these ``def`` handlers in its threadpool. The
 service owns the transaction; the router only translates domain results into
 HTTP — ``None``/``False`` from the service become ``404``.
+
+Read-only routes (list/get) take their service from ``get_item_read_service``,
+whose session is routed to a read replica when ``DATABASE_REPLICA_URLS`` is set;
+every write, and every cache fill, stays on the primary.
+
+Both services read through the process-wide ``cache`` (``CACHE_BACKEND``), and
+their writes invalidate it; see ``ItemService``.
 """
 
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Path, status
-from sqlalchemy.orm import Session
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
 
-from app.api.deps import CurrentUser, Pagination
-from app.api.schemas.item import ItemCreate, ItemListResponse, ItemResponse, ItemUpdate
+from app.api.conditional import conditional, page_etag, row_etag
+from app.api.cursors import decode_cursor, encode_cursor
+from app.api.deps import CurrentUser, DBSession, Pagination, ReadOnlyDBSession
+from app.api.fieldsets import FieldSet, field_selector
+from app.api.item_import import ItemImportReader, detect_import_format
+from app.api.responses import row_page
+from app.api.schemas.item import (
+    ItemCreate,
+    ItemImportResponse,
+    ItemListResponse,
+    ItemResponse,
+    ItemSearchResponse,
+    ItemUpdate,
+)
 from app.application.services.item_service import ItemService
 from app.infrastructure.audit import write_audit_log
-from app.infrastructure.database import get_db
+from app.infrastructure.cache import cache
 from app.infrastructure.repositories.item import ItemRepository
+from app.infrastructure.settings import settings
 
 # UUID string ids — Path(min_length=1) rejects an empty segment (a numeric
 # constraint like ge= would not apply to a str).
@@ -26,17 +57,39 @@ ItemId = Annotated[str, Path(min_length=1)]
 # ``{**...}`` at each call site so every decorator gets its own dict instance.
 ITEM_NOT_FOUND_RESPONSE = {404: {"description": "Item not found"}}
 
+# Conditional GETs (see app.api.conditional): 304 when the validators still match
+NOT_MODIFIED_RESPONSE = {304: {"description": "Not modified (ETag still matches)"}}
+
+# ?fields=id,name selects and serializes only those columns (app.api.fieldsets)
+ItemFields = Annotated[FieldSet, Depends(field_selector(ItemResponse))]
+
 router = APIRouter(prefix="/items", tags=["Items"])
 
 
-def get_item_service(db: Session = Depends(get_db)) -> ItemService:
+def get_item_service(db: DBSession) -> ItemService:
     """Provide an ItemService for the request.
 
     Composition root for the items use case: constructs the concrete
     ``ItemRepository`` adapter and injects it into the framework-free
     ``ItemService`` (which only knows the ``ItemRepositoryPort``).
     """
-    return ItemService(ItemRepository(db))
+    return ItemService(ItemRepository(db), cache=cache, ttl=settings.cache_ttl_default)
+
+
+def get_item_read_service(db: ReadOnlyDBSession, primary: DBSession) -> ItemService:
+    """Provide an ItemService for read-only routes (replica-routed session).
+
+    Never use it for a write: the session may be bound to a read replica, which
+    rejects writes and lags the primary by up to ``database_replica_max_lag``.
+    Cache misses are loaded from the primary so a lagging replica never fills
+    the cache (see ``ItemService``); the primary session only connects then.
+    """
+    return ItemService(
+        ItemRepository(db),
+        cache=cache,
+        ttl=settings.cache_ttl_default,
+        primary=ItemRepository(primary),
+    )
 
 
 @router.get(
@@ -44,14 +97,64 @@ def get_item_service(db: Session = Depends(get_db)) -> ItemService:
     response_model=ItemListResponse,
     summary="List items",
     response_description="A page of items plus the full row count.",
+    responses={**NOT_MODIFIED_RESPONSE},
 )
 def list_items(
+    request: Request,
+    response: Response,
     pagination: Pagination,
-    service: ItemService = Depends(get_item_service),
-) -> ItemListResponse:
-    """List items for the requested page; total is the full row count."""
-    items = service.list(skip=pagination.skip, limit=pagination.limit)
-    return ItemListResponse(items=items, total=service.count())
+    fields: ItemFields,
+    service: ItemService = Depends(get_item_read_service),
+) -> Response:
+    """List items for the requested page; total is the full row count.
+
+    Answers 304 (nothing serialized) when ``If-None-Match`` matches the page.
+    Otherwise the rows are written straight to JSON by ``row_page``, shaped
+    like ``ItemListResponse`` (only ``fields``, if given) without validating
+    each row.
+    """
+    items = service.list(skip=pagination.skip, limit=pagination.limit, fields=fields)
+    total = service.count()
+    etag = page_etag(items, pagination.skip, pagination.limit, total, fields)
+    not_modified = conditional(request, response, "list_items", etag)
+    if not_modified is not None:
+        return not_modified
+    page = row_page(ItemResponse, fields)
+    return page.response(items, total, headers=response.headers)
+
+
+@router.get(
+    "/search",
+    response_model=ItemSearchResponse,
+    summary="Search items",
+    response_description="Matching items, best match first, plus the next cursor.",
+)
+def search_items(
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Text to find in name/description",
+    ),
+    limit: int = Query(default=20, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(
+        default=None, description="``next_cursor`` from the previous page"
+    ),
+    service: ItemService = Depends(get_item_read_service),
+) -> ItemSearchResponse:
+    """Case-insensitive substring search over name and description.
+
+    Served by the trigram GIN indexes on PostgreSQL and ranked by
+    ``word_similarity``, name weighted double; see ``search_statement``. Pages
+    are keyset-paginated on ``(rank, id)``, so a deep page costs the same as the
+    first and rows do not shift between pages under concurrent inserts.
+    """
+    after = decode_cursor(cursor, (int, float), str)
+    items, next_after = service.search(q, limit=limit, after=after)
+    return ItemSearchResponse(
+        items=[ItemResponse.model_validate(item) for item in items],
+        next_cursor=None if next_after is None else encode_cursor(*next_after),
+    )
 
 
 @router.post(
@@ -77,21 +180,74 @@ def create_item(
     return item
 
 
+@router.post(
+    "/import",
+    response_model=ItemImportResponse,
+    summary="Bulk-import items",
+    response_description="How many rows were accepted and why the rest were rejected.",
+    responses={415: {"description": "Upload is neither CSV nor NDJSON"}},
+)
+def import_items(
+    current_user: CurrentUser,
+    file: UploadFile = File(..., description="CSV with a header row, or NDJSON"),
+    service: ItemService = Depends(get_item_service),
+) -> ItemImportResponse:
+    """Bulk-load items from a CSV or NDJSON upload (write — requires auth).
+
+    Each row is validated with the ``ItemCreate`` rules; valid rows are streamed
+    to the database in batches (``COPY`` on PostgreSQL) and committed together,
+    invalid rows are skipped and reported. Sync ``def`` on purpose: reading the
+    spooled upload and the COPY are blocking, so they run in the threadpool.
+    """
+    fmt = detect_import_format(file.filename, file.content_type)
+    if fmt is None:
+        raise HTTPException(
+            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Upload a .csv or .ndjson file",
+        )
+    reader = ItemImportReader(file.file, fmt)
+    accepted = service.bulk_import(reader.batches())
+    return ItemImportResponse(
+        accepted=accepted, rejected=reader.rejected, errors=reader.errors
+    )
+
+
 @router.get(
     "/{item_id}",
     response_model=ItemResponse,
     summary="Get an item",
     response_description="The requested item.",
-    responses={**ITEM_NOT_FOUND_RESPONSE},
+    responses={**ITEM_NOT_FOUND_RESPONSE, **NOT_MODIFIED_RESPONSE},
 )
 def get_item(
-    item_id: ItemId, service: ItemService = Depends(get_item_service)
+    item_id: ItemId,
+    request: Request,
+    response: Response,
+    fields: ItemFields,
+    service: ItemService = Depends(get_item_read_service),
 ) -> ItemResponse:
-    """Get a single item by id, or 404 if it does not exist."""
-    item = service.get(item_id)
+    """Get a single item by id, or 404 if it does not exist.
+
+    Sends ``ETag`` and ``Last-Modified``; a matching ``If-None-Match`` or an
+    ``If-Modified-Since`` no older than ``updated_at`` gets a bodiless 304.
+    With ``fields`` only those columns are read and returned, and
+    ``Last-Modified`` is sent only if ``updated_at`` is one of them.
+    """
+    item = service.get(item_id, fields=fields)
     if item is None:
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Item not found")
-    return item
+    not_modified = conditional(
+        request,
+        response,
+        "get_item",
+        row_etag(item, fields),
+        item.updated_at if fields is None or "updated_at" in fields else None,
+    )
+    if not_modified is not None:
+        return not_modified
+    if fields is None:
+        return item
+    return row_page(ItemResponse, fields).row_response(item, headers=response.headers)
 
 
 @router.put(
@@ -20,6 +20,10 @@ from app.application.dto.chatbot import (
 class ChatbotService:
     """Service for chatbot operations using BAML."""
 
+    def __init__(self, client=baml_async_client):
+        # The API layer passes a client bound to a BAML Collector for metrics
+        self.client = client
+
     async def chat(self, request: ChatRequest) -> ChatResponse:
         """
         Process a chat request and return a response.
@@ -36,7 +40,7 @@ class ChatbotService:
                 messages=request.conversation_history.messages
             )
 
-        result = await baml_async_client.Chat(
+        result = await self.client.Chat(
             user_question=request.user_question,
             conversation_history=baml_history,
         )
@@ -61,7 +65,7 @@ class ChatbotService:
                 messages=request.conversation_history.messages
             )
 
-        stream = baml_async_client.stream.StreamChat(
+        stream = self.client.stream.StreamChat(
             user_question=request.user_question,
             conversation_history=baml_history,
         )
@@ -8,35 +8,159 @@ The service owns the transaction boundary (``commit``); the repository only
 flushes. Reads (``list``/``get``) do not commit. Missing-id ``get``/``update``/
 ``delete`` return ``None``/``False`` so the router maps them to HTTP 404 —
 HTTP concerns stay out of this layer.
+
+With a ``CachePort`` injected, ``list``/``count``/``get`` are read through the
+cache as ``Item`` entities. Cache keys embed a generation token stored under
+``items:generation``. Every committed write replaces the token, so all cached
+item reads are invalidated at once, and a read that raced the write is stored
+under the old token where nobody looks it up. Writes are rare next to reads,
+so this is simpler and safer than deleting individual keys.
+
+That holds only if a miss loads what the primary has committed. A read
+replica can lag the write that replaced the token, and a page loaded from it
+would be cached under the new token for the whole TTL. So a service whose
+``repository`` may read from a replica gets a ``primary`` repository too, and
+cache misses load through it. Uncached reads (no cache, a sparse fieldset, a
+search) still use ``repository``.
+
+Pages are read with ``get_multi_rows``: plain row tuples rather than ORM
+instances, because a page is only ever serialized.
 """
 
-from typing import Any, Optional, Sequence
+import uuid
+from dataclasses import fields
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from app.domain.entities.item import Item
+from app.domain.ports.cache import CachePort
 from app.domain.ports.item_repository import ItemRepositoryPort
 
+GENERATION_KEY = "items:generation"
+
+
+# Entity fields that a JSON cache hands back as ISO strings
+_DATETIME_FIELDS = tuple(f.name for f in fields(Item) if f.type is datetime)
+
+
+def to_entity(row: Any) -> Item:
+    """Copy a repository row or a cached value onto the domain ``Item``.
+
+    An in-process cache hands the ``Item`` back as is. A JSON cache (``redis``)
+    hands back a dict with ISO datetimes, which is rebuilt here.
+    """
+    if isinstance(row, Item):
+        return row
+    if isinstance(row, dict):
+        values = dict(row)
+        for name in _DATETIME_FIELDS:
+            if isinstance(values[name], str):
+                values[name] = datetime.fromisoformat(values[name])
+        return Item(**values)
+    return Item(**{f.name: getattr(row, f.name) for f in fields(Item)})
+
 
 class ItemService:
     """Business logic for items, delegating data access to an ItemRepositoryPort."""
 
-    def __init__(self, repository: ItemRepositoryPort):
+    def __init__(
+        self,
+        repository: ItemRepositoryPort,
+        cache: Optional[CachePort] = None,
+        ttl: float = 300,
+        primary: Optional[ItemRepositoryPort] = None,
+    ):
         self.repository = repository
+        # Cache misses load from here (see the module docstring)
+        self.primary = primary or repository
+        self.cache = cache
+        self.ttl = ttl
+        self._generation: Optional[str] = None
+
+    def _key(self, suffix: str) -> str:
+        if self._generation is None:
+            generation = self.cache.get(GENERATION_KEY)
+            if generation is None:
+                generation = uuid.uuid4().hex
+                self.cache.set(GENERATION_KEY, generation, None)
+            self._generation = generation
+        return f"items:{self._generation}:{suffix}"
 
-    def list(self, skip: int = 0, limit: int = 100) -> Sequence[Any]:
-        """Return a paginated list of items."""
-        return self.repository.get_multi(skip=skip, limit=limit)
+    def _invalidate(self) -> None:
+        if self.cache is not None:
+            self._generation = uuid.uuid4().hex
+            self.cache.set(GENERATION_KEY, self._generation, None)
+
+    def _load_page(self, skip: int, limit: int) -> List[Item]:
+        rows = self.primary.get_multi_rows(skip=skip, limit=limit)
+        return [to_entity(row) for row in rows]
+
+    def _load_item(self, item_id: str) -> Optional[Item]:
+        row = self.primary.get(item_id)
+        return None if row is None else to_entity(row)
+
+    def list(
+        self, skip: int = 0, limit: int = 100, fields: Optional[Sequence[str]] = None
+    ) -> Sequence[Any]:
+        """Return a paginated list of items (read-only rows or cached entities).
+
+        ``fields`` narrows the repository select to those columns and skips
+        the cache, which holds whole entities: a miss would load every column,
+        and the point of a fieldset is to read and send fewer.
+        """
+        if self.cache is None or fields is not None:
+            return self.repository.get_multi_rows(
+                skip=skip, limit=limit, columns=fields
+            )
+        page = self.cache.get_or_load(
+            self._key(f"list:{skip}:{limit}"),
+            lambda: self._load_page(skip, limit),
+            self.ttl,
+        )
+        return [to_entity(item) for item in page]
 
     def count(self) -> int:
         """Return the total number of items (full row count, not page size)."""
-        return self.repository.count()
+        if self.cache is None:
+            return self.repository.count()
+        return self.cache.get_or_load(self._key("count"), self.primary.count, self.ttl)
+
+    def get(
+        self, item_id: str, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Any]:
+        """Return a single item by id, or None if it does not exist.
 
-    def get(self, item_id: str) -> Optional[Any]:
-        """Return a single item by id, or None if it does not exist."""
-        return self.repository.get(item_id)
+        ``fields`` works as in ``list``.
+        """
+        if fields is not None:
+            return self.repository.get_row(item_id, columns=fields)
+        if self.cache is None:
+            return self.repository.get(item_id)
+        item = self.cache.get_or_load(
+            self._key(f"get:{item_id}"), lambda: self._load_item(item_id), self.ttl
+        )
+        return None if item is None else to_entity(item)
+
+    def search(
+        self, q: str, limit: int = 20, after: Optional[Tuple[float, str]] = None
+    ) -> Tuple[Sequence[Any], Optional[Tuple[float, str]]]:
+        """Return one page of ranked matches for ``q`` and the next page's key.
+
+        Not cached: queries are too varied to share entries. One extra row is
+        read to tell whether another page exists; the key is ``(rank, id)`` of
+        the page's last row, or ``None`` on the last page.
+        """
+        rows = self.repository.search(q, limit=limit + 1, after=after)
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, (rows[-1].rank, rows[-1].id)
 
     def create(self, item_in: Any) -> Any:
         """Create an item and commit the transaction."""
         item = self.repository.create(item_in)
         self.repository.commit()
+        self._invalidate()
         return item
 
     def update(self, item_id: str, item_in: Any) -> Optional[Any]:
@@ -45,6 +169,7 @@ class ItemService:
         if item is None:
             return None
         self.repository.commit()
+        self._invalidate()
         return item
 
     def delete(self, item_id: str) -> bool:
@@ -52,4 +177,16 @@ class ItemService:
         deleted = self.repository.delete(item_id)
         if deleted:
             self.repository.commit()
+            self._invalidate()
         return deleted
+
+    def bulk_import(self, batches: Iterable[Sequence[Dict[str, Any]]]) -> int:
+        """Load batches of validated item rows in one transaction.
+
+        Returns the number of rows inserted. The batches are consumed lazily, so
+        the caller can validate the next batch while the previous one loads.
+        """
+        inserted = self.repository.bulk_import(batches)
+        self.repository.commit()
+        self._invalidate()
+        return inserted
@@ -125,17 +125,24 @@ class DatabaseError(BaseAPIException):
 
 
 class DatabaseTimeoutError(DatabaseError):
-    """Raised when database operations timeout."""
+    """Raised when database operations timeout or the pool is saturated.
+
+    Transient by nature, so it maps to 503 with a ``Retry-After`` hint.
+    """
 
     def __init__(
         self,
         message: str = "Database operation timed out",
         timeout_duration: Optional[float] = None,
+        retry_after: Optional[int] = None,
     ):
         super().__init__(message)
+        self.status_code = HTTPStatus.SERVICE_UNAVAILABLE
         self.error_code = "DATABASE_TIMEOUT_ERROR"
         if timeout_duration:
-            self.details = {"timeout_duration": timeout_duration}
+            self.details["timeout_duration"] = timeout_duration
+        if retry_after:
+            self.details["retry_after"] = retry_after
 
 
 class DatabaseConnectionError(DatabaseError):
@@ -1,5 +1,6 @@
 """Domain ports — abstract interfaces implemented by infrastructure adapters."""
 
+from app.domain.ports.cache import AsyncCachePort, CachePort
 from app.domain.ports.item_repository import ItemRepositoryPort
 
-__all__ = ["ItemRepositoryPort"]
+__all__ = ["AsyncCachePort", "CachePort", "ItemRepositoryPort"]
@@ -0,0 +1,59 @@
+"""Cache ports — the caching interface application services depend on.
+
+Services are typed against these ``Protocol``s, never against a concrete cache,
+so the business logic has no infrastructure import. ``app.infrastructure.cache``
+provides the adapters (in-process TTL+LRU, or Redis) and the API dependency
+layer injects one. ``CachePort`` serves the sync services (threadpool);
+``AsyncCachePort`` serves the ``--async-db`` services (event loop).
+
+``None`` means "not cached": a loader result of ``None`` is returned but never
+stored, so a missing row is looked up again next time.
+
+Store only JSON-serializable values (dataclasses and datetimes included). A
+shared backend keeps them as JSON and a hit returns plain data, so the service
+rebuilds its own types from what comes back.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Optional, Protocol, TypeVar
+
+T = TypeVar("T")
+
+
+class CachePort(Protocol):
+    """Key/value cache with expiry and single-flight loading."""
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on a miss."""
+        ...
+
+    def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        """Store ``value`` for ``ttl`` seconds (None: until evicted)."""
+        ...
+
+    def get_or_load(self, key: str, loader: Callable[[], T], ttl: float) -> T:
+        """Return the cached value, or call ``loader`` once and cache the result.
+
+        Concurrent misses on the same key wait for the first loader instead of
+        all hitting the database.
+        """
+        ...
+
+
+class AsyncCachePort(Protocol):
+    """``CachePort`` for coroutines; the loader is awaited."""
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on a miss."""
+        ...
+
+    async def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        """Store ``value`` for ``ttl`` seconds (None: until evicted)."""
+        ...
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[T]], ttl: float
+    ) -> T:
+        """Return the cached value, or await ``loader`` once and cache it."""
+        ...
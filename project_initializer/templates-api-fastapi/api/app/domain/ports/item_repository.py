@@ -13,7 +13,16 @@ cares about the operations, not the DTO types.
 
 from __future__ import annotations
 
-from typing import Any, Optional, Protocol, Sequence, runtime_checkable
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    runtime_checkable,
+)
 
 
 @runtime_checkable
@@ -35,6 +44,37 @@ class ItemRepositoryPort(Protocol):
         """Return a page of items."""
         ...
 
+    def get_multi_rows(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        desc: bool = True,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Sequence[Any]:
+        """Return a page of items as read-only rows (attribute access, no ORM state).
+
+        ``columns`` limits the select to those fields (a sparse fieldset).
+        """
+        ...
+
+    def get_row(
+        self, id: Any, columns: Optional[Sequence[str]] = None
+    ) -> Optional[Any]:
+        """Return one item as a read-only row of ``columns``, or None if absent."""
+        ...
+
+    def search(
+        self, q: str, limit: int = 20, after: Optional[Tuple[float, str]] = None
+    ) -> Sequence[Any]:
+        """Return items matching ``q`` as rows with a ``rank``, best first.
+
+        Keyset-paginated: ``after`` is the ``(rank, id)`` of the previous
+        page's last row.
+        """
+        ...
+
     def create(self, obj_in: Any) -> Any:
         """Persist a new item (flush only; caller owns the commit)."""
         ...
@@ -51,6 +91,10 @@ class ItemRepositoryPort(Protocol):
         """Return the total item count."""
         ...
 
+    def bulk_import(self, batches: Iterable[Sequence[Dict[str, Any]]]) -> int:
+        """Bulk-load batches of validated item rows, returning the inserted count."""
+        ...
+
     def commit(self) -> None:
         """Commit the current unit of work.
 
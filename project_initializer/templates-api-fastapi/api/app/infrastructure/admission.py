@@ -0,0 +1,111 @@
+"""Admission control for DB-using requests (backpressure on pool saturation).
+
+Sync handlers run in the AnyIO threadpool (``threadpool_max_workers`` threads)
+but the engine only has ``pool_size + max_overflow`` connections. Without a gate
+the surplus threads park inside ``QueuePool`` for ``database_pool_timeout``
+seconds and then fail anyway, starving every other sync route of threads.
+
+``DBAdmissionController`` caps in-flight DB-using requests at the pool capacity.
+The slot is taken on the event loop *before* a worker thread is used, and a
+request that cannot get one within ``db_admission_timeout`` is shed at once with
+``DatabaseTimeoutError`` (503 + ``Retry-After``). A shed is counted in
+``db_admission_rejected_total`` and logged once, at WARNING, by the
+``DatabaseTimeoutError`` handler.
+
+There is one limiter, sized to the *primary* pool. Reads routed to a replica and
+sessions on the ``--async-db`` engine take a slot from it too, even though those
+engines have pools of their own. The cap is therefore conservative: together,
+all engines never have more than one pool's worth of DB-using requests in flight.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import anyio
+from prometheus_client import Counter
+
+from app.domain.exceptions import DatabaseTimeoutError
+from app.infrastructure.settings import settings
+from app.infrastructure.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+DB_ADMISSION_REJECTED_TOTAL = Counter(
+    "db_admission_rejected_total",
+    "Requests shed because every DB slot was busy",
+)
+
+
+class DBAdmissionController:
+    """Bound concurrent DB-using requests to the connection pool's capacity."""
+
+    def __init__(self, capacity: int, timeout: float, retry_after: int):
+        self.capacity = max(capacity, 1)
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self._limiter: Optional[anyio.CapacityLimiter] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_limiter(self) -> anyio.CapacityLimiter:
+        # A limiter belongs to one event loop; recreate it if the loop changed
+        # (a new TestClient, or an app restarted in the same process).
+        loop = asyncio.get_running_loop()
+        if self._limiter is None or self._loop is not loop:
+            self._limiter = anyio.CapacityLimiter(self.capacity)
+            self._loop = loop
+        return self._limiter
+
+    @property
+    def in_flight(self) -> int:
+        return int(self._limiter.borrowed_tokens) if self._limiter else 0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one DB slot for the block, or raise ``DatabaseTimeoutError``."""
+        limiter = self._get_limiter()
+        # Borrow on behalf of a unique token: dependency teardown may run in a
+        # different task than setup, which a task-owned borrow would reject.
+        borrower = object()
+        wait_start = time.time_ns()
+        try:
+            with anyio.fail_after(self.timeout):
+                await limiter.acquire_on_behalf_of(borrower)
+        except TimeoutError:
+            tracer.record("db.admission", wait_start, time.time_ns(), error="shed")
+            DB_ADMISSION_REJECTED_TOTAL.inc()
+            raise DatabaseTimeoutError(
+                message="Database is at capacity, retry shortly",
+                timeout_duration=self.timeout,
+                retry_after=self.retry_after,
+            ) from None
+        tracer.record("db.admission", wait_start, time.time_ns())
+        try:
+            yield
+        finally:
+            limiter.release_on_behalf_of(borrower)
+
+
+db_admission = DBAdmissionController(
+    capacity=settings.database_pool_size + settings.database_max_overflow,
+    timeout=settings.db_admission_timeout,
+    retry_after=settings.db_admission_retry_after,
+)
+
+
+async def admit_db_request() -> AsyncIterator[None]:
+    """FastAPI dependency: hold a DB slot for the lifetime of the request."""
+    if not settings.db_admission_enabled:
+        yield
+        return
+    async with db_admission.slot():
+        yield
+
+
+def configure_threadpool() -> None:
+    """Size the AnyIO default thread limiter (sync handlers) from settings."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = settings.threadpool_max_workers
+    logger.info(f"Threadpool limiter set to {settings.threadpool_max_workers} threads")
@@ -0,0 +1,302 @@
+"""Application cache: in-process TTL+LRU or Redis, behind the domain cache ports.
+
+``settings.cache_backend`` selects the store:
+
+* ``memory``: an ``OrderedDict`` per process, bounded by
+  ``cache_max_entries`` (least recently used entries go first), each entry
+  expiring after its TTL. A hit is a dict lookup under a lock, with no
+  serialization, and values are shared by reference, so treat them as
+  read-only. Each worker has its own copy: a write in one worker does not
+  reach the others until their entries expire, and until then their ETags
+  (computed from the cached data) still answer 304. Use ``redis`` when
+  running several workers, or accept ``cache_ttl_default`` of staleness.
+* ``redis``: one shared cache at ``REDIS_URL``. Values are stored as JSON
+  (orjson) and keys are prefixed with ``cache:``. A hit comes back as plain JSON
+  data: a dataclass as a dict and a datetime as an ISO string, so callers
+  rebuild their own types (``to_entity`` for items). Values are never pickled:
+  this Redis is shared with the rate limiter, and unpickling what is read from
+  it would let anyone who can write a key run code in the API. Redis errors and
+  undecodable values are logged and treated as misses, so an outage degrades to
+  uncached reads rather than failed requests.
+* ``none`` (default): no caching; services get ``cache=None``. Caching is
+  opt-in because only ``redis`` is safe for several workers.
+
+``Cache`` (sync services, threadpool) and ``AsyncCache`` (``--async-db``
+services, event loop) add stampede protection on top. Concurrent misses on one
+key in a process share a single load: the first caller runs the loader and
+the others wait for its result. TTLs get up to 10% random jitter, so entries
+filled together do not all expire together.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+import orjson
+from prometheus_client import Counter
+
+from app.infrastructure.settings import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_REQUESTS_TOTAL = Counter(
+    "cache_requests_total",
+    "Application cache lookups through get_or_load",
+    ["result"],
+)
+_HITS = CACHE_REQUESTS_TOTAL.labels(result="hit")
+_MISSES = CACHE_REQUESTS_TOTAL.labels(result="miss")
+
+_TTL_JITTER = 0.1
+
+
+def _jittered(ttl: Optional[float]) -> Optional[float]:
+    if ttl is None:
+        return None
+    return ttl * (1 - random.uniform(0, _TTL_JITTER))
+
+
+class MemoryBackend:
+    """Size-bounded TTL+LRU store; thread-safe, non-blocking."""
+
+    def __init__(self, max_entries: int, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        expires_at = float("inf") if ttl is None else self._clock() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # Never blocks, so the async side calls straight through
+    async def aget(self, key: str) -> Optional[Any]:
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        self.set(key, value, ttl)
+
+
+class RedisBackend:
+    """JSON values in Redis; a sync client for ``Cache``, async for ``AsyncCache``."""
+
+    _PREFIX = "cache:"
+
+    def __init__(self, url: str):
+        self.url = url
+        self._client = None
+        self._async_client = None
+
+    def _sync(self):
+        if self._client is None:
+            # Imported here: redis is only needed when this backend is selected.
+            import redis
+
+            self._client = redis.Redis.from_url(self.url)
+        return self._client
+
+    def _async(self):
+        if self._async_client is None:
+            import redis.asyncio
+
+            self._async_client = redis.asyncio.Redis.from_url(self.url)
+        return self._async_client
+
+    @staticmethod
+    def _ttl_ms(ttl: Optional[float]) -> Optional[int]:
+        return None if ttl is None else max(1, int(ttl * 1000))
+
+    @staticmethod
+    def _decode(raw: Optional[bytes]) -> Optional[Any]:
+        if raw is None:
+            return None
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Cache value is not JSON, treating as a miss: {e}")
+            return None
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self._sync().get(self._PREFIX + key)
+        except Exception as e:
+            logger.warning(f"Cache get failed, treating as a miss: {e}")
+            return None
+        return self._decode(raw)
+
+    def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        try:
+            self._sync().set(
+                self._PREFIX + key, orjson.dumps(value), px=self._ttl_ms(ttl)
+            )
+        except Exception as e:
+            logger.warning(f"Cache set failed: {e}")
+
+    async def aget(self, key: str) -> Optional[Any]:
+        try:
+            raw = await self._async().get(self._PREFIX + key)
+        except Exception as e:
+            logger.warning(f"Cache get failed, treating as a miss: {e}")
+            return None
+        return self._decode(raw)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        try:
+            await self._async().set(
+                self._PREFIX + key, orjson.dumps(value), px=self._ttl_ms(ttl)
+            )
+        except Exception as e:
+            logger.warning(f"Cache set failed: {e}")
+
+
+class Cache:
+    """``CachePort`` adapter: single-flight loads over a backend (threads)."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self._guard = threading.Lock()
+        # key -> [lock held by the loading thread, number of interested threads]
+        self._flights: Dict[str, List[Any]] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.backend.get(key)
+
+    def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        self.backend.set(key, value, _jittered(ttl))
+
+    @contextmanager
+    def _single_flight(self, key: str) -> Iterator[None]:
+        with self._guard:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = [threading.Lock(), 0]
+            flight[1] += 1
+        try:
+            with flight[0]:
+                yield
+        finally:
+            with self._guard:
+                flight[1] -= 1
+                if flight[1] == 0:
+                    del self._flights[key]
+
+    def get_or_load(self, key: str, loader: Callable[[], Any], ttl: float) -> Any:
+        value = self.backend.get(key)
+        if value is not None:
+            _HITS.inc()
+            return value
+        with self._single_flight(key):
+            # Whoever held the flight before us may have filled it
+            value = self.backend.get(key)
+            if value is not None:
+                _HITS.inc()
+                return value
+            _MISSES.inc()
+            value = loader()
+            if value is not None:
+                self.set(key, value, ttl)
+            return value
+
+
+class AsyncCache:
+    """``AsyncCachePort`` adapter: single-flight loads over a backend (event loop)."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self._flights: Dict[str, "asyncio.Future[Any]"] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await self.backend.aget(key)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        await self.backend.aset(key, value, _jittered(ttl))
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[Any]], ttl: float
+    ) -> Any:
+        value = await self.backend.aget(key)
+        if value is not None:
+            _HITS.inc()
+            return value
+        flight = self._flights.get(key)
+        if flight is not None:
+            # Someone is already loading it: share their result (or error)
+            try:
+                value = await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise  # we were cancelled, not the loader
+                # The loading request was cancelled: load it ourselves
+                return await self.get_or_load(key, loader, ttl)
+            _HITS.inc()
+            return value
+
+        _MISSES.inc()
+        flight = self._flights[key] = asyncio.get_running_loop().create_future()
+        try:
+            value = await loader()
+            if value is not None:
+                await self.set(key, value, ttl)
+        except Exception as e:
+            flight.set_exception(e)
+            # Retrieved here so a flight nobody waited on does not log a warning
+            flight.exception()
+            raise
+        except BaseException:
+            flight.cancel()
+            raise
+        else:
+            flight.set_result(value)
+            return value
+        finally:
+            del self._flights[key]
+
+
+def _create_backend():
+    backend = settings.cache_backend
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return MemoryBackend(settings.cache_max_entries)
+    if backend == "redis":
+        return RedisBackend(settings.redis_url)
+    raise ValueError(
+        f"Unknown cache_backend {backend!r}, expected 'memory', 'redis' or 'none'"
+    )
+
+
+_backend = _create_backend()
+
+# Shared by every request of this process; None when caching is off
+cache: Optional[Cache] = Cache(_backend) if _backend is not None else None
+async_cache: Optional[AsyncCache] = (
+    AsyncCache(_backend) if _backend is not None else None
+)
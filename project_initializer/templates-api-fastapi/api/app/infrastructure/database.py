@@ -2,7 +2,7 @@
 Synchronous database management for FastAPI with local PostgreSQL.
 
 This module provides:
-- Synchronous SQLAlchemy engine with psycopg2 driver
+- Synchronous SQLAlchemy engine with psycopg2 (default) or psycopg 3
 - Connection pooling for local PostgreSQL
 - Health check functionality with timeout protection
 - Session management utilities
@@ -14,19 +14,62 @@ import logging
 import time
 import threading
 from contextlib import contextmanager
-from typing import Optional, Generator, Dict, Any
+from typing import Optional, Generator, Dict, Any, List
 
 from sqlalchemy import create_engine, Engine, text
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.exc import SQLAlchemyError, OperationalError, DisconnectionError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
+from app.domain.exceptions import DatabaseTimeoutError
 from app.infrastructure.settings import settings
 from app.infrastructure.orm.base import Base
+from app.infrastructure.migrations import schema_at_head
+from app.infrastructure.pool_telemetry import (
+    InstrumentedQueuePool,
+    get_pool_telemetry,
+    install_pool_telemetry,
+)
+from app.infrastructure.query_stats import install_query_instrumentation
+from app.infrastructure.tracing import tracer
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Supabase's transaction-mode pooler (Supavisor) listens here; PgBouncer setups
+# flag themselves with ?pgbouncer=true instead.
+TRANSACTION_POOLER_PORT = 6543
+
+SYNC_DRIVERS = ("psycopg2", "psycopg")
+
+
+def resolve_database_url(url: str, driver: str = "psycopg2") -> URL:
+    """Point a PostgreSQL URL at the configured sync DBAPI driver.
+
+    ``postgresql://`` and ``postgresql+psycopg2://`` inputs alike become
+    ``postgresql+<driver>://``; other backends (SQLite in tests) pass through.
+    The ``pgbouncer`` marker is dropped, since libpq rejects unknown parameters.
+    """
+    if driver not in SYNC_DRIVERS:
+        raise ValueError(
+            f"Unsupported database driver {driver!r}, expected one of {SYNC_DRIVERS}"
+        )
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "postgresql":
+        return parsed
+    return parsed.set(drivername=f"postgresql+{driver}").difference_update_query(
+        ["pgbouncer"]
+    )
+
+
+def behind_transaction_pooler(url: str) -> bool:
+    """True for a transaction-mode pooler URL (port 6543 or ``?pgbouncer=true``)."""
+    parsed = make_url(url)
+    pgbouncer = str(parsed.query.get("pgbouncer", "")).lower()
+    return parsed.port == TRANSACTION_POOLER_PORT or pgbouncer in ("true", "1")
+
 
 class DatabaseManager:
     """
@@ -46,6 +89,15 @@ class DatabaseManager:
         self._lock = threading.RLock()
         self._last_health_check: float = 0
         self._health_check_interval: float = 30.0  # Cache health checks for 30 seconds
+        # Failures are cached too (briefly) so a down DB is not hit by every probe
+        self._health_check_failure_interval: float = 5.0
+        self._last_health_ok: bool = False
+        # Read replicas (optional) - see _select_read_engine for the routing rules
+        self._replica_engines: List[Engine] = []
+        self._replica_lag: Dict[int, Optional[float]] = {}  # None = unreachable
+        self._replica_probe_stop = threading.Event()
+        self._replica_probe_thread: Optional[threading.Thread] = None
+        self._replica_cursor: int = 0
 
     def initialize(self) -> None:
         """
@@ -65,6 +117,7 @@ class DatabaseManager:
                 self._create_session_factory()
                 self._test_connection()
                 self._is_initialized = True
+                self._start_replica_probe()
                 logger.info("Database initialization successful")
 
             except Exception as e:
@@ -80,8 +133,10 @@ class DatabaseManager:
 
         # Configure engine with standard settings
         engine_kwargs = {
-            "url": settings.database_url,
-            "poolclass": QueuePool,
+            "url": resolve_database_url(
+                settings.database_url, settings.database_driver
+            ),
+            "poolclass": InstrumentedQueuePool,
             "echo": settings.database_echo,
             "connect_args": connect_args,
             "future": True,  # Use SQLAlchemy 2.0 style
@@ -95,15 +150,38 @@ class DatabaseManager:
 
         self._engine = create_engine(**engine_kwargs)
 
+        # Read replicas share the primary's pool settings and connect args
+        self._replica_engines = [
+            create_engine(
+                **{
+                    **engine_kwargs,
+                    "url": resolve_database_url(url, settings.database_driver),
+                }
+            )
+            for url in settings.database_replica_urls_list
+        ]
+
+        # Per-request SQL count/time, slow-query log and N+1 detection
+        for engine in (self._engine, *self._replica_engines):
+            install_query_instrumentation(engine)
+
+        # Pool event counters and wait histograms (/health/db and metrics)
+        install_pool_telemetry(self._engine, "primary")
+        for index, engine in enumerate(self._replica_engines):
+            install_pool_telemetry(engine, f"replica_{index}")
+
         logger.info("Database engine created:")
-        logger.info("  - Pool class: QueuePool")
+        logger.info("  - Pool class: InstrumentedQueuePool")
+        logger.info(f"  - Driver: {settings.database_driver}")
         logger.info(f"  - Pool size: {settings.database_pool_size}")
         logger.info(f"  - Max overflow: {settings.database_max_overflow}")
         logger.info(f"  - Pool recycle: {settings.database_pool_recycle}s")
         logger.info(f"  - Pre-ping enabled: {settings.database_pool_pre_ping}")
+        if self._replica_engines:
+            logger.info(f"  - Read replicas: {len(self._replica_engines)}")
 
     def _build_connect_args(self) -> Dict[str, Any]:
-        """Build psycopg2-specific connection arguments."""
+        """Build libpq connection arguments (shared by psycopg2 and psycopg 3)."""
         connect_args = {
             "application_name": f"app-api-{settings.environment}",
             "connect_timeout": 10,  # Connection timeout in seconds
@@ -119,8 +197,25 @@ class DatabaseManager:
             }
         )
 
+        if settings.database_driver == "psycopg":
+            connect_args["prepare_threshold"] = self._prepare_threshold()
+
         return connect_args
 
+    @staticmethod
+    def _prepare_threshold() -> Optional[int]:
+        """psycopg 3 ``prepare_threshold``; None disables server-side prepares.
+
+        Hot ``get``/``get_multi`` statements are parsed and planned once per
+        connection instead of on every call. Prepared statements break behind a
+        transaction-mode pooler (the next execution may land on another
+        backend), so they are disabled there unless configured explicitly.
+        """
+        disable = settings.database_disable_prepared_statements
+        if disable is None:
+            disable = behind_transaction_pooler(settings.database_url)
+        return None if disable else settings.database_prepare_threshold
+
     def _create_session_factory(self) -> None:
         """Create thread-safe session factory."""
         if not self._engine:
@@ -159,37 +254,54 @@ class DatabaseManager:
         """
         Perform database health check with caching and timeout protection.
 
+        Both outcomes are cached - successes for 30s, failures for 5s - so a
+        failing database is not hit by every caller.
+
         Returns:
             bool: True if database is healthy, False otherwise
         """
         current_time = time.time()
 
         # Use cached result if recent
-        if (current_time - self._last_health_check) < self._health_check_interval:
+        ttl = (
+            self._health_check_interval
+            if self._last_health_ok
+            else self._health_check_failure_interval
+        )
+        if (current_time - self._last_health_check) < ttl:
             logger.debug("Using cached health check result")
-            return True
+            return self._last_health_ok
 
         if not self._is_initialized:
             logger.warning("Health check failed: Database not initialized")
             return False
 
         try:
-            with self.get_session() as session:
-                # Quick health check query
-                result = session.execute(text("SELECT 1 as health_check"))
-                row = result.fetchone()
-
-                if row is not None and row[0] == 1:
-                    self._last_health_check = current_time
-                    logger.debug("Database health check passed")
-                    return True
-                else:
-                    logger.warning("Database health check returned unexpected value")
-                    return False
-
+            self.ping()
+            self._last_health_ok = True
+            logger.debug("Database health check passed")
         except Exception as e:
             logger.error(f"Database health check failed: {e}")
-            return False
+            self._last_health_ok = False
+        self._last_health_check = current_time
+        return self._last_health_ok
+
+    def ping(self) -> float:
+        """
+        Run ``SELECT 1`` on the primary and return its latency in seconds.
+
+        Uncached and raising on failure - the background health monitor calls
+        this on its own schedule. Bypasses DB admission (no request slot).
+        """
+        if not self._engine:
+            raise RuntimeError("Database not initialized")
+
+        start = time.perf_counter()
+        with self._engine.connect() as conn:
+            row = conn.execute(text("SELECT 1 as health_check")).fetchone()
+        if row is None or row[0] != 1:
+            raise RuntimeError("Database health check returned unexpected value")
+        return time.perf_counter() - start
 
     def get_detailed_status(self) -> Dict[str, Any]:
         """
@@ -230,13 +342,154 @@ class DatabaseManager:
                 logger.debug(f"Could not get pool status: {e}")
                 status["pool_status"] = "unavailable"
 
+        if self._engine:
+            status["engines"] = self.get_pool_health()["engines"]
+
         # Perform health check
         status["healthy"] = self.health_check()
 
         return status
 
+    @staticmethod
+    def _pool_stats(engine: Engine) -> Dict[str, Any]:
+        """Return checkout counters (and telemetry, if instrumented) for one pool."""
+        pool = engine.pool
+        stats: Dict[str, Any] = {"status_string": pool.status()}
+        if isinstance(pool, QueuePool):
+            stats.update(
+                {
+                    "size": pool.size(),
+                    "checked_in": pool.checkedin(),
+                    "checked_out": pool.checkedout(),
+                    "overflow": pool.overflow(),
+                    "capacity": pool.size() + pool._max_overflow,
+                }
+            )
+        telemetry = get_pool_telemetry(engine)
+        if telemetry is not None:
+            stats.update(telemetry.snapshot())
+        return stats
+
+    def get_pool_health(self) -> Dict[str, Any]:
+        """
+        Structured pool telemetry for ``/health/db``, without touching the DB.
+
+        ``wait`` is time spent queuing for a pooled connection and ``connect``
+        time spent opening new ones, so a latency spike can be attributed to
+        pool exhaustion versus slow Postgres. ``status`` is ``saturated`` while
+        the primary has every ``pool_size + max_overflow`` connection out.
+        Engines are labelled ``primary`` and ``replica_<n>`` only: the endpoint
+        is unauthenticated, so hostnames are left out.
+        """
+        if not self._engine:
+            return {"status": "unavailable", "engines": {}}
+
+        engines: Dict[str, Any] = {"primary": self._pool_stats(self._engine)}
+        for index, engine in enumerate(self._replica_engines):
+            engines[f"replica_{index}"] = {
+                **self._pool_stats(engine),
+                "lag_seconds": self._replica_lag.get(index),
+            }
+
+        primary = engines["primary"]
+        saturated = primary.get("checked_out", 0) >= primary.get("capacity", 1)
+        return {
+            "status": "saturated" if saturated else "ok",
+            "pool_timeout": settings.database_pool_timeout,
+            "engines": engines,
+        }
+
+    def _select_read_engine(self) -> Engine:
+        """
+        Pick the engine for a read-only session.
+
+        Replicas whose last measured lag exceeds ``database_replica_max_lag`` (or
+        that failed, or have not had, the lag probe) are skipped; among the rest
+        the one with the fewest checked-out connections wins, ties broken
+        round-robin. With no replica configured or none eligible, reads go to the
+        primary. Only the stored measurements are read here: the probe runs on
+        its own thread (``_start_replica_probe``), so an unreachable replica never
+        holds up a request for its connect timeout.
+        """
+        if not self._replica_engines:
+            return self._engine
+
+        eligible = [
+            engine
+            for index, engine in enumerate(self._replica_engines)
+            if (lag := self._replica_lag.get(index)) is not None
+            and lag <= settings.database_replica_max_lag
+        ]
+        if not eligible:
+            logger.warning("No read replica within lag budget, reading from primary")
+            return self._engine
+
+        with self._lock:
+            self._replica_cursor = (self._replica_cursor + 1) % len(eligible)
+            start = self._replica_cursor
+        rotated = eligible[start:] + eligible[:start]
+        return min(
+            rotated,
+            key=lambda engine: (
+                engine.pool.checkedout() if isinstance(engine.pool, QueuePool) else 0
+            ),
+        )
+
+    def _start_replica_probe(self) -> None:
+        """Start the daemon thread that re-probes replica lag in the background.
+
+        It probes once right away and then every
+        ``database_replica_lag_check_interval`` seconds until ``close``. Until
+        the first probe finishes, reads go to the primary.
+        """
+        if not self._replica_engines:
+            return
+        self._replica_probe_stop.clear()
+        self._replica_probe_thread = threading.Thread(
+            target=self._probe_replicas, name="replica-lag-probe", daemon=True
+        )
+        self._replica_probe_thread.start()
+
+    def _probe_replicas(self) -> None:
+        """Probe loop run by the ``replica-lag-probe`` thread."""
+        interval = settings.database_replica_lag_check_interval
+        while not self._replica_probe_stop.is_set():
+            self._refresh_replica_lag()
+            self._replica_probe_stop.wait(interval)
+
+    def _refresh_replica_lag(self) -> None:
+        """Measure every replica's lag and publish the results in one swap."""
+        lag = {
+            index: self._measure_replica_lag(engine)
+            for index, engine in enumerate(self._replica_engines)
+        }
+        self._replica_lag = lag
+
+    @staticmethod
+    def _measure_replica_lag(engine: Engine) -> Optional[float]:
+        """Return the replica's replay lag in seconds, or None if unreachable.
+
+        A replica that has replayed everything it received reports 0 even when
+        the primary has been idle (the replay timestamp alone would overstate it).
+        """
+        try:
+            with engine.connect() as conn:
+                lag = conn.execute(
+                    text(
+                        "SELECT CASE "
+                        "WHEN NOT pg_is_in_recovery() THEN 0 "
+                        "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+                        "ELSE COALESCE(EXTRACT(EPOCH FROM now() - "
+                        "pg_last_xact_replay_timestamp()), 0) END"
+                    )
+                ).scalar()
+            return float(lag or 0.0)
+        except Exception as e:
+            logger.warning(f"Read replica {engine.url.host} unavailable: {e}")
+            return None
+
     @contextmanager
-    def get_session(self) -> Generator[Session, None, None]:
+    def get_session(self, read_only: bool = False) -> Generator[Session, None, None]:
         """
         Get database session with automatic error handling and cleanup.
 
@@ -246,6 +499,11 @@ class DatabaseManager:
         - Transaction rollback on exceptions
         - Thread-safe operation
 
+        Args:
+            read_only: Bind the session to a read replica when one is configured
+                and healthy (see ``_select_read_engine``). Writes must use the
+                default primary session.
+
         Yields:
             Session: SQLAlchemy database session
 
@@ -256,11 +514,23 @@ class DatabaseManager:
         if not self._is_initialized or not self._session_factory:
             raise RuntimeError("Database not initialized. Call initialize() first.")
 
-        session = self._session_factory()
+        if read_only:
+            session = self._session_factory(bind=self._select_read_engine())
+        else:
+            session = self._session_factory()
 
         try:
             yield session
 
+        except PoolTimeoutError as e:
+            # Every pooled connection stayed busy for database_pool_timeout
+            logger.error(f"Database pool exhausted: {e}")
+            session.rollback()
+            raise DatabaseTimeoutError(
+                message="Timed out waiting for a database connection",
+                timeout_duration=settings.database_pool_timeout,
+            ) from e
+
         except (DisconnectionError, OperationalError) as e:
             logger.error(f"Database connection error: {e}")
             session.rollback()
@@ -326,6 +596,12 @@ class DatabaseManager:
 
     def _cleanup_resources(self) -> None:
         """Internal method to cleanup database resources."""
+        self._replica_probe_stop.set()
+        if self._replica_probe_thread is not None:
+            # A probe stuck connecting ends with the disposed engine; don't wait
+            self._replica_probe_thread.join(timeout=1)
+            self._replica_probe_thread = None
+
         if self._engine:
             try:
                 self._engine.dispose()
@@ -335,6 +611,14 @@ class DatabaseManager:
             finally:
                 self._engine = None
 
+        for engine in self._replica_engines:
+            try:
+                engine.dispose()
+            except Exception as e:
+                logger.debug(f"Error disposing replica engine: {e}")
+        self._replica_engines = []
+        self._replica_lag = {}
+
         self._session_factory = None
         self._is_initialized = False
         self._last_health_check = 0
@@ -359,7 +643,8 @@ def init_db() -> None:
     Initialize database connection and create tables.
 
     This function is called during application startup.
-    It's safe to call multiple times.
+    It's safe to call multiple times. ``create_all`` is skipped when the
+    alembic revision is already at head (``entrypoint.sh`` migrated first).
     """
     try:
         logger.info("Initializing database system...")
@@ -367,8 +652,11 @@ def init_db() -> None:
         # Initialize connection
         database_manager.initialize()
 
-        # Create tables if they don't exist
-        database_manager.create_all_tables()
+        # Create tables if they don't exist - unless migrations already did
+        if schema_at_head(database_manager.engine):
+            logger.info("Schema at alembic head, skipping create_all")
+        else:
+            database_manager.create_all_tables()
 
         logger.info("Database system initialized successfully")
 
@@ -405,7 +693,9 @@ def get_db() -> Generator[Session, None, None]:
     FastAPI dependency for database sessions.
 
     This function provides database sessions to FastAPI route handlers
-    with automatic cleanup and error handling.
+    with automatic cleanup and error handling. Routes depend on it through
+    ``app.api.deps.DBSession``, which first takes a DB admission slot (see
+    ``app.infrastructure.admission``).
 
     Usage:
         @app.get("/users")
@@ -415,7 +705,27 @@ def get_db() -> Generator[Session, None, None]:
     Yields:
         Session: SQLAlchemy database session
     """
+    setup_start = time.time_ns()
     with database_manager.get_session() as session:
+        tracer.record("dependency.get_db", setup_start, time.time_ns())
+        yield session
+
+
+def get_db_readonly() -> Generator[Session, None, None]:
+    """
+    FastAPI dependency for read-only database sessions.
+
+    Routes to a read replica when ``DATABASE_REPLICA_URLS`` is set (falling back
+    to the primary when none is within the lag budget). Use it only for
+    handlers that never write; replicas are eventually consistent, so a read
+    issued right after a write may not see it yet.
+
+    Yields:
+        Session: SQLAlchemy session bound to a replica or the primary
+    """
+    setup_start = time.time_ns()
+    with database_manager.get_session(read_only=True) as session:
+        tracer.record("dependency.get_db_readonly", setup_start, time.time_ns())
         yield session
 
 
@@ -503,6 +813,7 @@ __all__ = [
     "init_db",
     "close_db",
     "get_db",
+    "get_db_readonly",
     "get_db_status",
     "execute_raw_sql",
     "test_database_connection",
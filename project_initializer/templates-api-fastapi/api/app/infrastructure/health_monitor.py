@@ -0,0 +1,178 @@
+"""Background health monitor: probes off the request path, cached readiness.
+
+Kubernetes probes every few seconds on every pod. When each probe ran
+``SELECT 1``, probe traffic grew with the replica count, and while the database
+was down every probe still queued for a connection. Here one task per worker
+probes on its own schedule instead:
+
+* the database (``DatabaseManager.ping``, uncached ``SELECT 1``);
+* the LLM provider, when ``health_probe_llm`` is on. BAML builds one request
+  offline (no completion is paid for) and the provider's origin gets an HTTP
+  ``HEAD``; any HTTP answer counts as reachable.
+
+Probes repeat every ``health_probe_interval`` seconds with ``± jitter`` (pods
+started together do not probe in lockstep). Each probe is cut off after
+``health_probe_timeout`` seconds. ``/health/ready`` and ``/health/detailed``
+only read the cached ``ProbeResult`` values, which is O(1).
+"""
+
+import asyncio
+import logging
+import random
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import anyio
+import httpx
+
+from baml_client.async_client import b as baml_async_client
+
+from app.infrastructure.database import database_manager
+from app.infrastructure.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """Outcome of one probe."""
+
+    ok: bool
+    latency_ms: Optional[float]
+    checked_at: float  # time.time()
+    error: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "ok": self.ok,
+            "latency_ms": self.latency_ms,
+            "checked_at": self.checked_at,
+            "age_s": round(time.time() - self.checked_at, 3),
+            "error": self.error,
+        }
+
+
+class HealthMonitor:
+    """Probe dependencies in the background and cache the latest results."""
+
+    def __init__(self, interval: float, timeout: float, jitter: float):
+        self.interval = interval
+        self.timeout = timeout
+        self.jitter = jitter
+        self.database: Optional[ProbeResult] = None
+        self.llm: Optional[ProbeResult] = None
+        self._task: Optional[asyncio.Task] = None
+        self._http: Optional[httpx.AsyncClient] = None
+        self._llm_origin: Optional[str] = None
+
+    @property
+    def ready(self) -> bool:
+        """True while the last database probe passed and is not stale.
+
+        A result older than three intervals means the probe loop is stuck or
+        gone, so it no longer vouches for the database.
+        """
+        result = self.database
+        if result is None or not result.ok:
+            return False
+        return time.time() - result.checked_at <= 3 * self.interval + self.timeout
+
+    async def _timed(self, probe: Callable[[], Awaitable[Any]]) -> ProbeResult:
+        start = time.perf_counter()
+        try:
+            with anyio.fail_after(self.timeout):
+                await probe()
+        except TimeoutError:
+            return ProbeResult(
+                ok=False,
+                latency_ms=None,
+                checked_at=time.time(),
+                error=f"timed out after {self.timeout}s",
+            )
+        except Exception as e:
+            return ProbeResult(
+                ok=False, latency_ms=None, checked_at=time.time(), error=str(e)
+            )
+        latency_ms = round((time.perf_counter() - start) * 1000, 3)
+        return ProbeResult(ok=True, latency_ms=latency_ms, checked_at=time.time())
+
+    async def _probe_database(self) -> None:
+        # abandon_on_cancel: on timeout the result is recorded at once, while
+        # the worker thread finishes (or hits pool_timeout) in the background.
+        await anyio.to_thread.run_sync(database_manager.ping, abandon_on_cancel=True)
+
+    async def _probe_llm(self) -> None:
+        if self._llm_origin is None:
+            request = await baml_async_client.request.Chat(user_question="ping")
+            parts = urlsplit(request.url)
+            self._llm_origin = f"{parts.scheme}://{parts.netloc}"
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=self.timeout)
+        await self._http.head(self._llm_origin)
+
+    async def probe_once(self) -> None:
+        """Run every enabled probe concurrently and store the results."""
+        probes = [self._timed(self._probe_database)]
+        if settings.health_probe_llm:
+            probes.append(self._timed(self._probe_llm))
+        results = await asyncio.gather(*probes)
+
+        previous = self.database
+        self.database = results[0]
+        if len(results) > 1:
+            self.llm = results[1]
+        if previous is not None and previous.ok != self.database.ok:
+            logger.warning(
+                f"Database probe is now {'passing' if self.database.ok else 'failing'}",
+                extra={"event_type": "health_transition", "error": self.database.error},
+            )
+
+    def _next_delay(self) -> float:
+        return self.interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.probe_once()
+            except Exception as e:  # never let the loop die
+                logger.error(f"Health probe round failed: {e}")
+            await asyncio.sleep(self._next_delay())
+
+    def start(self) -> None:
+        """Start the probe loop on the running event loop (no-op if running)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(), name="health-monitor"
+            )
+
+    async def stop(self) -> None:
+        """Cancel the probe loop and close the HTTP client."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Readiness plus the last result of every probe, as plain JSON data."""
+        return {
+            "status": "ready" if self.ready else "not_ready",
+            "checks": {
+                "database": self.database.as_dict() if self.database else None,
+                "llm": self.llm.as_dict() if self.llm else None,
+            },
+            "probe_interval": self.interval,
+        }
+
+
+health_monitor = HealthMonitor(
+    interval=settings.health_probe_interval,
+    timeout=settings.health_probe_timeout,
+    jitter=settings.health_probe_jitter,
+)
@@ -0,0 +1,140 @@
+"""Non-blocking logging: queue hand-off, JSON formatter, request-id context.
+
+``configure_logging`` puts a single ``QueueHandler`` on the root logger. The
+calling thread (event loop or threadpool worker) only renders the message and
+enqueues the record. A ``QueueListener`` thread does the formatting and the
+stderr writes, so a slow or full stderr pipe no longer stalls the event loop.
+
+With ``log_format=json`` each line is one JSON object built by ``JsonFormatter``
+from the record, so quotes and newlines in messages are escaped. ``extra=``
+fields such as ``status_code`` and ``process_time`` become top-level keys.
+``LoggingMiddleware`` sets ``request_id`` in a ``ContextVar`` for each request,
+and the queue handler stamps it on every record logged while that request is
+in flight, including records from sync handlers running in the threadpool.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import queue
+import sys
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+_request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# LogRecord attributes that are not ``extra=`` fields.
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message",
+    "asctime",
+    "taskName",
+    "request_id",
+}
+
+_listener: Optional[QueueListener] = None
+
+
+def set_request_id(request_id: str) -> Token:
+    """Bind ``request_id`` to the current context (one request)."""
+    return _request_id.set(request_id)
+
+
+def reset_request_id(token: Token) -> None:
+    """Unbind the id set by ``set_request_id``."""
+    _request_id.reset(token)
+
+
+def get_request_id() -> Optional[str]:
+    """Return the id of the request in flight, or None outside a request."""
+    return _request_id.get()
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: core fields, request id, then ``extra``."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc)
+            .isoformat(timespec="milliseconds")
+            .replace("+00:00", "Z"),
+            "level": record.levelname,
+            "name": record.name,
+            "message": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id is not None:
+            entry["request_id"] = request_id
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class _ContextQueueHandler(QueueHandler):
+    """Enqueue records with their message rendered and request id attached.
+
+    Only the cheap part happens on the caller's thread: ``msg % args`` (args may
+    not be safe to touch later) and the context lookup. Formatting is left to
+    the listener's handler, so the JSON formatter still sees ``extra`` fields.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if not hasattr(record, "request_id"):
+            record.request_id = _request_id.get()
+        if record.exc_info:
+            # Tracebacks reference frames; render them before they are gone.
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging(level: str, log_format: str) -> QueueListener:
+    """Route the root logger through a queue drained by one listener thread.
+
+    Safe to call more than once: the previous queue handler and listener are
+    replaced. Other root handlers (e.g. pytest's capture) are left alone.
+    """
+    global _listener
+
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, level.upper()))
+    for handler in list(root.handlers):
+        if isinstance(handler, _ContextQueueHandler):
+            root.removeHandler(handler)
+    if _listener is not None:
+        _listener.stop()
+
+    output = logging.StreamHandler(sys.stderr)
+    output.setFormatter(
+        logging.Formatter(TEXT_FORMAT) if log_format == "text" else JsonFormatter()
+    )
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root.addHandler(_ContextQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread (runs at exit)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,135 @@
+"""Event-loop lag watchdog: measures lag, names the code that blocks the loop.
+
+Sync I/O inside ``async def`` code holds the event loop. While it runs, the
+worker serves nothing else, and nothing reports it. The watchdog has two parts:
+
+* A task on the loop sleeps ``interval`` seconds and measures how late it
+  wakes up. That lag goes to the ``event_loop_lag_seconds`` histogram. Each
+  wake-up also refreshes a heartbeat.
+* A monitor thread watches the heartbeat. When it is more than ``threshold``
+  seconds overdue, the loop is stuck right now, and the thread takes the
+  loop thread's stack from ``sys._current_frames()``. It logs a warning that
+  names the innermost frame in application code, with the full stack in the
+  ``stack`` extra, and counts the event in ``event_loop_blocked_total``. Each
+  stall is reported once, however long it lasts.
+
+The overhead is one timer wake-up per interval on the loop, plus a thread
+that sleeps between cheap checks.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from contextlib import suppress
+from typing import List, Optional
+
+from app.infrastructure.metrics import EVENT_LOOP_BLOCKED_TOTAL, EVENT_LOOP_LAG_SECONDS
+from app.infrastructure.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Frames under this directory count as "ours" when naming the blocking call
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_MAX_STACK_FRAMES = 30
+
+
+def blocking_frame(stack: List[traceback.FrameSummary]) -> traceback.FrameSummary:
+    """Innermost frame in application code, else the innermost frame."""
+    for frame in reversed(stack):
+        if frame.filename.startswith(_APP_DIR):
+            return frame
+    return stack[-1]
+
+
+class LoopWatchdog:
+    """Lag sampler on the loop plus a stack-capturing monitor thread."""
+
+    def __init__(self, interval: float, threshold: float):
+        self.interval = interval
+        self.threshold = threshold
+        self.max_lag = 0.0
+        self.blocked_count = 0
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    async def _run(self) -> None:
+        lag_histogram = EVENT_LOOP_LAG_SECONDS
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._heartbeat = now
+            lag = max(0.0, now - expected)
+            lag_histogram.observe(lag)
+            if lag > self.max_lag:
+                self.max_lag = lag
+
+    def _monitor(self) -> None:
+        reported_beat = None
+        while not self._stop.wait(self.interval / 2):
+            beat = self._heartbeat
+            overdue = time.monotonic() - beat - self.interval
+            if overdue < self.threshold or beat == reported_beat:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            reported_beat = beat
+            self._report(overdue, traceback.extract_stack(frame)[-_MAX_STACK_FRAMES:])
+
+    def _report(self, overdue: float, stack: List[traceback.FrameSummary]) -> None:
+        self.blocked_count += 1
+        EVENT_LOOP_BLOCKED_TOTAL.inc()
+        culprit = blocking_frame(stack)
+        logger.warning(
+            f"Event loop blocked for {overdue * 1000:.0f}ms+ in {culprit.name} "
+            f"({culprit.filename}:{culprit.lineno})",
+            extra={
+                "event_type": "event_loop_blocked",
+                "blocked_ms": round(overdue * 1000, 1),
+                "blocking_function": culprit.name,
+                "blocking_location": f"{culprit.filename}:{culprit.lineno}",
+                "stack": "".join(traceback.format_list(stack)),
+            },
+        )
+
+    def start(self) -> None:
+        """Start the sampler task and the monitor thread (no-op if running)."""
+        if self._task is not None and not self._task.done():
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._task = asyncio.get_running_loop().create_task(
+            self._run(), name="loop-watchdog"
+        )
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._monitor, name="loop-watchdog-monitor", daemon=True
+        )
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """Cancel the sampler and stop the monitor thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+
+loop_watchdog = LoopWatchdog(
+    interval=settings.loop_watchdog_interval_ms / 1000,
+    threshold=settings.loop_watchdog_threshold_ms / 1000,
+)
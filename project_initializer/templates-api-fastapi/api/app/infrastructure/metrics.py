@@ -0,0 +1,174 @@
+"""Prometheus metrics: HTTP traffic, BAML calls, rate-limit rejections.
+
+Families defined here (pool metrics live in ``pool_telemetry``, admission
+rejections in ``admission``, cache hits and misses in ``cache``):
+
+* ``http_requests_total{method,route,status}`` and
+  ``http_request_duration_seconds{method,route}``. ``route`` is the matched
+  route template (``/api/v1/items/{item_id}``), so ids do not explode the label
+  set. Unmatched paths share ``<unmatched>``. The error rate is the 5xx share
+  of the total.
+* ``http_requests_in_progress{method}``.
+* ``baml_call_duration_seconds{function,client,outcome}`` and
+  ``baml_tokens_total{function,client,direction}`` from a BAML ``Collector``.
+* ``rate_limit_rejected_total{limiter}``.
+* ``event_loop_lag_seconds`` and ``event_loop_blocked_total`` (see
+  ``loop_watchdog``).
+
+Multiprocess mode: when ``PROMETHEUS_MULTIPROC_DIR`` is set before the app
+starts (the process environment or the project ``.env``; ``load_configuration``
+runs first), every worker writes its samples to mmap files in that directory.
+``render_metrics`` then merges all workers, whichever one is scraped. The
+directory must exist and should be emptied before the workers start. Gauges
+declare how workers combine (``livesum``: sum over live processes).
+
+The request path only touches cached label children: one counter increment,
+one histogram observe and two gauge updates, a few microseconds in total.
+"""
+
+import logging
+import os
+from typing import Dict, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+logger = logging.getLogger(__name__)
+
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+# Upper bounds in seconds; the last bucket is +Inf.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+LLM_BUCKETS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0)
+
+HTTP_REQUESTS_TOTAL = Counter(
+    "http_requests_total",
+    "HTTP requests by route template and status",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Time from request start to the end of the response body",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+BAML_CALL_DURATION_SECONDS = Histogram(
+    "baml_call_duration_seconds",
+    "BAML function call latency",
+    ["function", "client", "outcome"],
+    buckets=LLM_BUCKETS,
+)
+BAML_TOKENS_TOTAL = Counter(
+    "baml_tokens_total",
+    "LLM tokens used by BAML calls",
+    ["function", "client", "direction"],
+)
+RATE_LIMIT_REJECTED_TOTAL = Counter(
+    "rate_limit_rejected_total",
+    "Requests rejected with 429",
+    ["limiter"],
+)
+EVENT_LOOP_LAG_SECONDS = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop runs a timer scheduled by the watchdog",
+    buckets=LOOP_LAG_BUCKETS,
+)
+EVENT_LOOP_BLOCKED_TOTAL = Counter(
+    "event_loop_blocked_total",
+    "Times the event loop was blocked past the watchdog threshold",
+)
+
+
+class HttpMetrics:
+    """Label children cached per (method, route[, status]).
+
+    ``.labels()`` takes a lock and builds a key on every call; after the first
+    request on a route, the hot path is a plain dict hit.
+    """
+
+    def __init__(self):
+        self._requests: Dict[Tuple[str, str, int], Counter] = {}
+        self._durations: Dict[Tuple[str, str], Histogram] = {}
+        self._in_progress: Dict[str, Gauge] = {}
+
+    def in_progress(self, method: str) -> Gauge:
+        child = self._in_progress.get(method)
+        if child is None:
+            child = self._in_progress[method] = HTTP_REQUESTS_IN_PROGRESS.labels(
+                method=method
+            )
+        return child
+
+    def observe(self, method: str, route: str, status: int, seconds: float) -> None:
+        key = (method, route, status)
+        counter = self._requests.get(key)
+        if counter is None:
+            counter = self._requests[key] = HTTP_REQUESTS_TOTAL.labels(
+                method=method, route=route, status=str(status)
+            )
+        counter.inc()
+        duration = self._durations.get((method, route))
+        if duration is None:
+            duration = self._durations[(method, route)] = (
+                HTTP_REQUEST_DURATION_SECONDS.labels(method=method, route=route)
+            )
+        duration.observe(seconds)
+
+
+http_metrics = HttpMetrics()
+
+
+def record_baml_usage(collector) -> None:
+    """Record latency and token counts for every call held by a BAML ``Collector``.
+
+    Use one collector per request (see ``get_chatbot_service``) so each call is
+    recorded once and no collector grows without bound.
+    """
+    for log in collector.logs:
+        call = log.selected_call
+        client = call.client_name if call is not None else "none"
+        outcome = "ok" if call is not None else "error"
+        if log.timing.duration_ms is not None:
+            BAML_CALL_DURATION_SECONDS.labels(
+                function=log.function_name, client=client, outcome=outcome
+            ).observe(log.timing.duration_ms / 1000)
+        usage = log.usage
+        for direction, tokens in (
+            ("input", usage.input_tokens),
+            ("output", usage.output_tokens),
+        ):
+            if tokens:
+                BAML_TOKENS_TOTAL.labels(
+                    function=log.function_name, client=client, direction=direction
+                ).inc(tokens)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Exposition payload and content type, merged across workers if needed."""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead() -> None:
+    """Drop this worker's live gauges from the merged view (call at shutdown)."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,44 @@
+"""Alembic revision check used by the startup fast path.
+
+``entrypoint.sh`` runs ``alembic upgrade head`` before uvicorn starts, so on a
+normal boot the schema is already current and ``Base.metadata.create_all()``
+would only spend one catalog query per table finding that out.
+``schema_at_head`` answers the same question with a single read of
+``alembic_version``.
+"""
+
+import logging
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import Engine
+
+logger = logging.getLogger(__name__)
+
+# api/alembic — resolved from this file so the check is CWD-independent.
+ALEMBIC_DIR = Path(__file__).resolve().parents[2] / "alembic"
+
+
+def head_revisions() -> set[str]:
+    """Return the head revision(s) of the migration scripts shipped with the app."""
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    return set(ScriptDirectory.from_config(config).get_heads())
+
+
+def schema_at_head(engine: Engine) -> bool:
+    """True when the database's alembic revision matches the scripts' head.
+
+    Any failure (no ``alembic_version`` table, missing scripts) returns False,
+    so the caller falls back to ``create_all``.
+    """
+    try:
+        with engine.connect() as conn:
+            current = set(MigrationContext.configure(conn).get_current_heads())
+        heads = head_revisions()
+    except Exception as e:
+        logger.debug(f"Alembic revision check failed: {e}")
+        return False
+    return bool(current) and current == heads
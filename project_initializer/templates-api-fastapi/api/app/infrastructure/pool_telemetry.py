@@ -0,0 +1,224 @@
+"""Connection-pool telemetry: event counters and pool-wait histograms.
+
+``pool.status()`` is one opaque string. This module answers the question a p99
+spike raises — are requests *queuing for a connection* (all
+``pool_size + max_overflow`` are checked out) or *waiting on Postgres*?
+
+* ``InstrumentedQueuePool`` is a ``QueuePool`` that times every acquisition.
+  Time spent opening a brand-new DBAPI connection is recorded separately as
+  connect time, so the wait histogram is pure queuing.
+* ``install_pool_telemetry`` adds ``connect``/``checkout``/``checkin``/
+  ``invalidate`` listeners that maintain counters.
+
+Everything lands twice: on the pool's ``PoolTelemetry`` (the JSON behind
+``/health/db``) and on the Prometheus metrics served at ``metrics_path``.
+"""
+
+import bisect
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+# Upper bounds in seconds; the last bucket is +Inf.
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+POOL_EVENTS = ("connect", "checkout", "checkin", "invalidate", "timeout")
+
+POOL_EVENTS_TOTAL = Counter(
+    "db_pool_events_total",
+    "Connection pool events by engine",
+    ["engine", "event"],
+)
+POOL_WAIT_SECONDS = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent queuing for a pooled connection",
+    ["engine"],
+    buckets=WAIT_BUCKETS,
+)
+POOL_CONNECT_SECONDS = Histogram(
+    "db_pool_connect_seconds",
+    "Time spent opening a new DBAPI connection",
+    ["engine"],
+    buckets=WAIT_BUCKETS,
+)
+# Kept by checkout/checkin events rather than read from the pool at scrape
+# time, so multiprocess mode can sum them over workers (``livesum``).
+POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+POOL_CAPACITY = Gauge(
+    "db_pool_capacity",
+    "pool_size + max_overflow",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+
+
+class PoolTelemetry:
+    """Thread-safe counters and wait/connect histograms for one pool."""
+
+    def __init__(self, name: str = "primary"):
+        self.name = name
+        self.listening = False
+        self._lock = threading.Lock()
+        self.counters: Dict[str, int] = {event_name: 0 for event_name in POOL_EVENTS}
+        self._wait = _HistogramData()
+        self._connect = _HistogramData()
+
+    def incr(self, event_name: str) -> None:
+        with self._lock:
+            self.counters[event_name] += 1
+        POOL_EVENTS_TOTAL.labels(engine=self.name, event=event_name).inc()
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self._wait.observe(seconds)
+        POOL_WAIT_SECONDS.labels(engine=self.name).observe(seconds)
+
+    def record_connect(self, seconds: float) -> None:
+        with self._lock:
+            self._connect.observe(seconds)
+        POOL_CONNECT_SECONDS.labels(engine=self.name).observe(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return counters plus wait/connect summaries as plain JSON data."""
+        with self._lock:
+            return {
+                "events": dict(self.counters),
+                "wait": self._wait.summary(),
+                "connect": self._connect.summary(),
+            }
+
+
+class _HistogramData:
+    """Fixed-bucket histogram with count/sum/max and bucket-bound percentiles."""
+
+    def __init__(self):
+        self.buckets: List[int] = [0] * (len(WAIT_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.buckets[bisect.bisect_left(WAIT_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, quantile: float) -> Optional[float]:
+        """Upper bound (seconds) of the bucket holding ``quantile``; None if empty."""
+        if not self.count:
+            return None
+        rank = quantile * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return WAIT_BUCKETS[index] if index < len(WAIT_BUCKETS) else self.max
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        def _ms(seconds: Optional[float]) -> Optional[float]:
+            return None if seconds is None else round(seconds * 1000, 3)
+
+        return {
+            "count": self.count,
+            "avg_ms": _ms(self.total / self.count) if self.count else None,
+            "max_ms": _ms(self.max),
+            "p50_ms": _ms(self.percentile(0.50)),
+            "p95_ms": _ms(self.percentile(0.95)),
+            "p99_ms": _ms(self.percentile(0.99)),
+            "buckets": {
+                **{f"le_{bound}": n for bound, n in zip(WAIT_BUCKETS, self.buckets)},
+                "le_inf": self.buckets[-1],
+            },
+        }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """``QueuePool`` that records how long each checkout waited for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.telemetry = PoolTelemetry()
+        # _do_get recurses and may open a connection; track per thread so only
+        # the outermost call is timed and connect time can be subtracted.
+        self._acquire_state = threading.local()
+
+    def _do_get(self):
+        state = self._acquire_state
+        if getattr(state, "depth", 0):
+            return super()._do_get()
+
+        state.depth = 1
+        state.connect_time = 0.0
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.telemetry.incr("timeout")
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.telemetry.record_wait(max(elapsed - state.connect_time, 0.0))
+            state.depth = 0
+
+    def _create_connection(self):
+        start = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            elapsed = time.perf_counter() - start
+            state = self._acquire_state
+            if getattr(state, "depth", 0):
+                state.connect_time += elapsed
+            self.telemetry.record_connect(elapsed)
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        # engine.dispose() swaps in a fresh pool; keep the accumulated telemetry.
+        pool = super().recreate()
+        pool.telemetry = self.telemetry
+        return pool
+
+
+def get_pool_telemetry(engine: Engine) -> Optional[PoolTelemetry]:
+    """Return the engine's ``PoolTelemetry``, or None for an uninstrumented pool."""
+    return getattr(engine.pool, "telemetry", None)
+
+
+def install_pool_telemetry(engine: Engine, name: str) -> None:
+    """Name the engine's telemetry and register the pool event counters."""
+    telemetry = get_pool_telemetry(engine)
+    if telemetry is None:
+        return
+    telemetry.name = name
+
+    pool = engine.pool
+    checked_out = POOL_CHECKED_OUT.labels(engine=name)
+    checked_out.set(pool.checkedout())
+    POOL_CAPACITY.labels(engine=name).set(pool.size() + pool._max_overflow)
+
+    if telemetry.listening:
+        return
+    telemetry.listening = True
+
+    def on_checkout(*args) -> None:
+        telemetry.incr("checkout")
+        checked_out.inc()
+
+    def on_checkin(*args) -> None:
+        telemetry.incr("checkin")
+        checked_out.dec()
+
+    event.listen(engine, "connect", lambda *args: telemetry.incr("connect"))
+    event.listen(engine, "checkout", on_checkout)
+    event.listen(engine, "checkin", on_checkin)
+    event.listen(engine, "invalidate", lambda *args: telemetry.incr("invalidate"))
@@ -0,0 +1,203 @@
+"""On-demand request profiling (debug and staging only).
+
+A request sent with ``X-Profile: 1`` runs under a sampling profiler (see
+``ProfilingMiddleware``). The result is saved as a speedscope JSON file
+(https://www.speedscope.app) under ``settings.profile_dir`` and listed at
+``/debug/profiles``.
+
+A background thread reads ``sys._current_frames()`` every
+``profile_interval_ms`` while the request runs, and the samples become one
+speedscope profile per thread. It samples the event loop thread, including
+the time it spends in ``select`` (waiting on I/O), and any other thread that
+is not idle, such as a threadpool worker running a sync handler or
+dependency. cProfile would only see the thread that enabled it, and would
+slow every call it traces.
+
+Sampling is process-wide: requests running at the same time show up in the
+profile too. Only one request is profiled at a time; while one is running,
+other ``X-Profile`` requests are served without profiling.
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.infrastructure.settings import settings
+
+# Leaf frames of threads that are just waiting (idle pool workers, queue listeners)
+_IDLE_FILES = ("threading.py", "queue.py")
+
+_PROFILE_ID_RE = re.compile(r"^[0-9]{19}-[0-9a-f]{8}$")
+
+_FrameKey = Tuple[str, str, int]
+
+
+class SamplingProfiler:
+    """Samples thread stacks on a background thread until ``stop``."""
+
+    def __init__(self, loop_thread_id: int, interval: float):
+        self.loop_thread_id = loop_thread_id
+        self.interval = interval
+        self.frames: List[_FrameKey] = []
+        self._frame_index: Dict[_FrameKey, int] = {}
+        # thread name -> list of stacks (frame indices, root first)
+        self.samples: Dict[str, List[List[int]]] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="request-profiler", daemon=True
+        )
+        self.started = 0.0
+        self.elapsed = 0.0
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.elapsed = time.perf_counter() - self.started
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                if (
+                    thread_id != self.loop_thread_id
+                    and frame.f_code.co_filename.endswith(_IDLE_FILES)
+                ):
+                    continue
+                name = (
+                    "event loop"
+                    if thread_id == self.loop_thread_id
+                    else names.get(thread_id, str(thread_id))
+                )
+                self.samples.setdefault(name, []).append(self._stack(frame))
+
+    def _stack(self, frame) -> List[int]:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            key = (code.co_name, code.co_filename, frame.f_lineno)
+            index = self._frame_index.get(key)
+            if index is None:
+                index = self._frame_index[key] = len(self.frames)
+                self.frames.append(key)
+            stack.append(index)
+            frame = frame.f_back
+        stack.reverse()
+        return stack
+
+    def to_speedscope(self, name: str) -> Dict[str, Any]:
+        """Speedscope "sampled" file; each sample weighs one interval in ms."""
+        weight = self.interval * 1000
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "app.infrastructure.profiling",
+            "activeProfileIndex": 0,
+            "shared": {
+                "frames": [
+                    {"name": function, "file": filename, "line": line}
+                    for function, filename, line in self.frames
+                ]
+            },
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": thread_name,
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": len(stacks) * weight,
+                    "samples": stacks,
+                    "weights": [weight] * len(stacks),
+                }
+                for thread_name, stacks in sorted(
+                    self.samples.items(), key=lambda item: item[0] != "event loop"
+                )
+            ],
+        }
+
+
+class ProfileStore:
+    """Speedscope files in a directory, newest ``max_files`` kept."""
+
+    def __init__(self, directory: str, max_files: int):
+        self.directory = directory
+        self.max_files = max_files
+        self._busy = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Claim the single profiling slot; False if a profile is running."""
+        return self._busy.acquire(blocking=False)
+
+    def release(self) -> None:
+        self._busy.release()
+
+    def save(self, profile: Dict[str, Any], meta: Dict[str, Any]) -> str:
+        """Write the profile and its metadata; returns the profile id."""
+        os.makedirs(self.directory, exist_ok=True)
+        profile_id = f"{time.time_ns():019d}-{os.urandom(4).hex()}"
+        base = os.path.join(self.directory, profile_id)
+        with open(base + ".speedscope.json", "w", encoding="utf-8") as out:
+            json.dump(profile, out)
+        with open(base + ".meta.json", "w", encoding="utf-8") as out:
+            json.dump({"id": profile_id, **meta}, out)
+        self._prune()
+        return profile_id
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Metadata of the stored profiles, newest first."""
+        entries = []
+        for profile_id in self._ids()[::-1]:
+            try:
+                with open(
+                    os.path.join(self.directory, profile_id + ".meta.json"),
+                    encoding="utf-8",
+                ) as meta:
+                    entries.append(json.load(meta))
+            except (OSError, ValueError):
+                continue
+        return entries
+
+    def path(self, profile_id: str) -> Optional[str]:
+        """File of a stored profile, or None (ids are validated, no traversal)."""
+        if not _PROFILE_ID_RE.match(profile_id):
+            return None
+        path = os.path.join(self.directory, profile_id + ".speedscope.json")
+        return path if os.path.exists(path) else None
+
+    def _ids(self) -> List[str]:
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return sorted(
+            name[: -len(".speedscope.json")]
+            for name in names
+            if name.endswith(".speedscope.json")
+        )
+
+    def _prune(self) -> None:
+        ids = self._ids()
+        for profile_id in ids[: max(0, len(ids) - self.max_files)]:
+            for suffix in (".speedscope.json", ".meta.json"):
+                try:
+                    os.remove(os.path.join(self.directory, profile_id + suffix))
+                except FileNotFoundError:
+                    pass
+
+
+def profiling_allowed() -> bool:
+    """Profiling is only ever honoured in debug or staging."""
+    return settings.profiling_enabled and (settings.debug or settings.is_staging)
+
+
+profile_store = ProfileStore(settings.profile_dir, settings.profile_max_files)
@@ -0,0 +1,212 @@
+"""Query-level SQL instrumentation: per-request statement count, DB time, N+1.
+
+``install_query_instrumentation`` hooks SQLAlchemy's ``before_cursor_execute`` /
+``after_cursor_execute`` events on an engine (``DatabaseManager`` installs it on
+the primary and every replica). Each statement is timed and, when a request is
+in flight, recorded on the ``QueryStats`` held in a ``ContextVar`` — the
+``QueryStatsMiddleware`` opens one per request. Sync handlers run in the
+threadpool with a *copy* of the request context, so the copy still points at the
+same ``QueryStats`` object and their statements are counted too.
+
+Statements slower than ``db_slow_query_ms`` are logged whether or not a request
+is active; with ``db_slow_query_explain`` on (PostgreSQL, SELECT only) the log
+line carries an ``EXPLAIN (ANALYZE, BUFFERS)`` plan. Repeated statement shapes
+within one request are the N+1 signal — see ``QueryStats.repeated``.
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import Engine, event
+
+from app.infrastructure.settings import settings
+from app.infrastructure.tracing import current_span, tracer
+
+logger = logging.getLogger(__name__)
+
+# Key under Connection.info holding the start times of in-flight statements.
+_START_TIMES_KEY = "query_stats_start_times"
+
+# Longest statement text kept in log lines and fingerprints.
+_MAX_STATEMENT_LENGTH = 500
+
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Return the statement's shape: literals replaced by ``?``, whitespace collapsed.
+
+    Bound parameters are already placeholders, so two lookups of different ids
+    share a fingerprint — which is exactly what an N+1 loop looks like.
+    """
+    shape = _WHITESPACE_RE.sub(" ", _LITERAL_RE.sub("?", statement)).strip()
+    return shape[:_MAX_STATEMENT_LENGTH]
+
+
+@dataclass
+class QueryStats:
+    """SQL statements executed while serving one request."""
+
+    count: int = 0
+    total_time: float = 0.0  # seconds
+    fingerprints: Counter = field(default_factory=Counter)
+
+    @property
+    def total_time_ms(self) -> float:
+        return self.total_time * 1000
+
+    def record(self, statement: str, elapsed: float) -> None:
+        """Count one executed statement and its duration in seconds."""
+        self.count += 1
+        self.total_time += elapsed
+        self.fingerprints[fingerprint(statement)] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Return ``(fingerprint, times)`` for shapes run at least ``threshold`` times."""
+        return [
+            (shape, times)
+            for shape, times in self.fingerprints.most_common()
+            if times >= threshold
+        ]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "query_stats", default=None
+)
+
+
+def start_query_stats() -> Tuple[QueryStats, Token]:
+    """Begin collecting stats for the current context (one request)."""
+    stats = QueryStats()
+    return stats, _current_stats.set(stats)
+
+
+def reset_query_stats(token: Token) -> None:
+    """Stop collecting for the context opened by ``start_query_stats``."""
+    _current_stats.reset(token)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Return the stats of the request in flight, or None outside a request."""
+    return _current_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _trace_statement(
+    conn, statement: str, elapsed: float, error: Optional[str] = None
+) -> None:
+    # One db.query span per statement when a traced request is in flight
+    if current_span() is None:
+        return
+    end_ns = time.time_ns()
+    tracer.record(
+        "db.query",
+        end_ns - int(elapsed * 1e9),
+        end_ns,
+        attributes={
+            "db.system": conn.dialect.name,
+            "db.statement": _WHITESPACE_RE.sub(" ", statement)[:_MAX_STATEMENT_LENGTH],
+        },
+        error=error,
+    )
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get(_START_TIMES_KEY)
+    if not start_times:
+        return
+    elapsed = time.perf_counter() - start_times.pop()
+    _trace_statement(conn, statement, elapsed)
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+    if elapsed * 1000 >= settings.db_slow_query_ms:
+        _log_slow_query(conn, cursor, statement, parameters, executemany, elapsed)
+
+
+def _handle_error(exception_context) -> None:
+    # A failed statement never reaches after_cursor_execute; drop its start time.
+    conn = exception_context.connection
+    if conn is not None:
+        start_times = conn.info.get(_START_TIMES_KEY)
+        if start_times:
+            elapsed = time.perf_counter() - start_times.pop()
+            _trace_statement(
+                conn,
+                exception_context.statement or "",
+                elapsed,
+                error=type(exception_context.original_exception).__name__,
+            )
+
+
+def _log_slow_query(
+    conn, cursor, statement: str, parameters: Any, executemany: bool, elapsed: float
+) -> None:
+    """Log a statement that exceeded ``db_slow_query_ms``, with its plan if enabled."""
+    plan = None
+    if (
+        settings.db_slow_query_explain
+        and not executemany
+        and conn.dialect.name == "postgresql"
+        and statement.lstrip()[:6].upper() == "SELECT"
+    ):
+        plan = _explain(cursor, statement, parameters)
+
+    message = (
+        f"Slow query ({elapsed * 1000:.1f}ms): "
+        f"{_WHITESPACE_RE.sub(' ', statement)[:_MAX_STATEMENT_LENGTH]}"
+    )
+    if plan:
+        message += f"\n{plan}"
+    logger.warning(
+        message,
+        extra={"event_type": "slow_query", "duration_ms": round(elapsed * 1000, 1)},
+    )
+
+
+def _explain(cursor, statement: str, parameters: Any) -> Optional[str]:
+    """Return ``EXPLAIN (ANALYZE, BUFFERS)`` output for a SELECT, or None.
+
+    Runs on a raw DBAPI cursor (no SQLAlchemy events, so no recursion) inside a
+    savepoint, so a failing EXPLAIN cannot abort the request's transaction.
+    ANALYZE re-executes the query — keep this off in production.
+    """
+    explain_cursor = cursor.connection.cursor()
+    try:
+        explain_cursor.execute("SAVEPOINT query_stats_explain")
+        try:
+            explain_cursor.execute(
+                f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters
+            )
+            plan = "\n".join(row[0] for row in explain_cursor.fetchall())
+            explain_cursor.execute("RELEASE SAVEPOINT query_stats_explain")
+            return plan
+        except Exception as e:
+            explain_cursor.execute("ROLLBACK TO SAVEPOINT query_stats_explain")
+            logger.debug(f"EXPLAIN for slow query failed: {e}")
+            return None
+    except Exception as e:
+        logger.debug(f"Could not explain slow query: {e}")
+        return None
+    finally:
+        explain_cursor.close()
+
+
+def install_query_instrumentation(engine: Engine) -> None:
+    """Register the timing listeners on ``engine`` (idempotent)."""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
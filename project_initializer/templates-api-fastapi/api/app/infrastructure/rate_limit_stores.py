@@ -0,0 +1,195 @@
+"""Shared counter stores for ``LocalFastPathLimiter``.
+
+Both stores keep the same sliding-window counter as ``SlidingWindowCounter``
+(current and previous fixed-window counts per key), but in state every worker
+sees:
+
+* ``RedisWindowStore`` for several hosts or replicas. A Lua script
+  reads, decides and increments atomically on the Redis clock, and each sync
+  sends all of its items in one pipeline.
+* ``SharedMemoryWindowStore`` for several workers on one host. It uses a
+  fixed-size table in an ``mmap``-ed tmpfs file, with a byte-range lock per
+  bucket. There is no server to run.
+
+Neither is imported unless ``rate_limit_backend`` selects it.
+"""
+
+import hashlib
+import logging
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import List, Sequence
+
+from app.infrastructure.rate_limiter import SyncItem, WindowState
+
+logger = logging.getLogger(__name__)
+
+
+# KEYS[1]: key prefix; ARGV: window, limit, pending hits, decide one more (0/1).
+# The window index comes from the Redis clock, so replicas whose clocks drift
+# still agree on window boundaries. The prefix carries a {hash tag}, so both
+# window keys land in the same Redis Cluster slot.
+SLIDING_WINDOW_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local pending = tonumber(ARGV[3])
+local index = math.floor(now / window)
+local offset = now - index * window
+local current_key = KEYS[1] .. ':' .. string.format('%d', index)
+local previous_key = KEYS[1] .. ':' .. string.format('%d', index - 1)
+local current = tonumber(redis.call('GET', current_key) or '0') + pending
+local previous = tonumber(redis.call('GET', previous_key) or '0')
+local allowed = 0
+if ARGV[4] == '1' and previous * (1 - offset / window) + current + 1 <= limit then
+    allowed = 1
+end
+if pending + allowed > 0 then
+    redis.call('INCRBY', current_key, pending + allowed)
+    redis.call('EXPIRE', current_key, math.ceil(window * 2))
+end
+return {allowed, current, previous, tostring(offset)}
+"""
+
+
+class RedisWindowStore:
+    """Sliding-window counters in Redis, one pipelined round trip per sync."""
+
+    def __init__(self, url: str, namespace: str, limit: int, window: float):
+        # Imported here: redis is only needed when this backend is selected.
+        import redis.asyncio as redis
+
+        self.limit = limit
+        self.window = window
+        self.namespace = namespace
+        self._client = redis.from_url(url)
+        self._script = self._client.register_script(SLIDING_WINDOW_LUA)
+
+    def _key(self, key: str) -> str:
+        return f"ratelimit:{{{self.namespace}:{key}}}"
+
+    async def apply(self, items: Sequence[SyncItem]) -> List[WindowState]:
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key, pending, check in items:
+                await self._script(
+                    keys=[self._key(key)],
+                    args=[self.window, self.limit, pending, int(check)],
+                    client=pipe,
+                )
+            replies = await pipe.execute()
+        return [
+            (bool(allowed), int(current), int(previous), float(offset))
+            for allowed, current, previous, offset in replies
+        ]
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class SharedMemoryWindowStore:
+    """Sliding-window counters in a memory-mapped file shared by local workers.
+
+    The table is set-associative: a key hashes to one bucket of ``SLOTS`` slots.
+    When the bucket is full, the slot with the oldest window is reused, so the
+    file has a fixed size however many clients show up. Each bucket is guarded
+    by an ``fcntl`` byte-range lock, which serialises processes, plus a
+    thread lock for threads inside one process. Hits are decided in
+    microseconds, so ``apply`` runs inline on the event loop.
+    """
+
+    SLOTS = 4
+    # key hash (0 = empty), window index, current count, previous count
+    _slot = struct.Struct("<QqII")
+
+    def __init__(
+        self, path: str, namespace: str, limit: int, window: float, buckets: int = 4096
+    ):
+        # Imported here: fcntl is POSIX-only and this backend is opt-in.
+        import fcntl
+        import mmap
+
+        self._fcntl = fcntl
+        self.limit = limit
+        self.window = window
+        self.namespace = namespace
+        self.buckets = buckets
+        self._bucket_size = self._slot.size * self.SLOTS
+
+        if not os.path.isdir(os.path.dirname(path) or "."):
+            # No /dev/shm (macOS, some containers): fall back to the temp dir.
+            path = os.path.join(tempfile.gettempdir(), os.path.basename(path))
+        self.path = path
+        size = self._bucket_size * buckets
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.lockf(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN)
+        self._map = mmap.mmap(self._fd, size)
+        self._lock = threading.Lock()
+
+    def _hash(self, key: str) -> int:
+        digest = hashlib.blake2b(
+            f"{self.namespace}:{key}".encode(), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, "little") or 1
+
+    async def apply(self, items: Sequence[SyncItem]) -> List[WindowState]:
+        now = time.time()
+        index, offset = divmod(now, self.window)
+        index = int(index)
+        weight = 1 - offset / self.window
+        results = []
+        for key, pending, check in items:
+            key_hash = self._hash(key)
+            start = (key_hash % self.buckets) * self._bucket_size
+            with self._lock:
+                self._fcntl.lockf(
+                    self._fd, self._fcntl.LOCK_EX, self._bucket_size, start
+                )
+                try:
+                    position, current, previous = self._find(start, key_hash, index)
+                    current += pending
+                    allowed = check and previous * weight + current + 1 <= self.limit
+                    self._slot.pack_into(
+                        self._map,
+                        position,
+                        key_hash,
+                        index,
+                        current + int(allowed),
+                        previous,
+                    )
+                finally:
+                    self._fcntl.lockf(
+                        self._fd, self._fcntl.LOCK_UN, self._bucket_size, start
+                    )
+            results.append((allowed, current, previous, offset))
+        return results
+
+    def _find(self, start: int, key_hash: int, index: int):
+        """Slot position for ``key_hash`` and its counts rolled to ``index``."""
+        oldest_position, oldest_index = start, None
+        for position in range(start, start + self._bucket_size, self._slot.size):
+            slot_hash, slot_index, current, previous = self._slot.unpack_from(
+                self._map, position
+            )
+            if slot_hash == key_hash:
+                if slot_index == index:
+                    return position, current, previous
+                # Roll forward, as in SlidingWindowCounter.hit
+                return position, 0, current if slot_index == index - 1 else 0
+            if slot_hash == 0:
+                slot_index = -1  # empty slots are reused first
+            if oldest_index is None or slot_index < oldest_index:
+                oldest_position, oldest_index = position, slot_index
+        return oldest_position, 0, 0
+
+    def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
@@ -0,0 +1,370 @@
+"""Rate-limiting engine shared by ``RateLimitingMiddleware`` and ``deps.RateLimiter``.
+
+Sliding-window counter: each key holds the request count of the current fixed
+window and of the previous one. The previous count is weighted by how much of
+the previous window still overlaps the sliding window:
+
+    estimate = previous * (1 - elapsed / window) + current
+
+A hit is O(1): a few integer updates on one entry. There are no per-request
+timestamp lists to rebuild. Keys live in an LRU bounded at ``max_keys`` (the
+least recently seen client is evicted first), and entries whose windows have
+both expired are swept about once per ``window``, so memory stays flat however
+many distinct IPs show up.
+
+That counter is per process. With ``rate_limit_backend`` set to
+``shared_memory`` (all workers on one host) or ``redis`` (every replica), the
+counts live in a ``WindowStore`` (``rate_limit_stores``) instead, behind
+``LocalFastPathLimiter``. The limiter answers clients far below their limit
+from a local cache and only reaches the store for keys that are near the limit
+or due a sync. ``create_rate_limiter`` picks the backend.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Protocol, Sequence, Tuple
+
+from app.infrastructure.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Outcome of one hit, with everything the ``X-RateLimit-*`` headers need."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float  # seconds until the current fixed window rolls over
+    retry_after: float = 0.0  # seconds until a denied key may retry
+
+    @property
+    def retry_after_seconds(self) -> int:
+        """``retry_after`` rounded up for the ``Retry-After`` header (at least 1)."""
+        return max(1, math.ceil(self.retry_after))
+
+
+def window_decision(
+    limit: int,
+    window: float,
+    offset: float,
+    current: int,
+    previous: int,
+    allowed: bool,
+) -> RateLimitDecision:
+    """Build the decision for one hit from the counts seen *before* it.
+
+    ``offset`` is the time elapsed in the current fixed window. Shared by every
+    backend, so headers and ``Retry-After`` agree whatever holds the counters.
+    """
+    estimate = previous * (1 - offset / window) + current
+    reset_after = window - offset
+    if allowed:
+        return RateLimitDecision(
+            allowed=True,
+            limit=limit,
+            remaining=max(0, math.floor(limit - estimate - 1)),
+            reset_after=reset_after,
+        )
+    # Seconds until ``estimate + 1 <= limit`` holds again, ignoring new hits.
+    if current + 1 > limit:
+        # The current window alone is full. Next window it becomes the previous
+        # one and must decay to ``limit - 1``.
+        decay = max(0.0, 1 - (limit - 1) / current) if current else 0.0
+        retry_after = reset_after + window * decay
+    else:
+        # Only the previous window's weight has to decay.
+        needed = window * (1 - (limit - 1 - current) / previous)
+        retry_after = max(needed - offset, 0.0)
+    return RateLimitDecision(
+        allowed=False,
+        limit=limit,
+        remaining=0,
+        reset_after=reset_after,
+        retry_after=retry_after,
+    )
+
+
+class SlidingWindowCounter:
+    """In-process sliding-window-counter limiter (thread-safe, O(1) per hit)."""
+
+    def __init__(
+        self,
+        limit: int,
+        window: float,
+        max_keys: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self._clock = clock
+        # key -> [window_index, current_count, previous_count]
+        self._entries: "OrderedDict[str, List[int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._next_sweep = clock() + window
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def hit(self, key: str) -> RateLimitDecision:
+        """Count one request for ``key`` unless that would exceed the limit."""
+        now = self._clock()
+        index, offset = divmod(now, self.window)
+        index = int(index)
+        weight = 1 - offset / self.window
+
+        with self._lock:
+            if now >= self._next_sweep:
+                self._sweep(index)
+                self._next_sweep = now + self.window
+
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = [index, 0, 0]
+                self._entries[key] = entry
+                if len(self._entries) > self.max_keys:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(key)
+                if entry[0] != index:
+                    # Roll forward: the current window becomes the previous one,
+                    # or both are stale after a gap of two or more windows.
+                    entry[2] = entry[1] if entry[0] == index - 1 else 0
+                    entry[1] = 0
+                    entry[0] = index
+
+            current, previous = entry[1], entry[2]
+            allowed = previous * weight + current + 1 <= self.limit
+            if allowed:
+                entry[1] = current + 1
+            return window_decision(
+                self.limit, self.window, offset, current, previous, allowed
+            )
+
+    async def check(self, key: str) -> RateLimitDecision:
+        """``hit`` for async callers (the ``RateLimitBackend`` interface)."""
+        return self.hit(key)
+
+    def _sweep(self, index: int) -> None:
+        # Both counts are irrelevant once the entry is two windows old. LRU
+        # order means the stalest entries are at the front, so stop at the
+        # first live one.
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry[0] >= index - 1:
+                break
+            del self._entries[key]
+
+    def sweep(self) -> None:
+        """Drop every fully expired entry now (normally done about once per window)."""
+        with self._lock:
+            self._sweep(int(self._clock() // self.window))
+
+
+class RateLimitBackend(Protocol):
+    """What the middleware and ``deps.RateLimiter`` call, whatever the backend."""
+
+    async def check(self, key: str) -> RateLimitDecision: ...
+
+
+# One sync request: (key, hits already allowed locally, whether to decide a new hit)
+SyncItem = Tuple[str, int, bool]
+# Store reply: (allowed, current count before the new hit, previous count, offset)
+WindowState = Tuple[bool, int, int, float]
+
+
+class WindowStore(Protocol):
+    """Shared sliding-window counters, updated atomically per key."""
+
+    limit: int
+    window: float
+
+    async def apply(self, items: Sequence[SyncItem]) -> List[WindowState]:
+        """Add each item's pending hits and, where asked, decide one more hit.
+
+        All items go out in one round trip (one Redis pipeline).
+        """
+        ...
+
+
+class _LocalState:
+    __slots__ = ("synced_at", "remaining", "pending", "reset_at", "denied_until")
+
+    def __init__(self):
+        self.synced_at = 0.0
+        self.remaining = 0
+        self.pending = 0
+        self.reset_at = 0.0
+        self.denied_until = 0.0
+
+
+class LocalFastPathLimiter:
+    """Shared-store limiter that skips the round trip for clients far below limit.
+
+    After each sync a key may spend ``local_fraction`` of its reported
+    ``remaining`` locally, for at most ``sync_interval`` seconds. Those hits are
+    allowed at once and sent with the key's next sync, or batched into another
+    key's sync pipeline once they are stale. A denied key is refused locally
+    until its ``Retry-After`` passes. With N processes, a client can overshoot
+    its limit by at most about ``N * local_fraction`` of what it had left.
+    If the store is unreachable the limiter fails open and logs a warning.
+    """
+
+    # Stale pending counts flushed alongside one sync, at most
+    MAX_FLUSH_BATCH = 64
+
+    def __init__(
+        self,
+        store: WindowStore,
+        max_keys: int = 10_000,
+        sync_interval: float = 1.0,
+        local_fraction: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.store = store
+        self.max_keys = max_keys
+        self.sync_interval = sync_interval
+        self.local_fraction = local_fraction
+        self._clock = clock
+        self._local: "OrderedDict[str, _LocalState]" = OrderedDict()
+        self._store_down_logged_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+    async def check(self, key: str) -> RateLimitDecision:
+        now = self._clock()
+        state = self._local.get(key)
+        if state is None:
+            state = _LocalState()
+            self._local[key] = state
+            if len(self._local) > self.max_keys:
+                self._local.popitem(last=False)
+        else:
+            self._local.move_to_end(key)
+
+        decision = self._decide_locally(state, now)
+        if decision is not None:
+            return decision
+
+        items: List[SyncItem] = [(key, state.pending, True)]
+        flushed = self._stale_pending(now, exclude=key)
+        items.extend(
+            (other, pending_state.pending, False) for other, pending_state in flushed
+        )
+        try:
+            results = await self.store.apply(items)
+        except Exception as e:
+            return self._fail_open(state, now, e)
+
+        for _, pending_state in flushed:
+            pending_state.pending = 0
+        allowed, current, previous, offset = results[0]
+        decision = window_decision(
+            self.store.limit, self.store.window, offset, current, previous, allowed
+        )
+        state.pending = 0
+        state.synced_at = now
+        state.remaining = decision.remaining
+        state.reset_at = now + decision.reset_after
+        state.denied_until = 0.0 if allowed else now + decision.retry_after
+        return decision
+
+    def _decide_locally(
+        self, state: _LocalState, now: float
+    ) -> Optional[RateLimitDecision]:
+        if now < state.denied_until:
+            return RateLimitDecision(
+                allowed=False,
+                limit=self.store.limit,
+                remaining=0,
+                reset_after=max(0.0, state.reset_at - now),
+                retry_after=state.denied_until - now,
+            )
+        fresh = now - state.synced_at < self.sync_interval
+        if fresh and state.pending + 1 <= state.remaining * self.local_fraction:
+            state.pending += 1
+            return RateLimitDecision(
+                allowed=True,
+                limit=self.store.limit,
+                remaining=state.remaining - state.pending,
+                reset_after=max(0.0, state.reset_at - now),
+            )
+        return None
+
+    def _stale_pending(self, now: float, exclude: str) -> List[Tuple[str, _LocalState]]:
+        # The least recently used keys sit at the front; look no further than
+        # one batch so the hot path stays bounded.
+        stale = []
+        for index, (other, state) in enumerate(self._local.items()):
+            if index >= self.MAX_FLUSH_BATCH:
+                break
+            if (
+                other != exclude
+                and state.pending
+                and now - state.synced_at >= self.sync_interval
+            ):
+                stale.append((other, state))
+        return stale
+
+    def _fail_open(
+        self, state: _LocalState, now: float, error: Exception
+    ) -> RateLimitDecision:
+        state.pending += 1
+        if self._store_down_logged_at is None or now - self._store_down_logged_at >= 60:
+            self._store_down_logged_at = now
+            logger.warning(f"Rate-limit store unavailable, allowing requests: {error}")
+        return RateLimitDecision(
+            allowed=True,
+            limit=self.store.limit,
+            remaining=self.store.limit,
+            reset_after=self.store.window,
+        )
+
+
+def create_rate_limiter(
+    limit: int, window: float, namespace: str, max_keys: Optional[int] = None
+) -> RateLimitBackend:
+    """Build the limiter selected by ``settings.rate_limit_backend``.
+
+    ``namespace`` separates budgets sharing one store (the middleware vs. each
+    ``deps.RateLimiter``); it must be the same in every process. ``max_keys``
+    defaults to ``settings.rate_limit_max_keys``.
+    """
+    backend = settings.rate_limit_backend
+    if max_keys is None:
+        max_keys = settings.rate_limit_max_keys
+    if backend == "memory":
+        return SlidingWindowCounter(limit, window, max_keys=max_keys)
+
+    # Imported here so the default memory backend needs neither redis nor fcntl.
+    from app.infrastructure.rate_limit_stores import (
+        RedisWindowStore,
+        SharedMemoryWindowStore,
+    )
+
+    if backend == "redis":
+        store: WindowStore = RedisWindowStore(
+            settings.redis_url, namespace, limit, window
+        )
+    elif backend == "shared_memory":
+        store = SharedMemoryWindowStore(
+            settings.rate_limit_shm_path, namespace, limit, window
+        )
+    else:
+        raise ValueError(
+            f"Unknown rate_limit_backend {backend!r}, "
+            "expected 'memory', 'shared_memory' or 'redis'"
+        )
+    return LocalFastPathLimiter(
+        store,
+        max_keys=max_keys,
+        sync_interval=settings.rate_limit_sync_interval,
+        local_fraction=settings.rate_limit_local_fraction,
+    )
@@ -7,7 +7,7 @@ Uses SQLAlchemy 2.0+ synchronous patterns with proper type hints.
 """
 
 from typing import Generic, TypeVar, Optional, Sequence, Any, Type
-from sqlalchemy import select, func
+from sqlalchemy import Row, func, inspect, select
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
@@ -70,19 +70,53 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         desc: bool = True,
     ) -> Sequence[ModelType]:
         """Get multiple records with pagination."""
-        stmt = select(self.model)
-
-        if order_by and hasattr(self.model, order_by):
-            column = getattr(self.model, order_by)
-            stmt = stmt.order_by(column.desc() if desc else column.asc())
-        elif hasattr(self.model, "created_at"):
-            column = getattr(self.model, "created_at")
-            stmt = stmt.order_by(column.desc() if desc else column.asc())
-
-        stmt = stmt.offset(skip).limit(limit)
-        result = self.session.execute(stmt)
+        stmt = self._ordered(select(self.model), order_by, desc)
+        result = self.session.execute(stmt.offset(skip).limit(limit))
         return result.scalars().all()
 
+    def get_multi_rows(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        desc: bool = True,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Sequence[Row]:
+        """Get a page as read-only ``Row`` tuples instead of model instances.
+
+        Selects the mapped columns (or only ``columns``, for a sparse
+        fieldset), so no ORM instance is built, put in the identity map or
+        expired on commit. Attributes read like the model's (``row.name``),
+        so use this for read-only endpoints that only serialize their rows.
+        """
+        stmt = self._ordered(select(*self._columns(columns)), order_by, desc)
+        result = self.session.execute(stmt.offset(skip).limit(limit))
+        return result.all()
+
+    def get_row(
+        self, id: Any, columns: Optional[Sequence[str]] = None
+    ) -> Optional[Row]:
+        """Get one record as a read-only ``Row`` of ``columns`` (default: all)."""
+        stmt = select(*self._columns(columns)).where(getattr(self.model, "id") == id)
+        return self.session.execute(stmt).one_or_none()
+
+    def _columns(self, names: Optional[Sequence[str]]) -> list:
+        """Mapped column attributes to select: ``names``, or every column."""
+        if names is None:
+            names = [c.key for c in inspect(self.model).column_attrs]
+        return [getattr(self.model, name) for name in names]
+
+    def _ordered(self, stmt: Any, order_by: Optional[str], desc: bool) -> Any:
+        """Apply the order_by column (or created_at fallback) to the statement."""
+        name = order_by if order_by and hasattr(self.model, order_by) else None
+        if name is None and hasattr(self.model, "created_at"):
+            name = "created_at"
+        if name is None:
+            return stmt
+        column = getattr(self.model, name)
+        return stmt.order_by(column.desc() if desc else column.asc())
+
     def get_all(self) -> Sequence[ModelType]:
         """Get all records (use with caution on large tables)."""
         stmt = select(self.model)
@@ -1,14 +1,145 @@
-"""Item repository for data access over the sync Session."""
+"""Item repository for data access over the sync Session.
 
+``search_statement`` builds the ranked, keyset-paginated item search, and the
+sync and async repositories both execute it. A row matches when ``q`` is a
+substring of ``name`` or ``description`` (``ILIKE '%q%'``, with ``%`` and ``_``
+escaped). On PostgreSQL that filter is answered by the ``pg_trgm`` GIN indexes
+(migration ``0003_item_search``). The rank is ``word_similarity``, with name
+hits weighted above description hits. Other dialects (the SQLite test DB)
+rank with a ``CASE``: exact name, then name prefix, then name substring, then
+description only.
+
+Pages are ordered by ``(rank DESC, id)`` and continue after the last row's
+``(rank, id)``. There is no OFFSET, so deep pages cost as much as the first.
+On PostgreSQL the rank is cast to double precision, so the value a client
+sends back compares exactly.
+"""
+
+import csv
+import io
+import uuid
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from sqlalchemy import Double, Select, and_, case, cast, func, insert, or_, select, text
 from sqlalchemy.orm import Session
 
 from app.infrastructure.orm.item import Item
 from app.infrastructure.repositories.base import BaseRepository
 from app.api.schemas.item import ItemCreate, ItemUpdate
 
+# Columns loaded by a bulk import; created_at/updated_at take their server defaults.
+_IMPORT_COLUMNS = ("id", "name", "description", "price", "is_active")
+_STAGING_TABLE = "items_import_staging"
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_statement(
+    dialect: str,
+    q: str,
+    limit: int,
+    after: Optional[Tuple[float, str]] = None,
+) -> Select:
+    """Items matching ``q``, best first, starting after the ``(rank, id)`` key."""
+    needle = _escape_like(q)
+    name_hit = Item.name.ilike(f"%{needle}%", escape="\\")
+    if dialect == "postgresql":
+        similarity = func.word_similarity(q, Item.name, type_=Double())
+        described = func.word_similarity(
+            q, func.coalesce(Item.description, ""), type_=Double()
+        )
+        rank = cast(similarity + described * 0.5, Double())
+    else:
+        rank = case(
+            (func.lower(Item.name) == q.lower(), 3.0),
+            (Item.name.ilike(f"{needle}%", escape="\\"), 2.0),
+            (name_hit, 1.0),
+            else_=0.5,
+        )
+    ranked = rank.label("rank")
+    stmt = select(*Item.__table__.columns, ranked).where(
+        or_(name_hit, Item.description.ilike(f"%{needle}%", escape="\\"))
+    )
+    if after is not None:
+        after_rank, after_id = after
+        stmt = stmt.where(
+            or_(rank < after_rank, and_(rank == after_rank, Item.id > after_id))
+        )
+    return stmt.order_by(ranked.desc(), Item.id).limit(limit)
+
 
 class ItemRepository(BaseRepository[Item, ItemCreate, ItemUpdate]):
     """Repository for Item-specific database operations."""
 
     def __init__(self, session: Session):
         super().__init__(Item, session)
+
+    def search(
+        self, q: str, limit: int = 20, after: Optional[Tuple[float, str]] = None
+    ) -> Sequence[Any]:
+        """Ranked substring search as read-only rows with a ``rank`` column."""
+        dialect = self.session.get_bind().dialect.name
+        return self.session.execute(search_statement(dialect, q, limit, after)).all()
+
+    def bulk_import(self, batches: Iterable[Sequence[Dict[str, Any]]]) -> int:
+        """Load pre-validated item rows and return how many were inserted.
+
+        On PostgreSQL each batch is streamed with COPY (psycopg2 ``copy_expert``
+        or psycopg 3 ``cursor.copy``) into a transaction-scoped ``TEMP`` staging
+        table, then moved into ``items`` with one ``INSERT ... SELECT`` — COPY
+        skips per-row statement parsing and ORM bookkeeping, which is what makes
+        million-row loads take seconds. Other dialects (the SQLite test DB) fall
+        back to a Core ``executemany`` insert. Flush-only like every other write:
+        the service owns the commit.
+        """
+        if self.session.get_bind().dialect.name != "postgresql":
+            inserted = 0
+            for batch in batches:
+                rows = [self._with_id(row) for row in batch]
+                if rows:
+                    self.session.execute(insert(Item), rows)
+                    inserted += len(rows)
+            return inserted
+
+        columns = ", ".join(_IMPORT_COLUMNS)
+        self.session.execute(
+            text(
+                f"CREATE TEMP TABLE {_STAGING_TABLE} "
+                f"(LIKE {Item.__tablename__} INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+        )
+        # The session's own DBAPI connection, so COPY runs in the same transaction.
+        dbapi_connection = self.session.connection().connection.dbapi_connection
+        copy_sql = f"COPY {_STAGING_TABLE} ({columns}) FROM STDIN WITH (FORMAT csv)"
+        psycopg3 = self.session.get_bind().dialect.driver == "psycopg"
+        with dbapi_connection.cursor() as cursor:
+            for batch in batches:
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                for row in batch:
+                    row = self._with_id(row)
+                    writer.writerow(row.get(column) for column in _IMPORT_COLUMNS)
+                if psycopg3:
+                    with cursor.copy(copy_sql) as copy:
+                        copy.write(buffer.getvalue())
+                else:
+                    buffer.seek(0)
+                    cursor.copy_expert(copy_sql, buffer)
+
+        result = self.session.execute(
+            text(
+                f"INSERT INTO {Item.__tablename__} ({columns}) "
+                f"SELECT {columns} FROM {_STAGING_TABLE} "
+                "ON CONFLICT (id) DO NOTHING"
+            )
+        )
+        return result.rowcount
+
+    @staticmethod
+    def _with_id(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the row with a generated UUID string id (COPY bypasses ORM defaults)."""
+        if row.get("id"):
+            return row
+        return {**row, "id": str(uuid.uuid4())}
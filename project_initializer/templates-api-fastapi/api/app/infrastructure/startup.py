@@ -0,0 +1,137 @@
+"""Startup stage run by the FastAPI lifespan.
+
+A new replica used to serve its first requests slowly: it ran ``create_all``
+over a schema ``alembic upgrade head`` had just migrated, health-checked a
+connection it had just tested, and left the remaining ``pool_size - 1``
+connections and the BAML client to be set up by the first requests.
+
+``run_startup`` keeps only the work that pays off:
+
+1. size the threadpool;
+2. ``init_db`` (``create_all`` skipped when the schema is at alembic head);
+3. open ``pool_size`` connections in parallel and build one BAML request
+   offline, the two running concurrently.
+
+Every step is timed; the timings are logged and kept on ``app.state``.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Awaitable, Dict, Iterator
+
+import anyio
+from sqlalchemy import Engine
+
+from baml_client.async_client import b as baml_async_client
+
+from app.infrastructure.admission import configure_threadpool
+from app.infrastructure.database import database_manager, init_db
+from app.infrastructure.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimings:
+    """Wall-clock duration of each startup step, in milliseconds."""
+
+    def __init__(self):
+        self.steps: Dict[str, float] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps[name] = round((time.perf_counter() - start) * 1000, 1)
+
+    async def timed(self, name: str, awaitable: Awaitable[Any]) -> Any:
+        """Await ``awaitable`` as step ``name`` (lets steps run under gather)."""
+        with self.step(name):
+            return await awaitable
+
+    @property
+    def total_ms(self) -> float:
+        # Wall clock, not the sum: the warm-up steps overlap.
+        return round((time.perf_counter() - self._started) * 1000, 1)
+
+    def summary(self) -> str:
+        return ", ".join(f"{name}={ms}ms" for name, ms in self.steps.items())
+
+
+def warm_pool(engine: Engine, count: int) -> int:
+    """Open ``count`` pooled connections at once, then return them to the pool.
+
+    The checkouts run in parallel threads and are all held until the last one
+    is open, so the pool has to create distinct connections and their connects
+    (TCP, TLS, auth) overlap. Returns how many connections were opened.
+    """
+    if count <= 0:
+        return 0
+    with ThreadPoolExecutor(
+        max_workers=count, thread_name_prefix="pool-warmup"
+    ) as executor:
+        futures = [executor.submit(engine.raw_connection) for _ in range(count)]
+
+    connections = []
+    for future in futures:
+        try:
+            connections.append(future.result())
+        except Exception as e:
+            logger.warning(f"Pool warm-up connection failed: {e}")
+    for connection in connections:
+        connection.close()
+    return len(connections)
+
+
+async def warm_baml() -> bool:
+    """Build one BAML request offline so the first chat does not pay for it.
+
+    ``request.Chat`` renders the prompt and resolves the client (provider, base
+    URL, API-key env vars) without calling the LLM, so a misconfigured client
+    is also reported at boot instead of on the first request.
+    """
+    try:
+        await baml_async_client.request.Chat(user_question="ping")
+    except Exception as e:
+        # BAML errors append a Rust backtrace; keep only the message
+        message = " ".join(str(e).split("Stack backtrace")[0].split())
+        logger.warning(f"BAML warm-up failed: {message}")
+        return False
+    return True
+
+
+async def run_startup() -> StartupTimings:
+    """Run the startup steps and return their timings.
+
+    ``init_db`` raises outside development, as before; warm-up failures are
+    only logged.
+    """
+    timings = StartupTimings()
+
+    # Size the sync-handler threadpool (DB admission caps DB use within it)
+    with timings.step("threadpool"):
+        configure_threadpool()
+
+    with timings.step("database"):
+        await anyio.to_thread.run_sync(init_db)
+
+    warmups = []
+    if settings.startup_warm_pool and database_manager.is_initialized:
+        warmups.append(
+            timings.timed(
+                "pool_warmup",
+                anyio.to_thread.run_sync(
+                    warm_pool, database_manager.engine, settings.database_pool_size
+                ),
+            )
+        )
+    if settings.startup_warm_baml:
+        warmups.append(timings.timed("baml_warmup", warm_baml()))
+    await asyncio.gather(*warmups)
+
+    return timings
@@ -0,0 +1,358 @@
+"""Request tracing: spans for the request, dependencies, SQL and BAML calls.
+
+A small tracer following the OpenTelemetry data model and W3C Trace Context,
+with no SDK dependency. It is off unless ``tracing_enabled`` is set:
+
+* ``TracingMiddleware`` (``app.api.middleware.tracing``) opens a server span
+  per request. A valid incoming ``traceparent`` makes it part of the caller's
+  trace (and carries the caller's sampling decision), and the response gets
+  this span's ``traceparent`` back. The request id (``x-request-id``, see
+  ``LoggingMiddleware``) is recorded as ``http.request_id``.
+* ``traced(name)`` wraps a dependency such as ``get_current_user``.
+  ``get_db`` times its own session setup.
+* Every SQL statement becomes a ``db.query`` span, emitted from the
+  ``query_stats`` cursor listeners, so sync and async engines are covered.
+* BAML calls are turned into ``baml.<Function>`` spans after the fact from the
+  request's ``Collector``, using the timings BAML measured itself.
+
+The current span lives in a ``ContextVar``, so sync handlers and dependencies
+in the threadpool nest under the request span. Finished spans go to the
+configured exporter: ``otlp_file`` (OTLP/JSON lines written by a background
+thread), ``memory`` (for tests), or ``module:factory`` for your own.
+"""
+
+import functools
+import importlib
+import inspect
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol, Tuple
+
+from app.infrastructure.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+@dataclass
+class Span:
+    """One timed operation; ids are lowercase hex as in ``traceparent``."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    kind: str = "internal"  # "server" for the request span
+    start_ns: int = 0
+    end_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None: ...
+
+    def shutdown(self) -> None: ...
+
+
+class InMemorySpanExporter:
+    """Keeps finished spans in a list (tests, debugging)."""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def shutdown(self) -> None:
+        pass
+
+    def by_name(self, name: str) -> List[Span]:
+        return [span for span in self.spans if span.name == name]
+
+
+class OTLPFileExporter:
+    """Append spans as OTLP/JSON ``resourceSpans`` lines, one span per line.
+
+    Writes happen on a daemon thread, so ending a span never blocks the loop.
+    The file can be replayed into any OTLP collector (``otelcol`` file receiver).
+    """
+
+    _KINDS = {"internal": 1, "server": 2, "client": 3}
+
+    def __init__(self, path: str, service_name: str):
+        self.path = path
+        self.service_name = service_name
+        self._queue: "queue.SimpleQueue[Optional[Span]]" = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._drain, name="otlp-file-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def export(self, span: Span) -> None:
+        self._queue.put(span)
+
+    def shutdown(self) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+    def _drain(self) -> None:
+        with open(self.path, "a", encoding="utf-8") as out:
+            while True:
+                span = self._queue.get()
+                if span is None:
+                    return
+                out.write(json.dumps(self._encode(span), default=str) + "\n")
+                if self._queue.empty():
+                    out.flush()
+
+    def _encode(self, span: Span) -> Dict[str, Any]:
+        otlp_span = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": self._KINDS.get(span.kind, 1),
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in span.attributes.items()
+            ],
+            "status": (
+                {"code": 2, "message": span.error} if span.error else {"code": 1}
+            ),
+        }
+        if span.parent_id:
+            otlp_span["parentSpanId"] = span.parent_id
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": {"stringValue": self.service_name},
+                            }
+                        ]
+                    },
+                    "scopeSpans": [
+                        {"scope": {"name": "app.tracing"}, "spans": [otlp_span]}
+                    ],
+                }
+            ]
+        }
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def build_exporter(name: str) -> SpanExporter:
+    """Exporter for ``settings.tracing_exporter``."""
+    if name == "otlp_file":
+        return OTLPFileExporter(settings.tracing_file_path, settings.project_name)
+    if name == "memory":
+        return InMemorySpanExporter()
+    if ":" in name:
+        module_name, _, factory = name.partition(":")
+        return getattr(importlib.import_module(module_name), factory)()
+    raise ValueError(
+        f"Unknown tracing_exporter {name!r}, "
+        "expected 'otlp_file', 'memory' or 'module:factory'"
+    )
+
+
+class Tracer:
+    """Creates spans and hands finished ones to the exporter."""
+
+    def __init__(self, exporter: Optional[SpanExporter] = None):
+        self.exporter = exporter
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def configure(self, exporter: Optional[SpanExporter]) -> None:
+        """Swap the exporter (None disables tracing); the old one is shut down."""
+        if self.exporter is not None and self.exporter is not exporter:
+            self.exporter.shutdown()
+        self.exporter = exporter
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        kind: str = "internal",
+        attributes: Optional[Dict[str, Any]] = None,
+        remote_parent: Optional[Tuple[str, str]] = None,
+    ) -> Iterator[Optional[Span]]:
+        """Time the block as a child of the current span.
+
+        Yields None (and records nothing) when tracing is off or the trace is
+        not sampled. ``remote_parent`` is (trace_id, span_id) from
+        ``traceparent``.
+        """
+        parent = _current_span.get()
+        if not self.enabled or (parent is None and kind != "server"):
+            yield None
+            return
+        if parent is not None:
+            trace_id, parent_id = parent.trace_id, parent.span_id
+        elif remote_parent is not None:
+            trace_id, parent_id = remote_parent
+        elif random.random() < settings.tracing_sample_rate:
+            trace_id, parent_id = os.urandom(16).hex(), None
+        else:
+            yield None
+            return
+
+        span = Span(
+            name=name,
+            trace_id=trace_id,
+            span_id=os.urandom(8).hex(),
+            parent_id=parent_id,
+            kind=kind,
+            start_ns=time.time_ns(),
+            attributes=dict(attributes or {}),
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_ns = time.time_ns()
+            self.exporter.export(span)
+
+    def record(
+        self,
+        name: str,
+        start_ns: int,
+        end_ns: int,
+        attributes: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Export an already-finished child of the current span (if any)."""
+        parent = _current_span.get()
+        if parent is None or self.exporter is None:
+            return
+        self.exporter.export(
+            Span(
+                name=name,
+                trace_id=parent.trace_id,
+                span_id=os.urandom(8).hex(),
+                parent_id=parent.span_id,
+                start_ns=start_ns,
+                end_ns=end_ns,
+                attributes=attributes or {},
+                error=error,
+            )
+        )
+
+
+tracer = Tracer()
+
+
+def current_span() -> Optional[Span]:
+    """Return the span in progress in this context, or None."""
+    return _current_span.get()
+
+
+def parse_traceparent(value: str) -> Optional[Tuple[str, str, bool]]:
+    """(trace_id, parent span id, sampled) from a W3C ``traceparent``, or None."""
+    parts = value.strip().split("-")
+    if len(parts) < 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    version, trace_id, span_id, flags = parts[:4]
+    try:
+        int(trace_id, 16), int(span_id, 16)
+        sampled = bool(int(flags, 16) & 1)
+    except ValueError:
+        return None
+    if version == "ff" or trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    return trace_id, span_id, sampled
+
+
+def traced(name: str) -> Callable:
+    """Wrap a sync or async dependency so each call is a span named ``name``.
+
+    ``functools.wraps`` keeps the signature, so FastAPI still resolves the
+    wrapped function's own parameters and sub-dependencies.
+    """
+
+    def decorate(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with tracer.span(name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with tracer.span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def record_baml_spans(collector) -> None:
+    """One ``baml.<Function>`` span per call in a BAML ``Collector``."""
+    if current_span() is None:
+        return
+    for log in collector.logs:
+        duration_ms = log.timing.duration_ms
+        if duration_ms is None:
+            continue
+        start_ns = log.timing.start_time_utc_ms * 1_000_000
+        call = log.selected_call
+        usage = log.usage
+        tracer.record(
+            f"baml.{log.function_name}",
+            start_ns,
+            start_ns + duration_ms * 1_000_000,
+            attributes={
+                "llm.client": call.client_name if call is not None else "none",
+                "llm.call_type": log.log_type,
+                "llm.input_tokens": usage.input_tokens or 0,
+                "llm.output_tokens": usage.output_tokens or 0,
+            },
+            error=None if call is not None else "no successful LLM call",
+        )
+
+
+def configure_tracing() -> None:
+    """Install the exporter from settings when ``tracing_enabled`` is on."""
+    if settings.tracing_enabled:
+        tracer.configure(build_exporter(settings.tracing_exporter))
+        logger.info(f"Tracing enabled ({settings.tracing_exporter})")
@@ -17,27 +17,36 @@ from app.infrastructure.config import load_configuration
 
 load_configuration()
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import FileResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 
 from app.infrastructure.settings import settings
-from app.infrastructure.database import database_manager, init_db, close_db
+from app.infrastructure.database import database_manager, close_db
+from app.infrastructure.startup import run_startup
+from app.infrastructure.health_monitor import health_monitor
+from app.infrastructure.loop_watchdog import loop_watchdog
+from app.infrastructure.logging_setup import configure_logging
+from app.infrastructure.metrics import mark_worker_dead, render_metrics
+from app.infrastructure.tracing import configure_tracing, tracer
+from app.infrastructure.profiling import profile_store, profiling_allowed
 from app.api.handlers import setup_exception_handlers
+from app.api.responses import FastJSONResponse
 from app.api.middleware.security import SecurityHeadersMiddleware
 from app.api.middleware.logging import LoggingMiddleware
 from app.api.middleware.rate_limiting import RateLimitingMiddleware
+from app.api.middleware.query_stats import QueryStatsMiddleware
+from app.api.middleware.metrics import MetricsMiddleware
+from app.api.middleware.tracing import TracingMiddleware
+from app.api.middleware.profiling import ProfilingMiddleware
+from app.api.middleware.compression import CompressionMiddleware
 from app.api.v1.router import api_router
 
-# Configure structured logging
-logging.basicConfig(
-    level=getattr(logging, settings.log_level.upper()),
-    format=(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        if settings.log_format == "text"
-        else '{"timestamp": "%(asctime)s", "name": "%(name)s", "level": "%(levelname)s", "message": "%(message)s"}'
-    ),
-)
+# Structured logging through a queue: callers only enqueue, a listener thread
+# formats (JSON by default) and writes to stderr
+configure_logging(settings.log_level, settings.log_format)
+configure_tracing()
 logger = logging.getLogger(__name__)
 
 
@@ -84,21 +93,20 @@ async def lifespan(app: FastAPI):
     logger.info(f"Debug mode: {settings.debug}")
 
     try:
-        # Initialize database
-        init_db()
-        logger.info("Database initialized successfully")
-
-        # Test database connection
-        try:
-            health_check_passed = database_manager.health_check()
-            if health_check_passed:
-                logger.info("Database health check passed")
-            else:
-                logger.warning("Database health check failed but continuing startup")
-        except Exception as e:
-            logger.warning(f"Database health check failed but continuing startup: {e}")
-
-        logger.info(f"{settings.project_name} startup complete")
+        # Threadpool, database (create_all skipped at alembic head), then the
+        # pool and BAML warm-ups concurrently - each step timed
+        timings = await run_startup()
+        app.state.startup_timings = timings.steps
+        logger.info(
+            f"{settings.project_name} startup complete in {timings.total_ms}ms "
+            f"({timings.summary()})"
+        )
+
+        # Background DB/LLM probes behind /health/ready and /health/detailed
+        health_monitor.start()
+        # Event-loop lag histogram and blocking-call reports
+        if settings.loop_watchdog_enabled:
+            loop_watchdog.start()
         yield
 
     except Exception as e:
@@ -113,7 +121,11 @@ async def lifespan(app: FastAPI):
     logger.info(f"Shutting down {settings.project_name}...")
 
     try:
+        await health_monitor.stop()
+        await loop_watchdog.stop()
         close_db()
+        mark_worker_dead()
+        tracer.configure(None)
         logger.info("Application shutdown complete")
     except Exception as e:
         logger.error(f"Error during shutdown: {e}")
@@ -138,14 +150,19 @@ def create_application() -> FastAPI:
         ),  # Keep OpenAPI JSON accessible
         debug=settings.debug,
         lifespan=lifespan,
+        # orjson for routes without a response_model (see app.api.responses)
+        default_response_class=FastJSONResponse,
     )
 
     # Setup exception handlers
     setup_exception_handlers(app)
 
-    # Add middleware stack (order matters - reverse order of execution)
+    # Add middleware stack. Each add_middleware wraps everything added before
+    # it, so the numbers run from innermost (1, CORS, next to the routes) to
+    # outermost (9, compression, first to see a request and last to see its
+    # response). Layers that are switched off are simply skipped.
 
-    # 1. CORS middleware (outermost)
+    # 1. CORS middleware
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.cors_origins_list,
@@ -161,7 +178,12 @@ def create_application() -> FastAPI:
             "X-Client-Info",
             "X-Dev-User",
         ],
-        expose_headers=["X-Total-Count", "X-Rate-Limit-Remaining"],
+        expose_headers=[
+            "X-Total-Count",
+            "X-Rate-Limit-Remaining",
+            "X-DB-Queries",
+            "Server-Timing",
+        ],
         max_age=3600,  # Cache preflight requests for 1 hour
     )
 
@@ -171,14 +193,63 @@ def create_application() -> FastAPI:
             RateLimitingMiddleware,
             requests=settings.rate_limit_requests,
             window=settings.rate_limit_window,
+            max_keys=settings.rate_limit_max_keys,
         )
 
     # 3. Security headers middleware
     app.add_middleware(SecurityHeadersMiddleware)
 
-    # 4. Request logging middleware (innermost)
+    # 4. Request logging middleware
     if settings.debug or settings.log_level.upper() in ["DEBUG", "INFO"]:
-        app.add_middleware(LoggingMiddleware)
+        app.add_middleware(
+            LoggingMiddleware,
+            body_sample_rate=settings.log_response_body_sample_rate,
+            body_on_5xx=settings.log_response_body_on_5xx,
+            body_paths=[
+                path.strip()
+                for path in settings.log_response_body_paths.split(",")
+                if path.strip()
+            ],
+            body_max_bytes=settings.log_response_body_max_bytes,
+        )
+
+    # 5. Per-request SQL stats: N+1 warnings always, timing headers in debug
+    if settings.db_query_stats_enabled:
+        app.add_middleware(
+            QueryStatsMiddleware,
+            expose_headers=settings.debug,
+            n_plus_one_threshold=settings.db_n_plus_one_threshold,
+        )
+
+    # 6. HTTP metrics: rate, errors and latency per route template
+    if settings.enable_metrics:
+        app.add_middleware(
+            MetricsMiddleware, skip_paths=frozenset({settings.metrics_path})
+        )
+
+    # 7. Tracing: one server span per request, propagated via traceparent
+    if settings.tracing_enabled:
+        app.add_middleware(
+            TracingMiddleware, skip_paths=frozenset({settings.metrics_path})
+        )
+
+    # 8. On-demand profiling (X-Profile: 1), never in production
+    if profiling_allowed():
+        app.add_middleware(
+            ProfilingMiddleware,
+            store=profile_store,
+            interval_ms=settings.profile_interval_ms,
+        )
+
+    # 9. Response compression: every layer inside it sees uncompressed bodies
+    if settings.compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_minimum_size,
+            content_types=settings.compression_content_types,
+            gzip_level=settings.compression_gzip_level,
+            brotli_quality=settings.compression_brotli_quality,
+        )
 
     # Add API routes
     app.include_router(api_router, prefix=settings.api_v1_str)
@@ -186,6 +257,14 @@ def create_application() -> FastAPI:
     # Add health check endpoints
     setup_health_endpoints(app)
 
+    # Prometheus scrape endpoint (pool telemetry and friends)
+    if settings.enable_metrics:
+        setup_metrics_endpoint(app)
+
+    # Stored request profiles (debug and staging only)
+    if profiling_allowed():
+        setup_profiling_endpoints(app)
+
     # Setup documentation endpoints based on environment
     setup_documentation_endpoints(app)
 
@@ -213,6 +292,77 @@ def setup_health_endpoints(app: FastAPI) -> None:
         """Simple health check endpoint - just return OK"""
         return {"status": "ok"}
 
+    @app.get("/health/db")
+    async def database_pool_health() -> Dict[str, Any]:
+        """Connection-pool telemetry: checkouts, pool-wait and connect histograms.
+
+        Reads in-process counters only (no query), so it stays cheap and
+        answers even while the pool is exhausted.
+        """
+        return database_manager.get_pool_health()
+
+    @app.get("/health/live")
+    async def liveness() -> Dict[str, str]:
+        """Liveness probe: the event loop is serving requests. Touches nothing."""
+        return {"status": "ok"}
+
+    @app.get("/health/ready")
+    async def readiness() -> JSONResponse:
+        """Readiness probe: the cached result of the background database probe.
+
+        Answers in O(1) from memory, so probe frequency never turns into DB
+        load; 503 until the first probe passes and while probes fail.
+        """
+        ready = health_monitor.ready
+        return JSONResponse(
+            {"status": "ready" if ready else "not_ready"},
+            status_code=200 if ready else 503,
+        )
+
+    @app.get("/health/detailed")
+    async def detailed_health() -> JSONResponse:
+        """Readiness plus last-probe latency/errors (DB, LLM) and pool stats."""
+        snapshot = health_monitor.snapshot()
+        snapshot["pool"] = database_manager.get_pool_health()
+        return JSONResponse(
+            snapshot, status_code=200 if snapshot["status"] == "ready" else 503
+        )
+
+
+def setup_metrics_endpoint(app: FastAPI) -> None:
+    """Expose Prometheus metrics at ``settings.metrics_path``
+
+    Under several workers with ``PROMETHEUS_MULTIPROC_DIR`` set, the payload
+    merges every worker's samples (see ``app.infrastructure.metrics``).
+    """
+
+    @app.get(settings.metrics_path, include_in_schema=False)
+    def metrics() -> Response:
+        payload, content_type = render_metrics()
+        return Response(payload, media_type=content_type)
+
+
+def setup_profiling_endpoints(app: FastAPI) -> None:
+    """List and download profiles taken with ``X-Profile: 1``
+
+    Each file is speedscope JSON: open it at https://www.speedscope.app.
+    """
+
+    @app.get("/debug/profiles", include_in_schema=False)
+    def list_profiles() -> Dict[str, Any]:
+        return {"profiles": profile_store.list()}
+
+    @app.get("/debug/profiles/{profile_id}", include_in_schema=False)
+    def get_profile(profile_id: str) -> FileResponse:
+        path = profile_store.path(profile_id)
+        if path is None:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        return FileResponse(
+            path,
+            media_type="application/json",
+            filename=f"{profile_id}.speedscope.json",
+        )
+
 
 def setup_documentation_endpoints(app: FastAPI) -> None:
     """Setup documentation endpoints - always accessible in local development"""
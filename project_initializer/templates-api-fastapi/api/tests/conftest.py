@@ -15,7 +15,9 @@ from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
-from app.infrastructure.database import get_db
+from app.api.v1.endpoints import items as items_endpoints
+from app.infrastructure.cache import Cache, MemoryBackend, cache
+from app.infrastructure.database import get_db, get_db_readonly
 from app.infrastructure.orm.base import Base
 
 
@@ -38,6 +40,25 @@ def test_engine():
     Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def clear_app_cache():
+    """Start every test with an empty application cache.
+
+    Each test's rows are rolled back, so cached reads from an earlier test
+    would be stale.
+    """
+    if cache is not None and isinstance(cache.backend, MemoryBackend):
+        cache.backend.clear()
+
+
+@pytest.fixture
+def app_cache(monkeypatch):
+    """Turn the item cache on for one test (``CACHE_BACKEND`` defaults to none)."""
+    backend = MemoryBackend(max_entries=1000)
+    monkeypatch.setattr(items_endpoints, "cache", Cache(backend))
+    return backend
+
+
 @pytest.fixture(scope="function")
 def db_session(test_engine) -> Generator[Session, None, None]:
     """
@@ -59,7 +80,10 @@ def db_session(test_engine) -> Generator[Session, None, None]:
 @pytest.fixture(scope="function")
 def client(db_session: Session) -> Generator[TestClient, None, None]:
     """
-    Create a test client with overridden database dependency.
+    Create a test client with overridden database dependencies.
+
+    Both the primary and the read-only (replica-routed) session resolve to the
+    same rolled-back ``db_session``, so reads see the test's own writes.
     """
 
     def override_get_db():
@@ -69,6 +93,7 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_readonly] = override_get_db
 
     with TestClient(app) as test_client:
         yield test_client
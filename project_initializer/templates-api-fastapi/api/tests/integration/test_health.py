@@ -6,6 +6,8 @@ These endpoints touch no DB; they prove the app serves its baseline routes.
 
 import pytest
 
+from app.infrastructure.health_monitor import HealthMonitor
+
 
 @pytest.mark.integration
 def test_when_root_is_requested_then_status_is_operational(client):
@@ -23,3 +25,49 @@ def test_when_health_is_requested_then_status_ok_is_returned(client):
 
     assert resp.status_code == 200
     assert resp.json() == {"status": "ok"}
+
+
+@pytest.mark.integration
+def test_when_health_db_is_requested_then_pool_telemetry_is_returned(client):
+    """when GET /health/db is requested, a structured pool payload is returned."""
+    resp = client.get("/health/db")
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["status"] in {"ok", "saturated", "unavailable"}
+    assert "engines" in body
+
+
+@pytest.mark.integration
+def test_when_metrics_is_requested_then_pool_metrics_are_exposed(client):
+    """when the metrics path is scraped, the pool metric families are present."""
+    resp = client.get("/metrics")
+
+    assert resp.status_code == 200
+    assert "db_pool_wait_seconds" in resp.text
+
+
+@pytest.mark.integration
+def test_when_liveness_is_probed_then_ok_is_returned(client):
+    """when GET /health/live is requested, 200 is returned without any check."""
+    resp = client.get("/health/live")
+
+    assert resp.status_code == 200
+    assert resp.json() == {"status": "ok"}
+
+
+@pytest.mark.integration
+def test_when_readiness_is_probed_then_the_cached_state_is_served(client, monkeypatch):
+    """when the monitor is ready, /health/ready is 200 and /health/detailed adds pool data."""
+    monkeypatch.setattr(HealthMonitor, "ready", property(lambda self: True))
+
+    resp = client.get("/health/ready")
+    detailed = client.get("/health/detailed")
+
+    assert resp.status_code == 200
+    assert resp.json() == {"status": "ready"}
+    assert detailed.status_code == 200
+    assert set(detailed.json()) >= {"status", "checks", "pool"}
+
+    monkeypatch.setattr(HealthMonitor, "ready", property(lambda self: False))
+    assert client.get("/health/ready").status_code == 503
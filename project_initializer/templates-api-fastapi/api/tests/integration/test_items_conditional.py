@@ -0,0 +1,71 @@
+"""Integration tests for conditional GETs on /api/v1/items (ETag / Last-Modified).
+
+Uses the `client` fixture. A first GET collects the validators; the second sends
+them back and must get a bodiless 304 until the item changes.
+"""
+
+import pytest
+
+API = "/api/v1"
+
+
+def _create(client, **overrides):
+    payload = {"name": "Widget", "price": 9.99}
+    payload.update(overrides)
+    resp = client.post(f"{API}/items", json=payload)
+    assert resp.status_code == 201
+    return resp.json()
+
+
+@pytest.mark.integration
+def test_when_etag_still_matches_then_item_get_is_304_until_updated(client):
+    """when If-None-Match matches, 304 with no body; after a PUT, 200 with a new ETag."""
+    item_url = f"{API}/items/{_create(client)['id']}"
+    first = client.get(item_url)
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert first.headers["last-modified"].endswith("GMT")
+
+    again = client.get(item_url, headers={"If-None-Match": f"W/{etag}"})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+
+    client.put(item_url, json={"price": 1.0})
+    changed = client.get(item_url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["price"] == 1.0
+    assert changed.headers["etag"] != etag
+
+
+@pytest.mark.integration
+def test_when_if_modified_since_is_not_older_then_item_get_is_304(client):
+    """when If-Modified-Since equals Last-Modified, 304; when earlier, 200."""
+    item_url = f"{API}/items/{_create(client)['id']}"
+    last_modified = client.get(item_url).headers["last-modified"]
+
+    current = client.get(item_url, headers={"If-Modified-Since": last_modified})
+    stale = client.get(
+        item_url, headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"}
+    )
+
+    assert current.status_code == 304
+    assert stale.status_code == 200
+
+
+@pytest.mark.integration
+def test_when_a_polled_page_changes_then_its_etag_changes(client):
+    """when the list is polled unchanged it is 304; a new item makes it 200 again."""
+    _create(client, name="First")
+    first = client.get(f"{API}/items")
+    etag = first.headers["etag"]
+
+    assert (
+        client.get(f"{API}/items", headers={"If-None-Match": etag}).status_code == 304
+    )
+    assert "last-modified" not in first.headers
+
+    _create(client, name="Second")
+    polled = client.get(f"{API}/items", headers={"If-None-Match": etag})
+    assert polled.status_code == 200
+    assert polled.headers["etag"] != etag
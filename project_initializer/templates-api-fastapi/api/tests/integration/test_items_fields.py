@@ -0,0 +1,105 @@
+"""Integration tests for sparse fieldsets (``?fields=``) on /api/v1/items.
+
+Uses the `client` fixture. Responses must carry exactly the requested fields,
+in model order, and an unknown field is a 422 like any other bad query value.
+A fieldset skips the cache, so its column projection reaches the SQL even with
+the cache on (the `app_cache` fixture).
+"""
+
+import inspect
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.api.fieldsets import field_selector
+from app.api.schemas.item import ItemResponse
+
+API = "/api/v1"
+
+
+def _create(client, **overrides):
+    payload = {"name": "Widget", "description": "x" * 400, "price": 9.99}
+    payload.update(overrides)
+    resp = client.post(f"{API}/items", json=payload)
+    assert resp.status_code == 201
+    return resp.json()
+
+
+@pytest.mark.integration
+def test_when_fields_are_requested_then_the_page_has_only_those_keys(client):
+    """when fields=price,name, every item has just name and price (model order)."""
+    _create(client)
+
+    resp = client.get(f"{API}/items", params={"fields": "price, name,price"})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["total"] >= 1
+    assert all(list(item) == ["name", "price"] for item in body["items"])
+    assert "description" not in resp.text
+
+
+@pytest.mark.integration
+def test_when_one_item_is_fetched_with_fields_then_it_is_partial_and_tagged(client):
+    """when fields=id,name on GET /items/{id}, the body and ETag are the partial ones."""
+    item = _create(client)
+    url = f"{API}/items/{item['id']}"
+    full = client.get(url)
+
+    partial = client.get(url, params={"fields": "id,name"})
+
+    assert partial.json() == {"id": item["id"], "name": "Widget"}
+    assert partial.headers["etag"] != full.headers["etag"]
+    assert "last-modified" not in partial.headers
+    again = client.get(
+        url,
+        params={"fields": "name,id"},
+        headers={"If-None-Match": partial.headers["etag"]},
+    )
+    assert again.status_code == 304
+
+
+@pytest.mark.integration
+def test_when_a_field_is_unknown_then_the_request_is_rejected(client):
+    """when fields names a column the response does not have, 422 VALIDATION_ERROR."""
+    resp = client.get(f"{API}/items", params={"fields": "id,password"})
+
+    assert resp.status_code == 422
+    body = resp.json()
+    assert "password" in str(body)
+    assert "VALIDATION_ERROR" in str(body)
+
+
+@pytest.mark.integration
+def test_when_the_cache_is_on_then_a_fieldset_still_narrows_the_select(
+    client, app_cache
+):
+    """when fields are requested with the cache on, no SELECT reads the other columns."""
+    item = _create(client)
+    client.get(f"{API}/items")  # warm the cache with full pages
+    assert len(app_cache) > 0
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    # On the Engine class: the --async-db client reads through its own engine
+    event.listen(Engine, "before_cursor_execute", record)
+    try:
+        page = client.get(f"{API}/items", params={"fields": "id,name"})
+        one = client.get(f"{API}/items/{item['id']}", params={"fields": "name"})
+    finally:
+        event.remove(Engine, "before_cursor_execute", record)
+
+    assert page.status_code == one.status_code == 200
+    assert one.json() == {"name": "Widget"}
+    item_selects = [sql for sql in statements if "FROM items" in sql]
+    assert len(item_selects) >= 2
+    assert all("description" not in sql for sql in item_selects)
+
+
+@pytest.mark.unit
+def test_when_fields_are_parsed_then_no_threadpool_hop_is_needed():
+    """when FastAPI resolves ?fields=, the dependency is async so it stays on the loop."""
+    assert inspect.iscoroutinefunction(field_selector(ItemResponse))
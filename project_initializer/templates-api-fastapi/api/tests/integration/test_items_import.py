@@ -0,0 +1,94 @@
+"""Integration tests for the bulk ``POST /api/v1/items/import`` upload.
+
+The SQLite test DB exercises the repository's executemany fallback; the
+PostgreSQL ``COPY`` path shares the same reader, validation, and summary, so the
+contract asserted here (accepted/rejected counts, per-row errors, 415 on an
+unknown format) holds for both.
+"""
+
+import json
+
+import pytest
+
+API = "/api/v1"
+
+
+def _upload(client, name: str, body: str, content_type: str):
+    """POST ``body`` as a multipart file upload and return the response."""
+    return client.post(
+        f"{API}/items/import",
+        files={"file": (name, body.encode("utf-8"), content_type)},
+    )
+
+
+@pytest.mark.integration
+def test_when_csv_uploaded_then_valid_rows_load_and_invalid_rows_are_reported(client):
+    """when a CSV mixes valid and invalid rows, only the valid ones are loaded."""
+    body = (
+        "name,description,price,is_active\n"
+        "Imported A,First,1.50,true\n"
+        ",Missing name,2.00,true\n"
+        "Imported B,,,false\n"
+        "Imported C,Negative,-1,true\n"
+    )
+
+    resp = _upload(client, "items.csv", body, "text/csv")
+
+    assert resp.status_code == 200
+    summary = resp.json()
+    assert summary["accepted"] == 2
+    assert summary["rejected"] == 2
+    assert [err["row"] for err in summary["errors"]] == [2, 4]
+
+    names = {it["name"] for it in client.get(f"{API}/items").json()["items"]}
+    assert {"Imported A", "Imported B"} <= names
+
+
+@pytest.mark.integration
+def test_when_ndjson_uploaded_then_rows_are_validated_per_line(client):
+    """when NDJSON is uploaded, each line is validated and bad JSON is rejected."""
+    lines = [
+        json.dumps({"name": "Line One", "price": 3.0}),
+        "{not json",
+        json.dumps({"name": "x" * 101}),
+        "",
+        json.dumps({"name": "Line Two"}),
+    ]
+
+    resp = _upload(client, "items.ndjson", "\n".join(lines), "application/x-ndjson")
+
+    assert resp.status_code == 200
+    summary = resp.json()
+    assert summary["accepted"] == 2
+    assert summary["rejected"] == 2
+    assert summary["errors"][0]["errors"][0].startswith("row: invalid JSON")
+
+
+@pytest.mark.integration
+def test_when_upload_is_not_csv_or_ndjson_then_415_is_returned(client):
+    """when the upload is neither CSV nor NDJSON, 415 is returned."""
+    resp = _upload(client, "items.xml", "<items/>", "application/xml")
+
+    assert resp.status_code == 415
+
+
+@pytest.mark.integration
+def test_when_rows_are_not_utf8_then_they_are_rejected_not_mangled(client):
+    """when a row holds bytes that are not UTF-8, it is rejected, not imported."""
+    csv_body = "name,price\nCafé Ok,1\n".encode() + b"Caf\xe9 Latin1,2\n"
+    ndjson_body = b'{"name": "Caf\xe9"}\n' + json.dumps({"name": "Fine"}).encode()
+
+    csv_resp = client.post(
+        f"{API}/items/import", files={"file": ("a.csv", csv_body, "text/csv")}
+    )
+    ndjson_resp = client.post(
+        f"{API}/items/import",
+        files={"file": ("a.ndjson", ndjson_body, "application/x-ndjson")},
+    )
+
+    for resp in (csv_resp, ndjson_resp):
+        summary = resp.json()
+        assert (summary["accepted"], summary["rejected"]) == (1, 1)
+        assert summary["errors"][0]["errors"] == ["row: invalid UTF-8 bytes"]
+    names = {it["name"] for it in client.get(f"{API}/items").json()["items"]}
+    assert not any("�" in name for name in names)
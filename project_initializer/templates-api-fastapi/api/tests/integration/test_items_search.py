@@ -0,0 +1,112 @@
+"""Integration tests for GET /api/v1/items/search.
+
+Uses the `client` fixture, so the search runs on SQLite with the ``CASE``
+ranking fallback. The database is shared across tests, so every test searches
+for a token of its own. The last test compiles the statement for PostgreSQL to
+check that it uses the trigram-indexable ``ILIKE`` and ``word_similarity``.
+"""
+
+import base64
+import json
+import uuid
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.repositories.item import search_statement
+
+API = "/api/v1"
+
+
+def _token() -> str:
+    return f"zq{uuid.uuid4().hex[:8]}"
+
+
+def _create(client, name, description=None):
+    resp = client.post(f"{API}/items", json={"name": name, "description": description})
+    assert resp.status_code == 201
+    return resp.json()
+
+
+@pytest.mark.integration
+def test_when_items_match_then_the_best_matches_come_first(client):
+    """when q hits names and descriptions, exact > prefix > substring > description."""
+    tok = _token()
+    described = _create(client, "Plain", description=f"mentions {tok} here")
+    inner = _create(client, f"old {tok}")
+    prefix = _create(client, f"{tok} lamp")
+    exact = _create(client, tok.upper())
+    _create(client, "Unrelated")
+
+    resp = client.get(f"{API}/items/search", params={"q": tok})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    ids = [item["id"] for item in body["items"]]
+    assert ids == [exact["id"], prefix["id"], inner["id"], described["id"]]
+    assert body["next_cursor"] is None
+
+
+@pytest.mark.integration
+def test_when_results_span_pages_then_the_cursor_walks_them_without_overlap(client):
+    """when limit is below the match count, cursors return each item exactly once."""
+    tok = _token()
+    created = {_create(client, f"{tok} {i}")["id"] for i in range(5)}
+    seen, cursor, pages = [], None, 0
+
+    while True:
+        params = {"q": tok, "limit": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        body = client.get(f"{API}/items/search", params=params).json()
+        seen += [item["id"] for item in body["items"]]
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert len(seen) == len(set(seen)) == 5
+    assert set(seen) == created
+
+
+@pytest.mark.integration
+def test_when_q_has_wildcards_or_the_cursor_is_bad_then_they_are_handled(client):
+    """when q holds % it matches literally; a forged cursor is a 422."""
+    tok = _token()
+    literal = _create(client, f"{tok}%off")
+    _create(client, f"{tok}xoff")
+
+    resp = client.get(f"{API}/items/search", params={"q": f"{tok}%"})
+    bad = client.get(f"{API}/items/search", params={"q": tok, "cursor": "not-a-cursor"})
+    empty = client.get(f"{API}/items/search", params={"q": ""})
+
+    assert [item["id"] for item in resp.json()["items"]] == [literal["id"]]
+    assert bad.status_code == 422
+    assert "cursor" in str(bad.json())
+    assert empty.status_code == 422
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("values", [["x", "y"], [1, 2], [True, "id"], [0.5]])
+def test_when_a_cursor_holds_the_wrong_types_then_it_is_rejected(client, values):
+    """when a well-formed cursor is not (number, str), 422 before any SQL runs."""
+    cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    resp = client.get(f"{API}/items/search", params={"q": "x", "cursor": cursor})
+
+    assert resp.status_code == 422
+    assert "cursor" in str(resp.json())
+
+
+@pytest.mark.unit
+def test_when_compiled_for_postgresql_then_it_uses_trigram_operators():
+    """when the dialect is postgresql, the filter is ILIKE and the rank word_similarity."""
+    stmt = search_statement("postgresql", "lamp", 20, after=(0.5, "abc"))
+
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert "ILIKE" in sql
+    assert "word_similarity" in sql
+    assert "ORDER BY rank DESC, items.id" in sql
+    assert "OFFSET" not in sql
@@ -0,0 +1,45 @@
+"""Integration test for the ``QueryStatsMiddleware`` debug headers.
+
+Drives a real request to check that sync handlers (run in the threadpool) are
+counted and ``Server-Timing`` / ``X-DB-Queries`` are sent. The listeners are put
+on the session-wide ``test_engine`` only for this test and removed afterwards,
+so no other test runs instrumented.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from app.infrastructure import query_stats
+
+_LISTENERS = (
+    ("before_cursor_execute", query_stats._before_cursor_execute),
+    ("after_cursor_execute", query_stats._after_cursor_execute),
+    ("handle_error", query_stats._handle_error),
+)
+
+
+@pytest.fixture
+def instrumented_engine(test_engine):
+    """``test_engine`` with the query listeners, removed again on teardown."""
+    installed = not event.contains(
+        test_engine, "before_cursor_execute", query_stats._before_cursor_execute
+    )
+    query_stats.install_query_instrumentation(test_engine)
+    yield test_engine
+    if installed:
+        for name, listener in _LISTENERS:
+            event.remove(test_engine, name, listener)
+
+
+@pytest.mark.integration
+def test_when_debug_then_responses_carry_db_timing_headers(client, instrumented_engine):
+    """when debug is on, a DB-backed request reports its statement count."""
+    # The bulk import is a sync handler on the sync engine in every variant.
+    resp = client.post(
+        "/api/v1/items/import",
+        files={"file": ("items.csv", b"name\nTimed\n", "text/csv")},
+    )
+
+    assert resp.status_code == 200
+    assert int(resp.headers["x-db-queries"]) >= 1
+    assert resp.headers["server-timing"].startswith("db;dur=")
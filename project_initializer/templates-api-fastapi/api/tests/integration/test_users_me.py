@@ -7,8 +7,13 @@ Acceptance criteria:
 """
 
 import pytest
+from sqlalchemy import update
 
+from app.api import deps
 from app.api.deps import get_current_user
+from app.infrastructure.cache import MemoryBackend
+from app.infrastructure.orm import User
+from app.infrastructure.settings import settings
 from app.main import app
 
 API = "/api/v1"
@@ -72,3 +77,25 @@ def test_when_openapi_fetched_then_users_me_has_summary_and_response_description
     # Explicit summary, not the function-name-derived default ("Read Current User").
     assert op["summary"] == "Get the current user"
     assert op["responses"]["200"]["description"] != "Successful Response"
+
+
+@pytest.mark.integration
+def test_when_cache_ttl_users_passes_then_the_default_user_is_read_again(
+    db_session, monkeypatch
+):
+    """when the default user changes, it is served from cache until cache_ttl_users."""
+    now = [0.0]
+    monkeypatch.setattr(
+        deps, "_default_user_cache", MemoryBackend(1, clock=lambda: now[0])
+    )
+    user = deps.get_default_user_from_db(db_session)
+    db_session.execute(
+        update(User).where(User.id == user["id"]).values(email="renamed@example.com")
+    )
+
+    cached = deps.get_default_user_from_db(db_session)
+    now[0] = settings.cache_ttl_users
+    reloaded = deps.get_default_user_from_db(db_session)
+
+    assert cached["email"] == user["email"]
+    assert reloaded["email"] == "renamed@example.com"
@@ -9,6 +9,8 @@ Rule:
 - ``app/domain`` imports none of: app.application, app.infrastructure, app.api,
   fastapi, sqlalchemy, pydantic_settings.
 - ``app/application`` imports none of: app.infrastructure, app.api, fastapi.
+- ``app/infrastructure`` does not import fastapi; request wiring such as DB
+  admission lives in ``app/api``.
 """
 
 import ast
@@ -73,3 +75,10 @@ def test_application_layer_does_not_import_infrastructure_or_api():
         ("app.infrastructure", "app.api", "fastapi"),
     )
     assert breaches == [], "Application boundary violated:\n" + "\n".join(breaches)
+
+
+@pytest.mark.unit
+def test_infrastructure_layer_does_not_import_fastapi():
+    """infrastructure/ stays framework-free — FastAPI wiring belongs in app/api."""
+    breaches = _violations("infrastructure", ("fastapi",))
+    assert breaches == [], "Infrastructure boundary violated:\n" + "\n".join(breaches)
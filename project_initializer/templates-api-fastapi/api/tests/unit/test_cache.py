@@ -0,0 +1,222 @@
+"""Unit tests for the application cache (``app.infrastructure.cache``).
+
+The TTL+LRU backend runs on a fake clock. Single-flight loading is checked
+with threads (``Cache``) and ``asyncio.gather`` (``AsyncCache``). ``ItemService``
+caching runs against the in-memory SQLite ``db_session`` fixture, and rows are
+changed behind the service's back to show what is served from the cache. A
+replica that has not replayed a write yet is faked by ``LaggingReplica``, and
+a Redis server by ``FakeRedis``.
+"""
+
+import asyncio
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import update
+
+from app.api.schemas import ItemCreate, ItemUpdate
+from app.application.services.item_service import ItemService
+from app.domain.entities.item import Item
+from app.infrastructure.cache import AsyncCache, Cache, MemoryBackend, RedisBackend
+from app.infrastructure.orm.item import Item as ItemModel
+from app.infrastructure.repositories.item import ItemRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class LaggingReplica:
+    """Read side of a replica that has not replayed any item yet."""
+
+    def get(self, item_id):
+        return None
+
+    def get_multi_rows(self, **kwargs):
+        return []
+
+    def count(self):
+        return 0
+
+
+class FakeRedis:
+    """The ``get``/``set`` subset of a sync Redis client, in a dict."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, px=None):
+        self.data[key] = value
+
+
+EXPLOITED = []
+
+
+def _exploit():
+    EXPLOITED.append(True)
+
+
+class Exploit:
+    """Unpickling this calls ``_exploit``; a JSON cache must never do that."""
+
+    def __reduce__(self):
+        return (_exploit, ())
+
+
+@pytest.mark.unit
+def test_when_entries_expire_or_overflow_then_they_are_dropped():
+    """when the TTL passes or max_entries is exceeded, the entry is gone (LRU first)."""
+    clock = FakeClock()
+    backend = MemoryBackend(max_entries=2, clock=clock)
+    backend.set("a", 1, ttl=10)
+    backend.set("b", 2, ttl=None)
+    backend.get("a")  # a is now the most recently used
+    backend.set("c", 3, ttl=10)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == 1
+    clock.now = 10
+    assert backend.get("a") is None
+    assert backend.get("c") is None
+    assert len(backend) == 0
+
+
+@pytest.mark.unit
+def test_when_threads_miss_the_same_key_then_the_loader_runs_once():
+    """when 8 threads miss one key together, one loads and the rest reuse it."""
+    cache = Cache(MemoryBackend(max_entries=10))
+    calls = []
+    barrier = threading.Barrier(8)
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    def read(_):
+        barrier.wait()
+        return cache.get_or_load("key", loader, ttl=60)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(read, range(8)))
+
+    assert results == ["value"] * 8
+    assert len(calls) == 1
+
+
+@pytest.mark.unit
+def test_when_coroutines_miss_the_same_key_then_the_loader_runs_once():
+    """when coroutines miss one key together, one awaits the loader, all get its value."""
+    cache = AsyncCache(MemoryBackend(max_entries=10))
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def main():
+        return await asyncio.gather(
+            *(cache.get_or_load("key", loader, ttl=60) for _ in range(5))
+        )
+
+    assert asyncio.run(main()) == [42] * 5
+    assert len(calls) == 1
+
+
+@pytest.mark.unit
+def test_when_item_reads_are_cached_then_writes_through_the_service_invalidate_them(
+    db_session,
+):
+    """when a row changes behind the cache it is not seen; a service write is."""
+    cache = Cache(MemoryBackend(max_entries=100))
+    service = ItemService(ItemRepository(db_session), cache=cache, ttl=60)
+    item = service.create(ItemCreate(name="Widget"))
+    total = service.count()
+    assert isinstance(service.get(item.id), Item)
+
+    db_session.execute(
+        update(ItemModel).where(ItemModel.id == item.id).values(name="Changed")
+    )
+    db_session.add(ItemModel(name="Behind the cache"))
+    db_session.flush()
+    fresh = ItemService(ItemRepository(db_session), cache=cache, ttl=60)
+    assert fresh.get(item.id).name == "Widget"
+    assert fresh.count() == total
+
+    fresh.update(item.id, ItemUpdate(price=5.0))
+    reader = ItemService(ItemRepository(db_session), cache=cache, ttl=60)
+    assert reader.get(item.id).name == "Changed"
+    assert reader.get(item.id).price == 5.0
+    assert reader.count() == total + 1
+    reader.delete(item.id)
+    assert reader.get(item.id) is None
+
+
+@pytest.mark.unit
+def test_when_a_replica_lags_a_write_then_the_cache_is_filled_from_the_primary(
+    db_session,
+):
+    """when the replica misses a write, a cache miss still stores the primary's rows."""
+    cache = Cache(MemoryBackend(max_entries=100))
+    writer = ItemService(ItemRepository(db_session), cache=cache, ttl=60)
+    item = writer.create(ItemCreate(name="Fresh"))
+    total = ItemRepository(db_session).count()
+
+    reader = ItemService(
+        LaggingReplica(), cache=cache, ttl=60, primary=ItemRepository(db_session)
+    )
+
+    assert reader.get(item.id).name == "Fresh"
+    assert reader.count() == total
+    assert item.id in {row.id for row in reader.list(limit=total)}
+    # Later readers hit those entries, not the replica
+    cached = ItemService(LaggingReplica(), cache=cache, ttl=60)
+    assert cached.get(item.id).name == "Fresh"
+    assert cached.count() == total
+    # Without a cache, reads stay on the replica
+    assert (
+        ItemService(LaggingReplica(), primary=ItemRepository(db_session)).get(item.id)
+        is None
+    )
+
+
+@pytest.mark.unit
+def test_when_items_are_cached_in_redis_then_they_round_trip_as_json(db_session):
+    """when the redis backend serves a hit, entities are rebuilt from JSON."""
+    backend = RedisBackend("redis://unused")
+    backend._client = FakeRedis()
+    writer = ItemService(ItemRepository(db_session), cache=Cache(backend), ttl=60)
+    item = writer.create(ItemCreate(name="Widget", price=2.5))
+    expected = writer.get(item.id)
+    total = writer.count()
+    writer.list(limit=total)
+
+    reader = ItemService(LaggingReplica(), cache=Cache(backend), ttl=60)
+    page = reader.list(limit=total)
+
+    assert reader.get(item.id) == expected
+    assert item.id in {entity.id for entity in page}
+    assert all(isinstance(entity, Item) for entity in page)
+    assert not any(raw.startswith(b"\x80") for raw in backend._client.data.values())
+
+
+@pytest.mark.unit
+def test_when_redis_holds_a_pickle_then_it_is_a_miss_and_never_unpickled():
+    """when someone plants a pickled payload, reading it runs no code."""
+    backend = RedisBackend("redis://unused")
+    backend._client = FakeRedis()
+    backend._client.set("cache:items:planted", pickle.dumps(Exploit()))
+
+    assert backend.get("items:planted") is None
+    assert EXPLOITED == []
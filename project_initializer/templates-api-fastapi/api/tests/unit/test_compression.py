@@ -0,0 +1,142 @@
+"""Unit tests for the pure-ASGI ``CompressionMiddleware``.
+
+A small FastAPI app is wrapped directly. The streaming tests drive the ASGI
+callable by hand to see when each body chunk reaches the server: an SSE
+chunk must pass through unchanged, and a compressed stream chunk must be
+decodable on its own.
+"""
+
+import asyncio
+import gzip
+import zlib
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.api.middleware.compression import (
+    CompressionMiddleware,
+    negotiate,
+    no_compression,
+)
+
+BIG = {"items": [{"name": f"item {i}", "price": i} for i in range(200)]}
+
+app = FastAPI()
+
+
+@app.get("/big")
+def big():
+    return JSONResponse(BIG, headers={"ETag": '"v1"'})
+
+
+@app.get("/small")
+def small():
+    return {"ok": True}
+
+
+@app.get("/raw", dependencies=[Depends(no_compression)])
+def raw():
+    return BIG
+
+
+def _drive(stream_app, chunk_seen, accept=b"gzip"):
+    """Run the wrapped app by hand, flagging ``chunk_seen`` on the first body."""
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+        if message["type"] == "http.response.body" and message.get("body"):
+            chunk_seen.set()
+
+    async def receive():
+        await asyncio.sleep(1)
+        return {"type": "http.disconnect"}
+
+    scope = {
+        "type": "http",
+        "path": "/stream",
+        "method": "GET",
+        "headers": [(b"accept-encoding", accept)],
+    }
+    asyncio.run(CompressionMiddleware(stream_app)(scope, receive, send))
+    return messages
+
+
+@pytest.mark.unit
+def test_when_a_large_json_body_is_accepted_gzipped_then_it_is_compressed():
+    """when gzip is accepted, big JSON is gzipped; small and opted-out bodies are not."""
+    client = TestClient(CompressionMiddleware(app, minimum_size=1024))
+
+    response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    wire = response.headers["content-length"]
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    raw = client.get("/raw", headers={"Accept-Encoding": "gzip"})
+    plain = client.get("/big", headers={"Accept-Encoding": "identity"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"v1"'
+    assert response.json() == BIG
+    assert int(wire) * 5 < len(plain.content)
+    assert "content-encoding" not in small.headers
+    assert "content-encoding" not in raw.headers
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["etag"] == '"v1"'
+
+
+@pytest.mark.unit
+def test_when_an_event_stream_yields_then_chunks_pass_through_uncompressed():
+    """when SSE streams to a gzip client, each event is sent as-is, unbuffered."""
+    first_chunk_sent = asyncio.Event()
+
+    async def events():
+        yield b"data: 1\n\n"
+        # Blocks until the middleware has passed the first chunk on.
+        await asyncio.wait_for(first_chunk_sent.wait(), timeout=1)
+        yield b"data: 2\n\n"
+
+    async def stream_app(scope, receive, send):
+        response = StreamingResponse(events(), media_type="text/event-stream")
+        await response(scope, receive, send)
+
+    messages = _drive(stream_app, first_chunk_sent)
+
+    bodies = [m["body"] for m in messages if m["type"] == "http.response.body"]
+    assert bodies[:2] == [b"data: 1\n\n", b"data: 2\n\n"]
+    assert all(name != b"content-encoding" for name, _ in messages[0]["headers"])
+
+
+@pytest.mark.unit
+def test_when_another_stream_is_compressed_then_each_chunk_is_flushed():
+    """when a text stream is gzipped, a chunk decodes before the next is made."""
+    first_chunk_sent = asyncio.Event()
+
+    async def lines():
+        yield b"row 1\n" * 50
+        await asyncio.wait_for(first_chunk_sent.wait(), timeout=1)
+        yield b"row 2\n" * 50
+
+    async def stream_app(scope, receive, send):
+        await StreamingResponse(lines(), media_type="text/csv")(scope, receive, send)
+
+    messages = _drive(stream_app, first_chunk_sent)
+
+    bodies = [m["body"] for m in messages if m["type"] == "http.response.body"]
+    assert (b"content-encoding", b"gzip") in messages[0]["headers"]
+    decoder = zlib.decompressobj(31)
+    assert decoder.decompress(bodies[0]) == b"row 1\n" * 50
+    assert gzip.decompress(b"".join(bodies)) == b"row 1\n" * 50 + b"row 2\n" * 50
+
+
+@pytest.mark.unit
+def test_when_accept_encoding_is_negotiated_then_q_values_are_honoured():
+    """when several codings are offered, br wins ties only if brotli is present."""
+    assert negotiate("gzip, br") == "br"
+    assert negotiate("gzip, br", brotli_available=False) == "gzip"
+    assert negotiate("br;q=0.5, gzip") == "gzip"
+    assert negotiate("gzip;q=0, *;q=0.1", brotli_available=False) is None
+    assert negotiate("*", brotli_available=False) == "gzip"
+    assert negotiate("identity") is None
+    assert negotiate("") is None
@@ -0,0 +1,138 @@
+"""Unit tests for DB admission control (``app.infrastructure.admission``).
+
+The controller is exercised directly on an asyncio loop: with every slot held,
+the next request must be shed within ``timeout`` as a 503-mapped
+``DatabaseTimeoutError`` rather than queue behind the pool.
+"""
+
+import asyncio
+import logging
+
+import anyio
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.deps import DBSession
+from app.api.handlers import setup_exception_handlers
+from app.domain.exceptions import DatabaseTimeoutError
+from app.infrastructure.admission import (
+    DBAdmissionController,
+    configure_threadpool,
+    db_admission,
+)
+from app.infrastructure.database import get_db
+from app.infrastructure.settings import settings
+
+
+@pytest.mark.unit
+def test_when_all_slots_are_held_then_the_next_request_is_shed():
+    """when capacity is exhausted, acquiring a slot raises a 503 with Retry-After."""
+    controller = DBAdmissionController(capacity=1, timeout=0.05, retry_after=2)
+
+    async def scenario():
+        async with controller.slot():
+            assert controller.in_flight == 1
+            with pytest.raises(DatabaseTimeoutError) as exc_info:
+                async with controller.slot():
+                    pass
+        return exc_info.value
+
+    error = asyncio.run(scenario())
+
+    assert error.status_code == 503
+    assert error.details["retry_after"] == 2
+    assert controller.in_flight == 0
+
+
+@pytest.mark.unit
+def test_when_a_slot_is_released_then_a_waiter_is_admitted():
+    """when a slot frees up within the timeout, the waiting request proceeds."""
+    controller = DBAdmissionController(capacity=1, timeout=1.0, retry_after=1)
+    admitted = []
+
+    async def holder():
+        async with controller.slot():
+            await asyncio.sleep(0.02)
+
+    async def waiter():
+        await asyncio.sleep(0.005)
+        async with controller.slot():
+            admitted.append(True)
+
+    async def scenario():
+        await asyncio.gather(holder(), waiter())
+
+    asyncio.run(scenario())
+
+    assert admitted == [True]
+
+
+@pytest.mark.unit
+def test_when_threadpool_is_configured_then_limiter_matches_settings():
+    """when configure_threadpool runs, the AnyIO limiter uses the configured size."""
+
+    async def scenario():
+        configure_threadpool()
+        return anyio.to_thread.current_default_thread_limiter().total_tokens
+
+    assert asyncio.run(scenario()) == settings.threadpool_max_workers
+
+
+@pytest.mark.unit
+def test_when_a_request_is_shed_then_response_is_503_with_retry_after():
+    """when DatabaseTimeoutError carries retry_after, the handler echoes it."""
+    app = FastAPI()
+    setup_exception_handlers(app)
+
+    @app.get("/busy")
+    async def busy():
+        raise DatabaseTimeoutError("Database is at capacity", retry_after=1)
+
+    resp = TestClient(app).get("/busy")
+
+    assert resp.status_code == 503
+    assert resp.headers["retry-after"] == "1"
+
+
+@pytest.mark.unit
+def test_when_a_request_is_shed_then_it_is_logged_once_at_warning(caplog):
+    """when admission sheds a request, one WARNING is logged, not WARNING + ERROR."""
+    app = FastAPI()
+    setup_exception_handlers(app)
+    controller = DBAdmissionController(capacity=1, timeout=0.01, retry_after=1)
+
+    @app.get("/busy")
+    async def busy():
+        async with controller.slot():
+            async with controller.slot():
+                pass
+
+    with caplog.at_level(logging.INFO, logger="app"):
+        resp = TestClient(app).get("/busy")
+
+    assert resp.status_code == 503
+    app_records = [r for r in caplog.records if r.name.startswith("app.")]
+    assert [r.levelno for r in app_records] == [logging.WARNING]
+
+
+@pytest.mark.unit
+def test_when_a_route_takes_a_db_session_then_the_slot_is_held_first():
+    """when a route depends on DBSession, get_db runs with the DB slot already held."""
+    app = FastAPI()
+    in_flight_at_open = []
+
+    def fake_get_db():
+        in_flight_at_open.append(db_admission.in_flight)
+        yield "session"
+
+    @app.get("/db")
+    def uses_db(db: DBSession):
+        return {"db": db}
+
+    app.dependency_overrides[get_db] = fake_get_db
+
+    resp = TestClient(app).get("/db")
+
+    assert resp.json() == {"db": "session"}
+    assert in_flight_at_open == [1]
@@ -0,0 +1,58 @@
+"""Unit tests for the sync driver option (``DATABASE_DRIVER``).
+
+Only URL rewriting and the prepare-threshold rule are run, so psycopg 3 itself
+is not needed.
+"""
+
+import pytest
+
+from app.infrastructure.database import (
+    DatabaseManager,
+    behind_transaction_pooler,
+    resolve_database_url,
+)
+from app.infrastructure.settings import settings
+
+
+@pytest.mark.unit
+def test_when_psycopg_is_selected_then_the_url_uses_the_psycopg3_dialect():
+    """when driver is psycopg, postgresql URLs switch dialect and keep their query."""
+    url = resolve_database_url(
+        "postgresql+psycopg2://u:p@db:5432/app?sslmode=require", "psycopg"
+    )
+
+    assert url.drivername == "postgresql+psycopg"
+    assert url.query == {"sslmode": "require"}
+    assert resolve_database_url("sqlite://", "psycopg").drivername == "sqlite"
+
+
+@pytest.mark.unit
+def test_when_the_driver_is_unknown_then_resolving_the_url_fails():
+    """when driver is not psycopg2/psycopg, a ValueError names the choices."""
+    with pytest.raises(ValueError, match="psycopg2"):
+        resolve_database_url("postgresql://db/app", "pg8000")
+
+
+@pytest.mark.unit
+def test_when_the_url_targets_a_transaction_pooler_then_it_is_detected():
+    """when the URL uses port 6543 or ?pgbouncer=true, it counts as a pooler."""
+    assert behind_transaction_pooler("postgresql://u:p@pooler:6543/postgres")
+    assert behind_transaction_pooler("postgresql://u:p@db/app?pgbouncer=true")
+    assert not behind_transaction_pooler("postgresql://u:p@pooler:5432/postgres")
+    pgbouncer_url = resolve_database_url("postgresql://db/app?pgbouncer=true")
+    assert "pgbouncer" not in pgbouncer_url.query
+
+
+@pytest.mark.unit
+def test_when_behind_a_transaction_pooler_then_prepared_statements_are_off(
+    monkeypatch,
+):
+    """when the URL is a pooler, prepare_threshold is None unless forced on."""
+    monkeypatch.setattr(settings, "database_url", "postgresql://u:p@db:5432/app")
+    assert DatabaseManager._prepare_threshold() == settings.database_prepare_threshold
+
+    monkeypatch.setattr(settings, "database_url", "postgresql://u:p@pooler:6543/app")
+    assert DatabaseManager._prepare_threshold() is None
+
+    monkeypatch.setattr(settings, "database_disable_prepared_statements", False)
+    assert DatabaseManager._prepare_threshold() == settings.database_prepare_threshold
@@ -0,0 +1,88 @@
+"""Unit tests for the background health monitor and cached health checks.
+
+Probes are driven directly with ``asyncio.run`` and a patched
+``database_manager.ping``, so no database is needed; the LLM probe is off.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.infrastructure import health_monitor as health_monitor_module
+from app.infrastructure.database import DatabaseManager
+from app.infrastructure.health_monitor import HealthMonitor, ProbeResult
+from app.infrastructure.settings import settings
+
+
+@pytest.fixture
+def monitor(monkeypatch):
+    monkeypatch.setattr(settings, "health_probe_llm", False)
+    return HealthMonitor(interval=10.0, timeout=0.05, jitter=0.2)
+
+
+@pytest.mark.unit
+def test_when_the_database_probe_passes_then_the_monitor_is_ready(monitor, monkeypatch):
+    """when ping succeeds, readiness is true and the latency is recorded."""
+    monkeypatch.setattr(health_monitor_module.database_manager, "ping", lambda: 0.001)
+
+    asyncio.run(monitor.probe_once())
+
+    assert monitor.ready is True
+    assert monitor.database.latency_ms is not None
+    assert monitor.snapshot()["checks"]["database"]["ok"] is True
+
+
+@pytest.mark.unit
+def test_when_the_database_probe_hangs_then_it_times_out_as_not_ready(
+    monitor, monkeypatch
+):
+    """when ping outlives health_probe_timeout, the probe fails fast."""
+    monkeypatch.setattr(
+        health_monitor_module.database_manager, "ping", lambda: time.sleep(0.5)
+    )
+
+    start = time.perf_counter()
+    asyncio.run(monitor.probe_once())
+
+    assert time.perf_counter() - start < 0.4
+    assert monitor.ready is False
+    assert "timed out" in monitor.database.error
+
+
+@pytest.mark.unit
+def test_when_the_last_probe_is_stale_then_the_monitor_is_not_ready(monitor):
+    """when the last pass is older than three intervals, readiness is withdrawn."""
+    monitor.database = ProbeResult(
+        ok=True, latency_ms=1.0, checked_at=time.time() - 4 * monitor.interval
+    )
+
+    assert monitor.ready is False
+
+
+@pytest.mark.unit
+def test_when_the_next_probe_is_scheduled_then_jitter_stays_in_bounds(monitor):
+    """when delays are drawn, each lies within interval ± jitter."""
+    delays = [monitor._next_delay() for _ in range(200)]
+
+    assert min(delays) >= 8.0
+    assert max(delays) <= 12.0
+    assert len(set(delays)) > 1
+
+
+@pytest.mark.unit
+def test_when_the_health_check_fails_then_the_failure_is_cached():
+    """when health_check fails, a repeat call within the TTL does not probe again."""
+    manager = DatabaseManager()
+    manager._is_initialized = True
+    calls = []
+
+    def failing_ping():
+        calls.append(1)
+        raise RuntimeError("connection refused")
+
+    manager.ping = failing_ping
+
+    assert manager.health_check() is False
+    assert manager.health_check() is False
+    assert len(calls) == 1
@@ -0,0 +1,73 @@
+"""Unit tests for response-body sampling in ``LoggingMiddleware``.
+
+A bare Starlette app is wrapped directly and the completion record is read
+back with ``caplog``.
+"""
+
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Route
+
+from app.api.middleware.logging import LoggingMiddleware
+
+app = Starlette(
+    routes=[
+        Route("/ok", lambda request: JSONResponse({"message": "x" * 100})),
+        Route("/fail", lambda request: JSONResponse({"error": "boom"}, 500)),
+        Route("/audit/ok", lambda request: PlainTextResponse("audited")),
+    ]
+)
+
+
+def _completion(caplog, path: str, **options) -> logging.LogRecord:
+    client = TestClient(LoggingMiddleware(app, **options))
+    with caplog.at_level(logging.INFO, logger="app.api.middleware.logging"):
+        caplog.clear()
+        response = client.get(path)
+    assert response.headers["x-request-id"]
+    (record,) = [
+        r
+        for r in caplog.records
+        if getattr(r, "event_type", None) == "request_complete"
+    ]
+    return record
+
+
+@pytest.mark.unit
+def test_when_sampling_is_off_then_no_body_is_logged(caplog):
+    """when the defaults are used, the completion line has no response body."""
+    record = _completion(caplog, "/fail")
+
+    assert record.status_code == 500
+    assert not hasattr(record, "response_body")
+
+
+@pytest.mark.unit
+def test_when_on_5xx_is_set_then_error_bodies_are_logged_raw(caplog):
+    """when a 5xx is returned with on_5xx, the body bytes are logged as sent."""
+    record = _completion(caplog, "/fail", body_on_5xx=True)
+
+    assert record.response_body == '{"error":"boom"}'
+    assert record.response_body_truncated is False
+    assert not hasattr(_completion(caplog, "/ok", body_on_5xx=True), "response_body")
+
+
+@pytest.mark.unit
+def test_when_a_sampled_body_exceeds_max_bytes_then_it_is_truncated(caplog):
+    """when the body is larger than body_max_bytes, only the prefix is kept."""
+    record = _completion(caplog, "/ok", body_sample_rate=1.0, body_max_bytes=16)
+
+    assert record.response_body == '{"message":"xxxx'
+    assert record.response_body_truncated is True
+
+
+@pytest.mark.unit
+def test_when_a_path_is_allow_listed_then_its_body_is_always_logged(caplog):
+    """when the path starts with a body_paths prefix, the body is captured."""
+    record = _completion(caplog, "/audit/ok", body_paths=["/audit"])
+
+    assert record.response_body == "audited"
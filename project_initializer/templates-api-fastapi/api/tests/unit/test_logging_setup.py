@@ -0,0 +1,93 @@
+"""Unit tests for the queue-based logging pipeline (``app.infrastructure.logging_setup``).
+
+Each test builds its own logger, queue and listener writing to a ``StringIO``,
+so the root logger configured by ``app.main`` is left alone.
+"""
+
+import io
+import json
+import logging
+import queue
+from logging.handlers import QueueListener
+
+import pytest
+
+from app.infrastructure.logging_setup import (
+    JsonFormatter,
+    _ContextQueueHandler,
+    get_request_id,
+    reset_request_id,
+    set_request_id,
+)
+
+
+@pytest.fixture
+def pipeline():
+    """A logger routed through the queue handler into a JSON-formatted buffer."""
+    stream = io.StringIO()
+    output = logging.StreamHandler(stream)
+    output.setFormatter(JsonFormatter())
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, output)
+    listener.start()
+
+    test_logger = logging.getLogger("tests.logging_setup")
+    test_logger.propagate = False
+    test_logger.setLevel(logging.INFO)
+    handler = _ContextQueueHandler(log_queue)
+    test_logger.addHandler(handler)
+
+    def lines():
+        listener.stop()
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    yield test_logger, lines
+    test_logger.removeHandler(handler)
+
+
+@pytest.mark.unit
+def test_when_a_message_has_quotes_and_newlines_then_each_line_is_valid_json(
+    pipeline,
+):
+    """when the message contains quotes and newlines, the output still parses."""
+    test_logger, lines = pipeline
+
+    test_logger.info('said "hi"\nthen %s', "left", extra={"process_time": 0.25})
+
+    (entry,) = lines()
+    assert entry["message"] == 'said "hi"\nthen left'
+    assert entry["level"] == "INFO"
+    assert entry["process_time"] == 0.25
+
+
+@pytest.mark.unit
+def test_when_a_request_id_is_bound_then_records_carry_it(pipeline):
+    """when set_request_id is active, records logged in that context include it."""
+    test_logger, lines = pipeline
+
+    token = set_request_id("req-123")
+    try:
+        test_logger.info("inside")
+    finally:
+        reset_request_id(token)
+    test_logger.info("outside")
+
+    inside, outside = lines()
+    assert inside["request_id"] == "req-123"
+    assert "request_id" not in outside
+    assert get_request_id() is None
+
+
+@pytest.mark.unit
+def test_when_an_exception_is_logged_then_the_traceback_is_in_the_entry(pipeline):
+    """when logger.exception runs, the traceback is rendered into exc_info."""
+    test_logger, lines = pipeline
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        test_logger.exception("failed")
+
+    (entry,) = lines()
+    assert entry["message"] == "failed"
+    assert "ValueError: boom" in entry["exc_info"]
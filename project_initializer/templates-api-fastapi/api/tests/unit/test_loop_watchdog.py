@@ -0,0 +1,61 @@
+"""Unit tests for the event-loop lag watchdog (``app.infrastructure.loop_watchdog``).
+
+Each test runs its own loop with ``asyncio.run`` and a short interval, blocks
+it with ``time.sleep`` and reads the report back with ``caplog``.
+"""
+
+import asyncio
+import logging
+import time
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.infrastructure.loop_watchdog import LoopWatchdog
+
+
+def block_the_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def _watch(watchdog: LoopWatchdog, block: float) -> None:
+    watchdog.start()
+    try:
+        await asyncio.sleep(0.05)
+        block_the_loop(block)
+        await asyncio.sleep(0.05)
+    finally:
+        await watchdog.stop()
+
+
+@pytest.mark.unit
+def test_when_the_loop_is_blocked_then_the_blocking_frame_is_logged(caplog):
+    """when sync code holds the loop past the threshold, its function is named once."""
+    watchdog = LoopWatchdog(interval=0.01, threshold=0.05)
+
+    with caplog.at_level(logging.WARNING, logger="app.infrastructure.loop_watchdog"):
+        asyncio.run(_watch(watchdog, block=0.3))
+
+    (record,) = [
+        r
+        for r in caplog.records
+        if getattr(r, "event_type", None) == "event_loop_blocked"
+    ]
+    assert record.blocking_function == "block_the_loop"
+    assert "_watch" in record.stack
+    assert watchdog.blocked_count == 1
+    assert watchdog.max_lag >= 0.25
+
+
+@pytest.mark.unit
+def test_when_the_loop_is_idle_then_lag_is_recorded_without_reports(caplog):
+    """when nothing blocks, lag samples are exported and nothing is logged."""
+    watchdog = LoopWatchdog(interval=0.01, threshold=0.2)
+    before = REGISTRY.get_sample_value("event_loop_lag_seconds_count") or 0.0
+
+    with caplog.at_level(logging.WARNING, logger="app.infrastructure.loop_watchdog"):
+        asyncio.run(_watch(watchdog, block=0.0))
+
+    assert REGISTRY.get_sample_value("event_loop_lag_seconds_count") > before
+    assert watchdog.blocked_count == 0
+    assert caplog.records == []
@@ -0,0 +1,95 @@
+"""Unit tests for the Prometheus metrics subsystem (``app.infrastructure.metrics``).
+
+Values are read back from the default registry with ``get_sample_value``; the
+middleware wraps a bare Starlette app and BAML calls come from a stand-in
+collector, so no LLM is called.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.api.middleware.metrics import MetricsMiddleware
+from app.infrastructure.metrics import UNMATCHED_ROUTE, record_baml_usage
+
+
+def _value(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def _boom(request):
+    raise RuntimeError("boom")
+
+
+app = Starlette(
+    routes=[
+        Route(
+            "/things/{thing_id}",
+            lambda request: PlainTextResponse(request.path_params["thing_id"]),
+        ),
+        Route("/boom", _boom),
+    ]
+)
+
+
+@pytest.mark.unit
+def test_when_requests_hit_a_route_then_they_share_its_template_series():
+    """when /things/1 and /things/2 are served, one route-template series counts both."""
+    client = TestClient(MetricsMiddleware(app))
+    labels = {"method": "GET", "route": "/things/{thing_id}", "status": "200"}
+    before = _value("http_requests_total", **labels)
+
+    client.get("/things/1")
+    client.get("/things/2")
+
+    assert _value("http_requests_total", **labels) == before + 2
+    assert (
+        _value(
+            "http_request_duration_seconds_count",
+            method="GET",
+            route="/things/{thing_id}",
+        )
+        >= 2
+    )
+    assert _value("http_requests_in_progress", method="GET") == 0
+
+
+@pytest.mark.unit
+def test_when_a_path_matches_no_route_or_raises_then_it_is_still_counted():
+    """when a path is unknown it is <unmatched>; when a handler raises it is a 500."""
+    client = TestClient(MetricsMiddleware(app), raise_server_exceptions=False)
+    unmatched = {"method": "GET", "route": UNMATCHED_ROUTE, "status": "404"}
+    failed = {"method": "GET", "route": "/boom", "status": "500"}
+    before = (
+        _value("http_requests_total", **unmatched),
+        _value("http_requests_total", **failed),
+    )
+
+    client.get("/nowhere/123")
+    client.get("/boom")
+
+    assert _value("http_requests_total", **unmatched) == before[0] + 1
+    assert _value("http_requests_total", **failed) == before[1] + 1
+
+
+@pytest.mark.unit
+def test_when_baml_calls_are_collected_then_latency_and_tokens_are_recorded():
+    """when a collector holds a finished call, its duration and tokens are exported."""
+    log = SimpleNamespace(
+        function_name="Chat",
+        selected_call=SimpleNamespace(client_name="OpenAI"),
+        timing=SimpleNamespace(duration_ms=1500),
+        usage=SimpleNamespace(input_tokens=120, output_tokens=30),
+    )
+    labels = {"function": "Chat", "client": "OpenAI"}
+    before = _value("baml_tokens_total", direction="input", **labels)
+
+    record_baml_usage(SimpleNamespace(logs=[log]))
+
+    assert _value("baml_tokens_total", direction="input", **labels) == before + 120
+    assert _value("baml_call_duration_seconds_count", outcome="ok", **labels) >= 1
@@ -0,0 +1,102 @@
+"""Unit tests for connection-pool telemetry (``app.infrastructure.pool_telemetry``).
+
+A one-connection SQLite pool with no overflow makes queuing deterministic: the
+second checkout has to wait for ``pool_timeout`` and then times out.
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.infrastructure.database import DatabaseManager
+from app.infrastructure.pool_telemetry import (
+    InstrumentedQueuePool,
+    get_pool_telemetry,
+    install_pool_telemetry,
+)
+
+
+@pytest.fixture
+def engine():
+    eng = create_engine(
+        "sqlite://",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    install_pool_telemetry(eng, "test")
+    yield eng
+    eng.dispose()
+
+
+@pytest.mark.unit
+def test_when_connections_are_used_then_events_are_counted(engine):
+    """when a connection is checked out and returned, each event is counted."""
+    with engine.connect():
+        pass
+    with engine.connect():
+        pass
+
+    events = get_pool_telemetry(engine).snapshot()["events"]
+    assert events["connect"] == 1
+    assert events["checkout"] == 2
+    assert events["checkin"] == 2
+
+
+@pytest.mark.unit
+def test_when_pool_is_exhausted_then_wait_and_timeout_are_recorded(engine):
+    """when every connection is out, the waiter's time and timeout are recorded."""
+    held = engine.connect()
+    try:
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+    finally:
+        held.close()
+
+    snapshot = get_pool_telemetry(engine).snapshot()
+    assert snapshot["events"]["timeout"] == 1
+    assert snapshot["wait"]["max_ms"] >= 50
+    assert snapshot["connect"]["count"] == 1
+
+
+@pytest.mark.unit
+def test_when_engine_is_disposed_then_telemetry_survives(engine):
+    """when the pool is recreated by dispose(), the counters carry over."""
+    with engine.connect():
+        pass
+    engine.dispose()
+
+    assert get_pool_telemetry(engine).snapshot()["events"]["checkout"] == 1
+
+
+@pytest.mark.unit
+def test_when_primary_pool_is_full_then_pool_health_reports_saturated(engine):
+    """when the primary has every connection checked out, status is saturated."""
+    manager = DatabaseManager()
+    manager._engine = engine
+
+    held = engine.connect()
+    try:
+        health = manager.get_pool_health()
+    finally:
+        held.close()
+
+    assert health["status"] == "saturated"
+    assert health["engines"]["primary"]["capacity"] == 1
+    assert "wait" in health["engines"]["primary"]
+
+
+@pytest.mark.unit
+def test_when_a_replica_is_configured_then_pool_health_omits_its_host(engine):
+    """when /health/db lists a replica, it is labelled by index, not hostname."""
+    manager = DatabaseManager()
+    manager._engine = engine
+    manager._replica_engines = [
+        create_engine("postgresql://app@replica-1.internal/app", pool_size=1)
+    ]
+
+    health = manager.get_pool_health()
+
+    assert set(health["engines"]) == {"primary", "replica_0"}
+    assert "replica-1.internal" not in str(health)
@@ -0,0 +1,94 @@
+"""Unit tests for on-demand request profiling (``X-Profile: 1``).
+
+``ProfilingMiddleware`` wraps a bare Starlette app and writes to a
+``ProfileStore`` in ``tmp_path``; the saved speedscope file is read back.
+"""
+
+import json
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from app.api.middleware.profiling import ProfilingMiddleware
+from app.infrastructure.profiling import ProfileStore
+
+
+def busy_handler(request):
+    deadline = time.perf_counter() + 0.05
+    while time.perf_counter() < deadline:
+        pass
+    return PlainTextResponse("done")
+
+
+async def stream(request):
+    async def chunks():
+        yield b"a"
+        yield b"b"
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+app = Starlette(routes=[Route("/busy", busy_handler), Route("/stream", stream)])
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ProfileStore(str(tmp_path), max_files=2)
+
+
+@pytest.mark.unit
+def test_when_x_profile_is_sent_then_a_speedscope_profile_is_stored(store):
+    """when X-Profile: 1 is sent, the response names a stored profile of the handler."""
+    client = TestClient(ProfilingMiddleware(app, store, interval_ms=1))
+
+    response = client.get("/busy", headers={"X-Profile": "1"})
+
+    assert response.text == "done"
+    profile_id = response.headers["x-profile-id"]
+    with open(store.path(profile_id)) as f:
+        profile = json.load(f)
+    frames = [frame["name"] for frame in profile["shared"]["frames"]]
+    assert "busy_handler" in frames
+    assert profile["profiles"][0]["type"] == "sampled"
+    (meta,) = store.list()
+    assert meta["name"] == "GET /busy"
+    assert meta["status_code"] == 200
+
+
+@pytest.mark.unit
+def test_when_x_profile_is_absent_then_nothing_is_profiled(store):
+    """when the header is missing, the request is passed straight through."""
+    response = TestClient(ProfilingMiddleware(app, store)).get("/busy")
+
+    assert "x-profile-id" not in response.headers
+    assert store.list() == []
+
+
+@pytest.mark.unit
+def test_when_a_streamed_response_is_profiled_then_the_body_is_intact(store):
+    """when the body is streamed, chunks pass through and a profile is still saved."""
+    response = TestClient(ProfilingMiddleware(app, store)).get(
+        "/stream", headers={"X-Profile": "1"}
+    )
+
+    assert response.text == "ab"
+    assert len(store.list()) == 1
+
+
+@pytest.mark.unit
+def test_when_more_than_max_files_are_stored_then_old_ones_are_pruned(store):
+    """when a third profile is saved with max_files=2, only the newest two stay."""
+    client = TestClient(ProfilingMiddleware(app, store))
+
+    ids = [
+        client.get("/busy", headers={"X-Profile": "1"}).headers["x-profile-id"]
+        for _ in range(3)
+    ]
+
+    assert [meta["id"] for meta in store.list()] == ids[:0:-1]
+    assert store.path(ids[0]) is None
+    assert store.path("../../etc/passwd") is None
@@ -0,0 +1,90 @@
+"""Unit tests for per-request SQL instrumentation (``app.infrastructure.query_stats``).
+
+Listeners are installed on a throwaway SQLite engine. The request-level headers
+are covered in ``tests/integration/test_query_stats_headers.py``.
+"""
+
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.infrastructure import query_stats
+from app.infrastructure.query_stats import (
+    QueryStats,
+    current_query_stats,
+    fingerprint,
+    install_query_instrumentation,
+    reset_query_stats,
+    start_query_stats,
+)
+from app.infrastructure.settings import settings
+
+
+@pytest.fixture
+def engine():
+    eng = create_engine("sqlite://")
+    install_query_instrumentation(eng)
+    yield eng
+    eng.dispose()
+
+
+@pytest.mark.unit
+def test_when_literals_differ_then_statements_share_a_fingerprint():
+    """when two statements differ only in literals, their fingerprints match."""
+    assert fingerprint("SELECT * FROM items WHERE id = 1") == fingerprint(
+        "SELECT *  FROM items\n WHERE id = 42"
+    )
+    assert fingerprint("SELECT 'a'") == "SELECT ?"
+
+
+@pytest.mark.unit
+def test_when_statements_run_inside_a_request_then_they_are_counted(engine):
+    """when a stats context is open, each executed statement is recorded."""
+    stats, token = start_query_stats()
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+    finally:
+        reset_query_stats(token)
+
+    assert stats.count == 2
+    assert stats.total_time > 0
+    assert current_query_stats() is None
+
+
+@pytest.mark.unit
+def test_when_a_statement_shape_repeats_then_it_is_reported_as_n_plus_one():
+    """when one shape runs past the threshold, repeated() reports it."""
+    stats = QueryStats()
+    for item_id in range(5):
+        stats.record(f"SELECT * FROM items WHERE id = {item_id}", 0.001)
+    stats.record("SELECT count(*) FROM items", 0.001)
+
+    assert stats.repeated(5) == [("SELECT * FROM items WHERE id = ?", 5)]
+    assert stats.repeated(6) == []
+
+
+@pytest.mark.unit
+def test_when_a_query_exceeds_the_threshold_then_it_is_logged(
+    engine, monkeypatch, caplog
+):
+    """when a statement is slower than db_slow_query_ms, a warning is logged."""
+    monkeypatch.setattr(settings, "db_slow_query_ms", 0.0)
+
+    with caplog.at_level(logging.WARNING, logger=query_stats.__name__):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    assert any("Slow query" in record.message for record in caplog.records)
+
+
+@pytest.mark.unit
+def test_when_a_statement_fails_then_no_start_time_is_left_behind(engine):
+    """when a statement raises, its pending start time is discarded."""
+    with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM no_such_table"))
+        assert conn.info.get(query_stats._START_TIMES_KEY) == []
@@ -0,0 +1,187 @@
+"""Unit tests for the sliding-window rate limiter and its ASGI middleware.
+
+The limiter runs on a fake clock so window roll-over, decay, eviction and
+sweeping are deterministic. The middleware test wraps a bare Starlette app.
+The shared backends are driven through an in-process store that counts round
+trips, and through ``SharedMemoryWindowStore`` on a file under ``tmp_path``.
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.api.middleware.rate_limiting import RateLimitingMiddleware
+from app.infrastructure.rate_limit_stores import SharedMemoryWindowStore
+from app.infrastructure.rate_limiter import LocalFastPathLimiter, SlidingWindowCounter
+from app.infrastructure.settings import settings
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+def test_when_a_key_exceeds_the_limit_then_it_is_denied_with_retry_after():
+    """when the limit is used up, the next hit is denied and says when to retry."""
+    limiter = SlidingWindowCounter(3, 60, clock=FakeClock())
+
+    decisions = [limiter.hit("ip:1") for _ in range(4)]
+
+    assert [d.allowed for d in decisions] == [True, True, True, False]
+    assert [d.remaining for d in decisions[:3]] == [2, 1, 0]
+    assert decisions[3].retry_after_seconds >= 1
+    assert limiter.hit("ip:2").allowed is True
+
+
+@pytest.mark.unit
+def test_when_the_window_slides_then_the_previous_count_decays():
+    """when half of the next window has passed, half the old hits still count."""
+    clock = FakeClock(now=1200.0)  # start of a 60s window
+    limiter = SlidingWindowCounter(10, 60, clock=clock)
+    for _ in range(10):
+        limiter.hit("ip:1")
+
+    clock.now += 90  # half-way through the next window: 10 * 0.5 = 5 counted
+    allowed = sum(limiter.hit("ip:1").allowed for _ in range(10))
+
+    assert allowed == 5
+
+
+@pytest.mark.unit
+def test_when_more_clients_than_max_keys_arrive_then_the_oldest_are_evicted():
+    """when max_keys is exceeded, the least recently seen key is dropped."""
+    limiter = SlidingWindowCounter(5, 60, max_keys=3, clock=FakeClock())
+    for client in range(5):
+        limiter.hit(f"ip:{client}")
+
+    assert len(limiter) == 3
+    assert list(limiter._entries) == ["ip:2", "ip:3", "ip:4"]
+
+
+@pytest.mark.unit
+def test_when_clients_go_idle_then_the_sweep_drops_their_entries():
+    """when keys have been idle for two windows, the periodic sweep removes them."""
+    clock = FakeClock()
+    limiter = SlidingWindowCounter(5, 60, clock=clock)
+    for client in range(100):
+        limiter.hit(f"ip:{client}")
+
+    clock.now += 180
+    limiter.hit("ip:fresh")
+
+    assert len(limiter) == 1
+
+
+@pytest.mark.unit
+def test_when_the_middleware_limit_is_hit_then_429_is_returned(monkeypatch):
+    """when a client exceeds the limit, the app is not called and 429 is sent."""
+    monkeypatch.setattr(settings, "debug", False)
+    monkeypatch.setattr(settings, "environment", "production")
+    app = Starlette(routes=[Route("/ping", lambda request: PlainTextResponse("pong"))])
+    client = TestClient(RateLimitingMiddleware(app, requests=2, window=60))
+
+    first, second, third = (client.get("/ping") for _ in range(3))
+
+    assert first.status_code == second.status_code == 200
+    assert first.headers["x-ratelimit-remaining"] == "1"
+    assert third.status_code == 429
+    assert third.json()["error"]["code"] == "RATE_LIMIT_EXCEEDED"
+    assert int(third.headers["retry-after"]) >= 1
+
+
+class CountingStore:
+    """A ``WindowStore`` over a ``SlidingWindowCounter`` that counts round trips."""
+
+    def __init__(self, limit: int, window: float, clock: FakeClock):
+        self.limit = limit
+        self.window = window
+        self.counter = SlidingWindowCounter(limit, window, clock=clock)
+        self.round_trips = 0
+        self.down = False
+
+    async def apply(self, items):
+        self.round_trips += 1
+        if self.down:
+            raise ConnectionError("store unreachable")
+        results = []
+        for key, pending, check in items:
+            for _ in range(pending):
+                self.counter.hit(key)
+            entry = self.counter._entries.get(key, [0, 0, 0])
+            current, previous = entry[1], entry[2]
+            allowed = check and self.counter.hit(key).allowed
+            offset = self.counter._clock() % self.window
+            results.append((allowed, current, previous, offset))
+        return results
+
+
+@pytest.mark.unit
+def test_when_a_client_is_far_below_the_limit_then_hits_skip_the_store():
+    """when a key has budget to spare, most hits are decided locally."""
+    clock = FakeClock(now=1200.0)
+    store = CountingStore(1000, 60, clock)
+    limiter = LocalFastPathLimiter(
+        store, sync_interval=1.0, local_fraction=0.1, clock=clock
+    )
+
+    decisions = [asyncio.run(limiter.check("ip:1")) for _ in range(50)]
+
+    assert all(d.allowed for d in decisions)
+    assert store.round_trips == 1
+    clock.now += 2  # the local budget expires; pending hits go with the next sync
+    asyncio.run(limiter.check("ip:1"))
+    assert store.round_trips == 2
+    assert store.counter._entries["ip:1"][1] == 51
+
+
+@pytest.mark.unit
+def test_when_a_client_nears_the_limit_then_every_hit_goes_to_the_store():
+    """when the budget is nearly spent, the shared store decides and denies."""
+    clock = FakeClock(now=1200.0)
+    store = CountingStore(5, 60, clock)
+    limiter = LocalFastPathLimiter(store, local_fraction=0.1, clock=clock)
+
+    decisions = [asyncio.run(limiter.check("ip:1")) for _ in range(7)]
+
+    assert [d.allowed for d in decisions] == [True] * 5 + [False, False]
+    # The second denial is answered from the local cache.
+    assert store.round_trips == 6
+    assert decisions[-1].retry_after_seconds >= 1
+
+
+@pytest.mark.unit
+def test_when_the_store_is_unreachable_then_the_limiter_fails_open():
+    """when the store raises, requests are allowed rather than rejected."""
+    clock = FakeClock()
+    store = CountingStore(1, 60, clock)
+    store.down = True
+    limiter = LocalFastPathLimiter(store, clock=clock)
+
+    assert all(asyncio.run(limiter.check("ip:1")).allowed for _ in range(3))
+
+
+@pytest.mark.unit
+def test_when_two_workers_share_memory_then_they_share_one_budget(tmp_path):
+    """when two stores map the same file, hits from both count against one limit."""
+    path = str(tmp_path / "ratelimit")
+    first = SharedMemoryWindowStore(path, "test", limit=4, window=60, buckets=8)
+    second = SharedMemoryWindowStore(path, "test", limit=4, window=60, buckets=8)
+
+    async def hit(store):
+        ((allowed, _, _, _),) = await store.apply([("ip:1", 0, True)])
+        return allowed
+
+    results = [asyncio.run(hit(store)) for store in (first, second) * 3]
+
+    assert results == [True, True, True, True, False, False]
+    assert asyncio.run(first.apply([("ip:2", 0, True)]))[0][0] is True
+    first.close()
+    second.close()
@@ -0,0 +1,122 @@
+"""Unit tests for read-replica routing in ``DatabaseManager``.
+
+Builds a manager around throwaway SQLite ``QueuePool`` engines (no PostgreSQL
+needed) and seeds the cached lag measurements directly, so only the selection
+rules are exercised: lag budget, unreachable replicas, least-loaded choice, and
+the fallback to the primary. The background lag probe is checked to stay off
+the request path.
+"""
+
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from app.infrastructure.database import DatabaseManager
+from app.infrastructure.settings import settings
+
+
+def _engine():
+    """Return a QueuePool-backed SQLite engine (checkout counters are real)."""
+    return create_engine("sqlite://", poolclass=QueuePool)
+
+
+@pytest.fixture
+def manager():
+    """A manager with a primary and two replicas whose lag is freshly 'measured'."""
+    mgr = DatabaseManager()
+    mgr._engine = _engine()
+    mgr._replica_engines = [_engine(), _engine()]
+    mgr._replica_lag = {0: 0.0, 1: 0.0}
+    yield mgr
+    for engine in [mgr._engine, *mgr._replica_engines]:
+        engine.dispose()
+
+
+@pytest.mark.unit
+def test_when_no_replicas_configured_then_reads_use_the_primary():
+    """when no replica is configured, the read engine is the primary."""
+    mgr = DatabaseManager()
+    mgr._engine = _engine()
+
+    assert mgr._select_read_engine() is mgr._engine
+
+
+@pytest.mark.unit
+def test_when_replicas_are_healthy_then_reads_never_use_the_primary(manager):
+    """when every replica is within the lag budget, reads go to a replica."""
+    chosen = {manager._select_read_engine() for _ in range(4)}
+
+    assert chosen == set(manager._replica_engines)
+
+
+@pytest.mark.unit
+def test_when_a_replica_lags_past_the_budget_then_it_is_skipped(manager):
+    """when one replica exceeds database_replica_max_lag, only the other serves reads."""
+    manager._replica_lag[0] = settings.database_replica_max_lag + 1
+
+    assert {manager._select_read_engine() for _ in range(4)} == {
+        manager._replica_engines[1]
+    }
+
+
+@pytest.mark.unit
+def test_when_every_replica_is_unreachable_then_reads_fall_back_to_primary(manager):
+    """when every replica failed its lag probe, reads fall back to the primary."""
+    manager._replica_lag = {0: None, 1: None}
+
+    assert manager._select_read_engine() is manager._engine
+
+
+@pytest.mark.unit
+def test_when_a_replica_is_busier_then_the_least_loaded_one_is_chosen(manager):
+    """when one replica has connections checked out, the idle replica is chosen."""
+    busy, idle = manager._replica_engines
+    held = busy.connect()
+    try:
+        assert {manager._select_read_engine() for _ in range(4)} == {idle}
+    finally:
+        held.close()
+
+
+@pytest.mark.unit
+def test_when_status_requested_then_each_engine_reports_pool_stats(manager):
+    """when the detailed status is built, primary and replicas each report pool stats."""
+    engines = manager.get_detailed_status()["engines"]
+
+    assert set(engines) == {"primary", "replica_0", "replica_1"}
+    assert engines["replica_0"]["checked_out"] == 0
+    assert engines["replica_1"]["lag_seconds"] == 0.0
+
+
+@pytest.mark.unit
+def test_when_a_read_is_routed_then_no_replica_is_probed_inline(manager, monkeypatch):
+    """when lag was never measured, reads use the primary without probing inline."""
+    probed = []
+    monkeypatch.setattr(
+        DatabaseManager, "_measure_replica_lag", staticmethod(probed.append)
+    )
+    manager._replica_lag = {}
+
+    assert manager._select_read_engine() is manager._engine
+    assert probed == []
+
+
+@pytest.mark.unit
+def test_when_the_probe_thread_runs_then_it_publishes_replica_lag(manager, monkeypatch):
+    """when the background probe starts, lag is measured off the request path."""
+    monkeypatch.setattr(
+        DatabaseManager, "_measure_replica_lag", staticmethod(lambda engine: 0.25)
+    )
+    manager._replica_lag = {}
+
+    manager._start_replica_probe()
+    deadline = time.monotonic() + 2
+    while not manager._replica_lag and time.monotonic() < deadline:
+        time.sleep(0.01)
+    manager._replica_probe_stop.set()
+    manager._replica_probe_thread.join(timeout=1)
+
+    assert manager._replica_lag == {0: 0.25, 1: 0.25}
+    assert not manager._replica_probe_thread.is_alive()
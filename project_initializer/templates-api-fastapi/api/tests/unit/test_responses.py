@@ -0,0 +1,72 @@
+"""Unit tests for the fast JSON paths in ``app.api.responses``.
+
+``RowPage`` must write the same bytes as ``ItemListResponse`` for every row
+shape a service can return: cached domain entities, ORM instances, and the
+read-only ``Row`` tuples from ``get_multi_rows``. A sparse fieldset must reach
+the SQL: the SELECTs are recorded with a cursor event. The rows come from the
+in-memory SQLite ``db_session`` fixture.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from app.api.responses import FastJSONResponse, RowPage, row_page
+from app.api.schemas import ItemCreate
+from app.api.schemas.item import ItemListResponse, ItemResponse
+from app.application.services.item_service import ItemService, to_entity
+from app.infrastructure.repositories.item import ItemRepository
+
+
+@pytest.mark.unit
+def test_when_a_page_is_dumped_from_any_row_shape_then_bytes_match_the_model(
+    db_session,
+):
+    """when rows are entities, ORM instances or Row tuples, the JSON is identical."""
+    repo = ItemRepository(db_session)
+    repo.create(ItemCreate(name="Widget", description="ünïcode", price=2.5))
+    repo.create(ItemCreate(name="Gadget", is_active=False))
+    orm_rows = repo.get_multi(limit=2)
+    rows = repo.get_multi_rows(limit=2)
+    expected = ItemListResponse(items=orm_rows, total=7).model_dump_json().encode()
+
+    page = RowPage(ItemResponse)
+
+    assert page.dump_json(orm_rows, 7) == expected
+    assert page.dump_json(rows, 7) == expected
+    assert page.dump_json([to_entity(row) for row in rows], 7) == expected
+    assert page.dump_json([], 0) == b'{"items":[],"total":0}'
+
+
+@pytest.mark.unit
+def test_when_the_default_response_renders_then_it_is_compact_utf8_json():
+    """when FastJSONResponse renders, output matches JSONResponse's compact form."""
+    response = FastJSONResponse({"name": "ünïcode", 1: [True, None]})
+
+    assert response.body == '{"name":"ünïcode","1":[true,null]}'.encode()
+    assert response.media_type == "application/json"
+
+
+@pytest.mark.unit
+def test_when_a_fieldset_is_pushed_down_then_only_those_columns_are_selected(
+    db_session,
+):
+    """when an uncached service gets fields, the SELECT and the JSON hold just those."""
+    service = ItemService(ItemRepository(db_session))
+    item_id = service.create(ItemCreate(name="Widget", description="x" * 400)).id
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        rows = service.list(limit=1, fields=("id", "name"))
+        row = service.get(item_id, fields=("name",))
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert rows[0]._fields == ("id", "name")
+    assert row._fields == ("name",)
+    assert all("description" not in sql for sql in statements)
+    assert row_page(ItemResponse, ("name",)).dump_row_json(row) == b'{"name":"Widget"}'
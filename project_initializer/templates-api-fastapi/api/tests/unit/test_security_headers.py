@@ -0,0 +1,99 @@
+"""Unit tests for the pure-ASGI ``SecurityHeadersMiddleware``.
+
+A bare Starlette app is wrapped directly; the streaming test drives the ASGI
+callable by hand to see when each body chunk reaches the server.
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from app.api.middleware.security import API_CSP, DOCS_CSP, SecurityHeadersMiddleware
+from app.infrastructure.settings import settings
+
+
+def _framed(request):
+    return PlainTextResponse("ok", headers={"X-Frame-Options": "SAMEORIGIN"})
+
+
+app = Starlette(
+    routes=[
+        Route("/ping", lambda request: PlainTextResponse("pong")),
+        Route("/docs", lambda request: PlainTextResponse("docs")),
+        Route("/framed", _framed),
+    ]
+)
+
+
+@pytest.mark.unit
+def test_when_an_api_route_responds_then_the_security_headers_are_added(
+    monkeypatch,
+):
+    """when /ping answers, every header is present with the restrictive CSP."""
+    monkeypatch.setattr(settings, "debug", True)
+    client = TestClient(SecurityHeadersMiddleware(app))
+
+    response = client.get("/ping")
+
+    assert response.headers["content-security-policy"] == API_CSP
+    assert response.headers["x-content-type-options"] == "nosniff"
+    assert response.headers["x-api-version"] == settings.version
+
+
+@pytest.mark.unit
+def test_when_docs_are_served_then_the_csp_depends_on_debug(monkeypatch):
+    """when /docs is requested, only debug mode relaxes the CSP for Swagger UI."""
+    client = TestClient(SecurityHeadersMiddleware(app))
+
+    monkeypatch.setattr(settings, "debug", True)
+    assert client.get("/docs").headers["content-security-policy"] == DOCS_CSP
+    monkeypatch.setattr(settings, "debug", False)
+    assert client.get("/docs").headers["content-security-policy"] == API_CSP
+
+
+@pytest.mark.unit
+def test_when_the_app_sets_a_security_header_then_it_is_replaced():
+    """when a response already carries X-Frame-Options, it is not duplicated."""
+    client = TestClient(SecurityHeadersMiddleware(app))
+
+    response = client.get("/framed")
+
+    assert response.headers.get_list("x-frame-options") == ["DENY"]
+
+
+@pytest.mark.unit
+def test_when_a_response_streams_then_chunks_are_not_buffered():
+    """when an SSE stream yields, each chunk is sent before the next is made."""
+    first_chunk_sent = asyncio.Event()
+
+    async def events():
+        yield b"data: 1\n\n"
+        # Blocks until the middleware has passed the first chunk on.
+        await asyncio.wait_for(first_chunk_sent.wait(), timeout=1)
+        yield b"data: 2\n\n"
+
+    async def stream_app(scope, receive, send):
+        response = StreamingResponse(events(), media_type="text/event-stream")
+        await response(scope, receive, send)
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+        if message.get("body") == b"data: 1\n\n":
+            first_chunk_sent.set()
+
+    async def receive():
+        await asyncio.sleep(1)
+        return {"type": "http.disconnect"}
+
+    scope = {"type": "http", "path": "/chat/stream", "method": "GET", "headers": []}
+    asyncio.run(SecurityHeadersMiddleware(stream_app)(scope, receive, send))
+
+    bodies = [m["body"] for m in messages if m["type"] == "http.response.body"]
+    assert bodies[:2] == [b"data: 1\n\n", b"data: 2\n\n"]
+    assert (b"x-frame-options", b"DENY") in messages[0]["headers"]
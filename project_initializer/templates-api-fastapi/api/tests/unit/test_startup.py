@@ -0,0 +1,73 @@
+"""Unit tests for the startup stage (``app.infrastructure.startup``/``migrations``).
+
+SQLite file engines stand in for PostgreSQL: the pool warm-up needs real
+connections to count, and the alembic check only reads ``alembic_version``.
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from app.infrastructure.migrations import head_revisions, schema_at_head
+from app.infrastructure.startup import StartupTimings, warm_pool
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    eng = create_engine(
+        f"sqlite:///{tmp_path / 'startup.db'}",
+        poolclass=QueuePool,
+        pool_size=4,
+        connect_args={"check_same_thread": False},
+    )
+    yield eng
+    eng.dispose()
+
+
+@pytest.mark.unit
+def test_when_the_pool_is_warmed_then_pool_size_connections_are_idle_in_it(
+    file_engine,
+):
+    """when warm_pool runs, every opened connection is back in the pool."""
+    assert warm_pool(file_engine, 4) == 4
+
+    assert file_engine.pool.checkedin() == 4
+    assert file_engine.pool.checkedout() == 0
+
+
+@pytest.mark.unit
+def test_when_the_database_has_no_alembic_version_then_schema_is_not_at_head(
+    file_engine,
+):
+    """when alembic never ran, create_all must still run."""
+    assert schema_at_head(file_engine) is False
+
+
+@pytest.mark.unit
+def test_when_alembic_is_at_head_then_create_all_can_be_skipped(file_engine):
+    """when alembic_version holds the scripts' head (not an older one), skip it."""
+    (head,) = head_revisions()
+    with file_engine.begin() as conn:
+        conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32))"))
+        conn.execute(text("INSERT INTO alembic_version VALUES ('stale')"))
+
+    assert schema_at_head(file_engine) is False
+
+    with file_engine.begin() as conn:
+        conn.execute(text("UPDATE alembic_version SET version_num = :v"), {"v": head})
+
+    assert schema_at_head(file_engine) is True
+
+
+@pytest.mark.unit
+def test_when_steps_are_timed_then_each_is_reported_in_the_summary():
+    """when steps run under StartupTimings, each name and duration is recorded."""
+    timings = StartupTimings()
+    with timings.step("database"):
+        pass
+    with timings.step("pool_warmup"):
+        pass
+
+    assert list(timings.steps) == ["database", "pool_warmup"]
+    assert timings.summary().startswith("database=")
+    assert timings.total_ms >= 0
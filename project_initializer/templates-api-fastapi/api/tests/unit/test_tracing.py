@@ -0,0 +1,130 @@
+"""Unit tests for request tracing (``app.infrastructure.tracing``).
+
+The tracer is pointed at an ``InMemorySpanExporter`` for each test and reset
+afterwards. Requests go through ``TracingMiddleware`` around a small FastAPI
+app; SQL spans come from an in-memory SQLite engine with the ``query_stats``
+listeners installed.
+"""
+
+import json
+import time
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.api.middleware.logging import LoggingMiddleware
+from app.api.middleware.tracing import TracingMiddleware
+from app.infrastructure.query_stats import install_query_instrumentation
+from app.infrastructure.tracing import (
+    InMemorySpanExporter,
+    OTLPFileExporter,
+    parse_traceparent,
+    traced,
+    tracer,
+)
+
+CALLER_TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+CALLER_SPAN_ID = "00f067aa0ba902b7"
+
+engine = create_engine("sqlite://")
+install_query_instrumentation(engine)
+
+
+@traced("auth.get_current_user")
+async def get_current_user() -> str:
+    return "alice"
+
+
+app = FastAPI()
+
+
+@app.get("/things/{thing_id}")
+def read_thing(thing_id: int, user: str = Depends(get_current_user)):
+    with engine.connect() as conn:
+        value = conn.execute(text("SELECT :v"), {"v": thing_id}).scalar()
+    return {"value": value, "user": user}
+
+
+@pytest.fixture
+def exporter():
+    """Tracing on, finished spans kept in memory."""
+    memory = InMemorySpanExporter()
+    tracer.configure(memory)
+    yield memory
+    tracer.configure(None)
+
+
+@pytest.mark.unit
+def test_when_traceparent_is_valid_or_malformed_then_it_is_parsed_or_rejected():
+    """when a header is well formed it yields ids and flag, otherwise None."""
+    assert parse_traceparent(f"00-{CALLER_TRACE_ID}-{CALLER_SPAN_ID}-01") == (
+        CALLER_TRACE_ID,
+        CALLER_SPAN_ID,
+        True,
+    )
+    assert parse_traceparent(f"00-{CALLER_TRACE_ID}-{CALLER_SPAN_ID}-00")[2] is False
+    assert parse_traceparent(f"00-{'0' * 32}-{CALLER_SPAN_ID}-01") is None
+    assert parse_traceparent("00-nothex-01") is None
+
+
+@pytest.mark.unit
+def test_when_a_request_carries_traceparent_then_all_spans_join_that_trace(exporter):
+    """when a caller sends traceparent, request, auth and SQL spans share its trace."""
+    client = TestClient(TracingMiddleware(LoggingMiddleware(app)))
+
+    response = client.get(
+        "/things/7",
+        headers={
+            "traceparent": f"00-{CALLER_TRACE_ID}-{CALLER_SPAN_ID}-01",
+            "x-request-id": "req-abc",
+        },
+    )
+
+    assert response.json() == {"value": 7, "user": "alice"}
+    (server,) = exporter.by_name("GET /things/{thing_id}")
+    (auth,) = exporter.by_name("auth.get_current_user")
+    (query,) = exporter.by_name("db.query")
+    assert server.trace_id == CALLER_TRACE_ID
+    assert server.parent_id == CALLER_SPAN_ID
+    assert server.attributes["http.status_code"] == 200
+    assert auth.parent_id == server.span_id
+    assert query.parent_id == server.span_id
+    assert query.trace_id == CALLER_TRACE_ID
+    assert query.attributes["db.statement"] == "SELECT ?"
+    assert server.attributes["http.request_id"] == "req-abc"
+    assert response.headers["x-request-id"] == "req-abc"
+    assert response.headers["traceparent"] == server.traceparent
+
+
+@pytest.mark.unit
+def test_when_no_request_is_traced_then_nothing_is_recorded(exporter):
+    """when SQL runs outside a request, or the caller opted out, no spans exist."""
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    TestClient(TracingMiddleware(app)).get(
+        "/things/1",
+        headers={"traceparent": f"00-{CALLER_TRACE_ID}-{CALLER_SPAN_ID}-00"},
+    )
+
+    assert exporter.spans == []
+
+
+@pytest.mark.unit
+def test_when_spans_go_to_the_otlp_file_then_each_line_is_otlp_json(tmp_path):
+    """when the OTLP-file exporter is used, spans are written as resourceSpans."""
+    path = tmp_path / "traces.jsonl"
+    tracer.configure(OTLPFileExporter(str(path), "tests"))
+    try:
+        TestClient(TracingMiddleware(app)).get("/things/3")
+    finally:
+        tracer.configure(None)
+
+    spans = [
+        json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        for line in path.read_text().splitlines()
+    ]
+    names = {span["name"] for span in spans}
+    assert names == {"GET /things/{thing_id}", "auth.get_current_user", "db.query"}
+    assert all(int(s["endTimeUnixNano"]) <= time.time_ns() for s in spans)
@@ -0,0 +1,313 @@
+"""DB-backed items router — async variant merged by ``--async-db``.
+
+``async def`` handlers over ``AsyncItemService`` → ``AsyncItemRepository`` →
+``AsyncSession`` (``get_async_db``). The handlers and this router's own
+dependencies (pagination, ``?fields=``, the service) are coroutines, so the
+reads (list, search, get) run entirely on the event loop. The write routes also
+depend on ``CurrentUser`` from ``deps.py``, which is not part of this overlay:
+where that dependency is a sync ``def`` it still takes a threadpool thread (and
+without auth it looks the default user up through a sync ``DBSession``). The
+service owns the transaction; the router only translates domain results into
+HTTP — ``None``/``False`` from the service become ``404``.
+
+The bulk import stays a sync ``def`` on the sync ``ItemService``: reading the
+spooled upload and the PostgreSQL ``COPY`` are blocking, so they belong in the
+threadpool. ``async_db_lifespan`` rides on this router; FastAPI merges it into
+the app lifespan so the async pool is checked at startup and disposed on exit.
+
+Reads go through ``async_cache`` (``CACHE_BACKEND``); the import service
+uses the sync ``cache`` over the same store, so both invalidate the same keys.
+"""
+
+import inspect
+from typing import Annotated, Any, Optional
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.conditional import conditional, page_etag, row_etag
+from app.api.cursors import decode_cursor, encode_cursor
+from app.api.deps import CurrentUser, DBSession, PaginationParams
+from app.api.fieldsets import FieldSet, field_selector
+from app.api.item_import import ItemImportReader, detect_import_format
+from app.api.responses import row_page
+from app.api.schemas.item import (
+    ItemCreate,
+    ItemImportResponse,
+    ItemListResponse,
+    ItemResponse,
+    ItemSearchResponse,
+    ItemUpdate,
+)
+from app.application.services.async_item_service import AsyncItemService
+from app.application.services.item_service import ItemService
+from app.infrastructure.admission import admit_db_request
+from app.infrastructure.audit import write_audit_log
+from app.infrastructure.cache import async_cache, cache
+from app.infrastructure.database_async import async_db_lifespan, get_async_db
+from app.infrastructure.repositories.item import ItemRepository
+from app.infrastructure.repositories.item_async import AsyncItemRepository
+from app.infrastructure.settings import settings
+
+# UUID string ids — Path(min_length=1) rejects an empty segment (a numeric
+# constraint like ge= would not apply to a str).
+ItemId = Annotated[str, Path(min_length=1)]
+
+# Shared 404 OpenAPI doc for the three id-addressed routes (DRY). Spread with
+# ``{**...}`` at each call site so every decorator gets its own dict instance.
+ITEM_NOT_FOUND_RESPONSE = {404: {"description": "Item not found"}}
+
+# Conditional GETs (see app.api.conditional): 304 when the validators still match
+NOT_MODIFIED_RESPONSE = {304: {"description": "Not modified (ETag still matches)"}}
+
+# ?fields=id,name selects and serializes only those columns (app.api.fieldsets)
+ItemFields = Annotated[FieldSet, Depends(field_selector(ItemResponse))]
+
+router = APIRouter(prefix="/items", tags=["Items"], lifespan=async_db_lifespan)
+
+
+async def get_pagination(**params: Any) -> PaginationParams:
+    """``Pagination`` built on the event loop.
+
+    FastAPI builds a class dependency such as ``PaginationParams`` in the
+    threadpool. This coroutine takes the same query parameters (it carries the
+    class's signature) and builds the object without a thread hop.
+    """
+    return PaginationParams(**params)
+
+
+get_pagination.__signature__ = inspect.signature(PaginationParams)  # type: ignore[attr-defined]
+Pagination = Annotated[PaginationParams, Depends(get_pagination)]
+
+
+async def get_item_service(
+    _slot: None = Depends(admit_db_request),
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncItemService:
+    """Provide an AsyncItemService for the request.
+
+    The DB admission slot is taken before the session is opened, as with
+    ``DBSession``, so a saturated pool sheds the request with 503. ``async def``
+    although it never awaits, so FastAPI calls it on the event loop.
+
+    Composition root for the async items use case: constructs the concrete
+    ``AsyncItemRepository`` adapter and injects it into the framework-free
+    ``AsyncItemService`` (which only knows the ``AsyncItemRepositoryPort``).
+    """
+    return AsyncItemService(
+        AsyncItemRepository(db), cache=async_cache, ttl=settings.cache_ttl_default
+    )
+
+
+def get_item_import_service(db: DBSession) -> ItemService:
+    """Provide the sync ItemService used by the blocking bulk import."""
+    return ItemService(ItemRepository(db), cache=cache, ttl=settings.cache_ttl_default)
+
+
+@router.get(
+    "",
+    response_model=ItemListResponse,
+    summary="List items",
+    response_description="A page of items plus the full row count.",
+    responses={**NOT_MODIFIED_RESPONSE},
+)
+async def list_items(
+    request: Request,
+    response: Response,
+    pagination: Pagination,
+    fields: ItemFields,
+    service: AsyncItemService = Depends(get_item_service),
+) -> Response:
+    """List items for the requested page; total is the full row count.
+
+    Answers 304 (nothing serialized) when ``If-None-Match`` matches the page.
+    Otherwise the rows are written straight to JSON by ``row_page``, shaped
+    like ``ItemListResponse`` (only ``fields``, if given) without validating
+    each row.
+    """
+    items = await service.list(
+        skip=pagination.skip, limit=pagination.limit, fields=fields
+    )
+    total = await service.count()
+    etag = page_etag(items, pagination.skip, pagination.limit, total, fields)
+    not_modified = conditional(request, response, "list_items", etag)
+    if not_modified is not None:
+        return not_modified
+    page = row_page(ItemResponse, fields)
+    return page.response(items, total, headers=response.headers)
+
+
+@router.get(
+    "/search",
+    response_model=ItemSearchResponse,
+    summary="Search items",
+    response_description="Matching items, best match first, plus the next cursor.",
+)
+async def search_items(
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Text to find in name/description",
+    ),
+    limit: int = Query(default=20, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(
+        default=None, description="``next_cursor`` from the previous page"
+    ),
+    service: AsyncItemService = Depends(get_item_service),
+) -> ItemSearchResponse:
+    """Case-insensitive substring search over name and description.
+
+    Served by the trigram GIN indexes on PostgreSQL and ranked by
+    ``word_similarity``, name weighted double; see ``search_statement``. Pages
+    are keyset-paginated on ``(rank, id)``, so a deep page costs the same as the
+    first and rows do not shift between pages under concurrent inserts.
+    """
+    after = decode_cursor(cursor, (int, float), str)
+    items, next_after = await service.search(q, limit=limit, after=after)
+    return ItemSearchResponse(
+        items=[ItemResponse.model_validate(item) for item in items],
+        next_cursor=None if next_after is None else encode_cursor(*next_after),
+    )
+
+
+@router.post(
+    "",
+    response_model=ItemResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create an item",
+    response_description="The newly created item.",
+)
+async def create_item(
+    item_in: ItemCreate,
+    background_tasks: BackgroundTasks,
+    current_user: CurrentUser,
+    service: AsyncItemService = Depends(get_item_service),
+) -> ItemResponse:
+    """Create a new item (write — requires an authenticated user).
+
+    Schedules a non-blocking audit-log task that runs after the response is
+    sent (FastAPI ``BackgroundTasks`` demo) — it never delays the 201.
+    """
+    item = await service.create(item_in)
+    background_tasks.add_task(write_audit_log, "item.create", item.id)
+    return item
+
+
+@router.post(
+    "/import",
+    response_model=ItemImportResponse,
+    summary="Bulk-import items",
+    response_description="How many rows were accepted and why the rest were rejected.",
+    responses={415: {"description": "Upload is neither CSV nor NDJSON"}},
+)
+def import_items(
+    current_user: CurrentUser,
+    file: UploadFile = File(..., description="CSV with a header row, or NDJSON"),
+    service: ItemService = Depends(get_item_import_service),
+) -> ItemImportResponse:
+    """Bulk-load items from a CSV or NDJSON upload (write — requires auth).
+
+    Each row is validated with the ``ItemCreate`` rules; valid rows are streamed
+    to the database in batches (``COPY`` on PostgreSQL) and committed together,
+    invalid rows are skipped and reported. Sync ``def`` on purpose: reading the
+    spooled upload and the COPY are blocking, so they run in the threadpool.
+    """
+    fmt = detect_import_format(file.filename, file.content_type)
+    if fmt is None:
+        raise HTTPException(
+            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Upload a .csv or .ndjson file",
+        )
+    reader = ItemImportReader(file.file, fmt)
+    accepted = service.bulk_import(reader.batches())
+    return ItemImportResponse(
+        accepted=accepted, rejected=reader.rejected, errors=reader.errors
+    )
+
+
+@router.get(
+    "/{item_id}",
+    response_model=ItemResponse,
+    summary="Get an item",
+    response_description="The requested item.",
+    responses={**ITEM_NOT_FOUND_RESPONSE, **NOT_MODIFIED_RESPONSE},
+)
+async def get_item(
+    item_id: ItemId,
+    request: Request,
+    response: Response,
+    fields: ItemFields,
+    service: AsyncItemService = Depends(get_item_service),
+) -> ItemResponse:
+    """Get a single item by id, or 404 if it does not exist.
+
+    Sends ``ETag`` and ``Last-Modified``; a matching ``If-None-Match`` or an
+    ``If-Modified-Since`` no older than ``updated_at`` gets a bodiless 304.
+    With ``fields`` only those columns are read and returned, and
+    ``Last-Modified`` is sent only if ``updated_at`` is one of them.
+    """
+    item = await service.get(item_id, fields=fields)
+    if item is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Item not found")
+    not_modified = conditional(
+        request,
+        response,
+        "get_item",
+        row_etag(item, fields),
+        item.updated_at if fields is None or "updated_at" in fields else None,
+    )
+    if not_modified is not None:
+        return not_modified
+    if fields is None:
+        return item
+    return row_page(ItemResponse, fields).row_response(item, headers=response.headers)
+
+
+@router.put(
+    "/{item_id}",
+    response_model=ItemResponse,
+    summary="Update an item",
+    response_description="The updated item.",
+    responses={**ITEM_NOT_FOUND_RESPONSE},
+)
+async def update_item(
+    item_id: ItemId,
+    item_in: ItemUpdate,
+    current_user: CurrentUser,
+    service: AsyncItemService = Depends(get_item_service),
+) -> ItemResponse:
+    """Update an existing item (write — requires auth), or 404 if missing."""
+    item = await service.update(item_id, item_in)
+    if item is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Item not found")
+    return item
+
+
+@router.delete(
+    "/{item_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete an item",
+    response_description="The item was deleted (no content).",
+    responses={**ITEM_NOT_FOUND_RESPONSE},
+)
+async def delete_item(
+    item_id: ItemId,
+    current_user: CurrentUser,
+    service: AsyncItemService = Depends(get_item_service),
+) -> None:
+    """Delete an item (write — requires auth), or 404 if it does not exist."""
+    if not await service.delete(item_id):
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Item not found")
@@ -0,0 +1,25 @@
+"""Users router — exposes the current user via a secret-stripping response model.
+
+Async variant merged by ``--async-db``: the handler does no blocking I/O, so it
+runs on the event loop. ``CurrentUser`` comes from ``deps.py``; where that is a
+sync ``def`` (no auth, static token) it still runs in the threadpool, and
+without auth it reads the default user through a sync ``DBSession``.
+"""
+
+from fastapi import APIRouter
+
+from app.api.deps import CurrentUser
+from app.api.schemas import UserPublic
+
+router = APIRouter(prefix="/users", tags=["Users"])
+
+
+@router.get(
+    "/me",
+    response_model=UserPublic,
+    summary="Get the current user",
+    response_description="The authenticated user, with secret fields stripped.",
+)
+async def read_current_user(current_user: CurrentUser) -> dict:
+    """Return the authenticated user; response_model=UserPublic strips any secret."""
+    return current_user
@@ -0,0 +1,147 @@
+"""Async item service — the ``--async-db`` twin of ``ItemService``.
+
+Same business rules and transaction ownership as the sync service (reads never
+commit; writes commit after success; missing ids return ``None``/``False`` for
+the router to map to 404), but every call awaits an ``AsyncItemRepositoryPort``
+so ``async def`` routes never need a threadpool thread. Depends on the domain
+port only (enforced by ``tests/unit/test_architecture.py``).
+
+Caching works as in ``ItemService`` and shares its keys: an
+``AsyncCachePort`` serves ``list``/``count``/``get``, and every committed
+write replaces the ``items:generation`` token. Pages come from
+``get_multi_rows`` as in the sync service.
+"""
+
+import uuid
+from typing import Any, List, Optional, Sequence, Tuple
+
+from app.application.services.item_service import GENERATION_KEY, to_entity
+from app.domain.entities.item import Item
+from app.domain.ports.async_item_repository import AsyncItemRepositoryPort
+from app.domain.ports.cache import AsyncCachePort
+
+
+class AsyncItemService:
+    """Business logic for items over an AsyncItemRepositoryPort."""
+
+    def __init__(
+        self,
+        repository: AsyncItemRepositoryPort,
+        cache: Optional[AsyncCachePort] = None,
+        ttl: float = 300,
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.ttl = ttl
+        self._generation: Optional[str] = None
+
+    async def _key(self, suffix: str) -> str:
+        if self._generation is None:
+            generation = await self.cache.get(GENERATION_KEY)
+            if generation is None:
+                generation = uuid.uuid4().hex
+                await self.cache.set(GENERATION_KEY, generation, None)
+            self._generation = generation
+        return f"items:{self._generation}:{suffix}"
+
+    async def _invalidate(self) -> None:
+        if self.cache is not None:
+            self._generation = uuid.uuid4().hex
+            await self.cache.set(GENERATION_KEY, self._generation, None)
+
+    async def _load_page(self, skip: int, limit: int) -> List[Item]:
+        rows = await self.repository.get_multi_rows(skip=skip, limit=limit)
+        return [to_entity(row) for row in rows]
+
+    async def _load_item(self, item_id: str) -> Optional[Item]:
+        row = await self.repository.get(item_id)
+        return None if row is None else to_entity(row)
+
+    async def list(
+        self, skip: int = 0, limit: int = 100, fields: Optional[Sequence[str]] = None
+    ) -> Sequence[Any]:
+        """Return a paginated list of items (read-only rows or cached entities).
+
+        ``fields`` narrows the repository select to those columns and skips
+        the cache, which holds whole entities: a miss would load every column,
+        and the point of a fieldset is to read and send fewer.
+        """
+        if self.cache is None or fields is not None:
+            return await self.repository.get_multi_rows(
+                skip=skip, limit=limit, columns=fields
+            )
+        page = await self.cache.get_or_load(
+            await self._key(f"list:{skip}:{limit}"),
+            lambda: self._load_page(skip, limit),
+            self.ttl,
+        )
+        return [to_entity(item) for item in page]
+
+    async def count(self) -> int:
+        """Return the total number of items (full row count, not page size)."""
+        if self.cache is None:
+            return await self.repository.count()
+        return await self.cache.get_or_load(
+            await self._key("count"), self.repository.count, self.ttl
+        )
+
+    async def exists(self, item_id: str) -> bool:
+        """Return whether an item exists, without loading it."""
+        return await self.repository.exists(item_id)
+
+    async def get(
+        self, item_id: str, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Any]:
+        """Return a single item by id, or None if it does not exist.
+
+        ``fields`` works as in ``list``.
+        """
+        if fields is not None:
+            return await self.repository.get_row(item_id, columns=fields)
+        if self.cache is None:
+            return await self.repository.get(item_id)
+        item = await self.cache.get_or_load(
+            await self._key(f"get:{item_id}"),
+            lambda: self._load_item(item_id),
+            self.ttl,
+        )
+        return None if item is None else to_entity(item)
+
+    async def search(
+        self, q: str, limit: int = 20, after: Optional[Tuple[float, str]] = None
+    ) -> Tuple[Sequence[Any], Optional[Tuple[float, str]]]:
+        """Return one page of ranked matches for ``q`` and the next page's key.
+
+        Not cached: queries are too varied to share entries. One extra row is
+        read to tell whether another page exists; the key is ``(rank, id)`` of
+        the page's last row, or ``None`` on the last page.
+        """
+        rows = await self.repository.search(q, limit=limit + 1, after=after)
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, (rows[-1].rank, rows[-1].id)
+
+    async def create(self, item_in: Any) -> Any:
+        """Create an item and commit the transaction."""
+        item = await self.repository.create(item_in)
+        await self.repository.commit()
+        await self._invalidate()
+        return item
+
+    async def update(self, item_id: str, item_in: Any) -> Optional[Any]:
+        """Update an item and commit, or return None if it does not exist."""
+        item = await self.repository.update(item_id, item_in)
+        if item is None:
+            return None
+        await self.repository.commit()
+        await self._invalidate()
+        return item
+
+    async def delete(self, item_id: str) -> bool:
+        """Delete an item and commit, or return False if it does not exist."""
+        deleted = await self.repository.delete(item_id)
+        if deleted:
+            await self.repository.commit()
+            await self._invalidate()
+        return deleted
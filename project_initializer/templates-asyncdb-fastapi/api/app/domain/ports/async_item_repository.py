@@ -0,0 +1,87 @@
+"""Async item repository port — the ``--async-db`` twin of ``ItemRepositoryPort``.
+
+Same operations as the sync port, each a coroutine, so ``AsyncItemService`` can
+drive an ``AsyncSession``-backed adapter without importing SQLAlchemy. Bulk
+import is deliberately absent: the COPY path is blocking and stays on the sync
+port. Inputs are ``Any`` for the same reason as the sync port — naming the API
+DTOs here would break the domain boundary.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional, Protocol, Sequence, Tuple, runtime_checkable
+
+
+@runtime_checkable
+class AsyncItemRepositoryPort(Protocol):
+    """Async data-access operations the item use cases require."""
+
+    async def get(self, id: Any) -> Optional[Any]:
+        """Return a single item by id, or None if absent."""
+        ...
+
+    async def get_multi(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        desc: bool = True,
+    ) -> Sequence[Any]:
+        """Return a page of items."""
+        ...
+
+    async def get_multi_rows(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        desc: bool = True,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Sequence[Any]:
+        """Return a page of items as read-only rows (attribute access, no ORM state).
+
+        ``columns`` limits the select to those fields (a sparse fieldset).
+        """
+        ...
+
+    async def get_row(
+        self, id: Any, columns: Optional[Sequence[str]] = None
+    ) -> Optional[Any]:
+        """Return one item as a read-only row of ``columns``, or None if absent."""
+        ...
+
+    async def search(
+        self, q: str, limit: int = 20, after: Optional[Tuple[float, str]] = None
+    ) -> Sequence[Any]:
+        """Return items matching ``q`` as rows with a ``rank``, best first.
+
+        Keyset-paginated: ``after`` is the ``(rank, id)`` of the previous
+        page's last row.
+        """
+        ...
+
+    async def create(self, obj_in: Any) -> Any:
+        """Persist a new item (flush only; caller owns the commit)."""
+        ...
+
+    async def update(self, id: Any, obj_in: Any) -> Optional[Any]:
+        """Update an existing item, or None if it does not exist."""
+        ...
+
+    async def delete(self, id: Any) -> bool:
+        """Delete an item, returning whether a row was removed."""
+        ...
+
+    async def count(self) -> int:
+        """Return the total item count."""
+        ...
+
+    async def exists(self, id: Any) -> bool:
+        """Return whether an item with this id exists."""
+        ...
+
+    async def commit(self) -> None:
+        """Commit the current unit of work (the service decides when)."""
+        ...
@@ -1,39 +1,71 @@
 """Opt-in async SQLAlchemy path for FastAPI (additive, isolated overlay).
 
 Provides an async engine + session factory + ``get_async_db`` dependency that
-mirror the sync ``app/database.py``, using the asyncpg driver. The sync path
-stays the default; this module is only wired in when the generator's
-``--async-db`` flag is set (follow-up issue). Pair with ``AsyncBaseRepository``
-in ``app/repositories/base_async.py``.
+mirror the sync ``app/infrastructure/database.py``, using the asyncpg driver.
+The sync path stays the default; this module is only merged in by the
+generator's ``--async-db`` flag, together with the async items slice
+(``AsyncItemRepository`` → ``AsyncItemService`` → ``async def`` routes).
 
-Required deps (added by the flag-wiring issue, not here): ``asyncpg`` and
-``sqlalchemy[asyncio]``.
+The engine takes every ``database_pool_*`` setting the sync ``DatabaseManager``
+uses plus the asyncpg statement-cache / ``command_timeout`` tuning (prepared
+statements auto-disabled behind a transaction-mode pooler), and
+``async_db_lifespan`` (attached to the items router, so FastAPI merges it
+into the app lifespan) checks connectivity on startup and disposes the pool on
+shutdown.
 """
 
+import logging
 import ssl
+import time
+import uuid
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 
+from app.infrastructure.query_stats import install_query_instrumentation
 from app.infrastructure.settings import settings
+from app.infrastructure.tracing import tracer
 
+logger = logging.getLogger(__name__)
 
-def to_asyncpg_url(url: str) -> tuple[str, dict]:
+
+# Supabase's transaction-mode pooler (Supavisor) listens here; PgBouncer setups
+# flag themselves with ?pgbouncer=true instead.
+TRANSACTION_POOLER_PORT = 6543
+
+
+def _unique_statement_name() -> str:
+    """Return a unique prepared-statement name (no clashes across pooled backends)."""
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def to_asyncpg_url(
+    url: str, disable_prepared_statements: Optional[bool] = None
+) -> tuple[str, dict]:
     """Derive an asyncpg URL + connect_args from a sync PostgreSQL URL.
 
     asyncpg rejects libpq's ``sslmode`` query param (it raises on the unknown
     parameter), so it is stripped from the query and mapped to an ``ssl``
     connect_arg — any mode except ``disable`` enables SSL. Handles
     ``postgresql://`` and ``postgresql+psycopg2://`` inputs alike.
+
+    Prepared statements break behind a transaction-mode pooler (the next
+    statement may run on another backend). With ``disable_prepared_statements``
+    left as None they are disabled automatically for port 6543 or a
+    ``pgbouncer=true`` query param (stripped, asyncpg would reject it too).
     """
     parsed = urlparse(url)
     params = parse_qs(parsed.query, keep_blank_values=True)
     sslmode = params.pop("sslmode", [None])[0]
+    pgbouncer = params.pop("pgbouncer", [None])[0]
     query = urlencode({key: value[0] for key, value in params.items()})
     asyncpg_url = urlunparse(
         (
@@ -48,18 +80,59 @@ def to_asyncpg_url(url: str) -> tuple[str, dict]:
     connect_args: dict = {}
     if sslmode and sslmode != "disable":
         connect_args["ssl"] = ssl.create_default_context()
+
+    if disable_prepared_statements is None:
+        disable_prepared_statements = parsed.port == TRANSACTION_POOLER_PORT or (
+            pgbouncer or ""
+        ).lower() in ("true", "1")
+    if disable_prepared_statements:
+        connect_args.update(
+            {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": _unique_statement_name,
+            }
+        )
     return asyncpg_url, connect_args
 
 
-_async_url, _connect_args = to_asyncpg_url(settings.database_url)
+def build_async_connect_args(connect_args: dict) -> dict:
+    """Layer the asyncpg tuning from Settings under the URL-derived args.
+
+    Pooler-forced zeros from ``to_asyncpg_url`` win over the configured cache
+    sizes. ``application_name`` and the connect timeout match the sync engine.
+    """
+    return {
+        "timeout": 10,
+        "command_timeout": settings.database_command_timeout,
+        "statement_cache_size": settings.database_statement_cache_size,
+        "prepared_statement_cache_size": settings.database_prepared_statement_cache_size,
+        "server_settings": {"application_name": f"app-api-{settings.environment}"},
+        **connect_args,
+    }
+
+
+_async_url, _connect_args = to_asyncpg_url(
+    settings.database_url, settings.database_disable_prepared_statements
+)
 
+# Same pool budget as the sync engine — with --async-db both exist, so the
+# database sees up to twice pool_size + max_overflow connections per worker.
 async_engine = create_async_engine(
     _async_url,
-    connect_args=_connect_args,
+    connect_args=build_async_connect_args(_connect_args),
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    pool_timeout=settings.database_pool_timeout,
+    pool_recycle=settings.database_pool_recycle,
     pool_pre_ping=settings.database_pool_pre_ping,
+    pool_reset_on_return=settings.database_pool_reset_on_return,
     echo=settings.database_echo,
 )
 
+# Per-request SQL count/time and N+1 detection, same as the sync engines
+install_query_instrumentation(async_engine.sync_engine)
+
 # async_sessionmaker(expire_on_commit=False) — objects stay usable after commit.
 async_session_factory = async_sessionmaker(
     bind=async_engine,
@@ -69,6 +142,46 @@ async_session_factory = async_sessionmaker(
 
 
 async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
-    """FastAPI dependency yielding an ``AsyncSession`` (closed/rolled back on exit)."""
+    """FastAPI dependency yielding an ``AsyncSession`` (closed/rolled back on exit).
+
+    The items router takes a DB admission slot before depending on it, so a
+    saturated pool sheds with 503 instead of queuing for
+    ``database_pool_timeout`` seconds.
+    """
+    setup_start = time.time_ns()
     async with async_session_factory() as session:
+        tracer.record("dependency.get_async_db", setup_start, time.time_ns())
         yield session
+
+
+async def init_async_db() -> None:
+    """Open one connection to prove the async engine can reach the database."""
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    logger.info(
+        f"Async database engine ready (pool_size={settings.database_pool_size}, "
+        f"max_overflow={settings.database_max_overflow})"
+    )
+
+
+async def close_async_db() -> None:
+    """Dispose the async pool, closing every pooled connection."""
+    await async_engine.dispose()
+    logger.info("Async database connections closed")
+
+
+@asynccontextmanager
+async def async_db_lifespan(app: Any) -> AsyncIterator[None]:
+    """Router lifespan: check the async engine on startup, dispose on shutdown.
+
+    A failed check is logged, not raised — same policy as the sync startup
+    health check, so the app still boots while the database comes up.
+    """
+    try:
+        await init_async_db()
+    except Exception as e:
+        logger.warning(f"Async database check failed but continuing startup: {e}")
+    try:
+        yield
+    finally:
+        await close_async_db()
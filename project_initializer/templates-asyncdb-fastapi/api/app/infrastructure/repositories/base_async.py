@@ -1,15 +1,16 @@
 """Async twin of ``app/repositories/base.py`` for ``AsyncSession`` (opt-in).
 
 Mirrors the sync ``BaseRepository`` CRUD shape using ``await session.execute``.
-Only ``execute``/``flush``/``refresh``/``delete`` are awaited; ``session.add``
-and the result accessors (``scalar_one_or_none``/``scalars().all()``) stay sync.
-The service layer owns ``commit``; this repository only flushes.
+Only ``execute``/``flush``/``refresh``/``delete``/``commit`` are awaited;
+``session.add`` and the result accessors (``scalar_one_or_none``/``scalars().all()``)
+stay sync. The service layer owns ``commit`` (exposed here so it can call it
+through the port); every other write only flushes.
 """
 
 from typing import Any, Generic, Optional, Sequence, Type, TypeVar
 
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import Row, func, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.orm.base import Base
@@ -26,6 +27,10 @@ class AsyncBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]
         self.model = model
         self.session = session
 
+    async def commit(self) -> None:
+        """Commit the current unit of work (called by the service, never the repo)."""
+        await self.session.commit()
+
     async def get(self, id: Any) -> Optional[ModelType]:
         """Get a single record by ID."""
         stmt = select(self.model).where(getattr(self.model, "id") == id)
@@ -45,6 +50,34 @@ class AsyncBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]
         result = await self.session.execute(stmt.offset(skip).limit(limit))
         return result.scalars().all()
 
+    async def get_multi_rows(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        desc: bool = True,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Sequence[Row]:
+        """Get a page as read-only ``Row`` tuples, mirroring the sync repo."""
+        stmt = self._ordered(select(*self._columns(columns)), order_by, desc)
+        result = await self.session.execute(stmt.offset(skip).limit(limit))
+        return result.all()
+
+    async def get_row(
+        self, id: Any, columns: Optional[Sequence[str]] = None
+    ) -> Optional[Row]:
+        """Get one record as a read-only ``Row`` of ``columns`` (default: all)."""
+        stmt = select(*self._columns(columns)).where(getattr(self.model, "id") == id)
+        result = await self.session.execute(stmt)
+        return result.one_or_none()
+
+    def _columns(self, names: Optional[Sequence[str]]) -> list:
+        """Mapped column attributes to select: ``names``, or every column."""
+        if names is None:
+            names = [c.key for c in inspect(self.model).column_attrs]
+        return [getattr(self.model, name) for name in names]
+
     def _ordered(self, stmt: Any, order_by: Optional[str], desc: bool) -> Any:
         """Apply the order_by column (or created_at fallback) to the statement."""
         name = order_by if order_by and hasattr(self.model, order_by) else None
@@ -82,3 +115,16 @@ class AsyncBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]
         await self.session.delete(db_obj)
         await self.session.flush()
         return True
+
+    async def count(self) -> int:
+        """Count total records."""
+        result = await self.session.execute(
+            select(func.count()).select_from(self.model)
+        )
+        return result.scalar_one()
+
+    async def exists(self, id: Any) -> bool:
+        """Check if a record exists by ID."""
+        stmt = select(func.count()).where(getattr(self.model, "id") == id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one() > 0
@@ -0,0 +1,25 @@
+"""Async item repository over ``AsyncSession`` (``--async-db`` overlay)."""
+
+from typing import Any, Optional, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.orm.item import Item
+from app.infrastructure.repositories.base_async import AsyncBaseRepository
+from app.infrastructure.repositories.item import search_statement
+from app.api.schemas.item import ItemCreate, ItemUpdate
+
+
+class AsyncItemRepository(AsyncBaseRepository[Item, ItemCreate, ItemUpdate]):
+    """Adapter implementing ``AsyncItemRepositoryPort`` for the Item model."""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(Item, session)
+
+    async def search(
+        self, q: str, limit: int = 20, after: Optional[Tuple[float, str]] = None
+    ) -> Sequence[Any]:
+        """Ranked substring search, sharing the sync repo's statement."""
+        dialect = self.session.get_bind().dialect.name
+        result = await self.session.execute(search_statement(dialect, q, limit, after))
+        return result.all()
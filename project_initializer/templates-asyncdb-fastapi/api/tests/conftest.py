@@ -0,0 +1,144 @@
+"""
+Pytest Configuration and Shared Fixtures
+=========================================
+
+This module provides shared fixtures for testing the FastAPI application.
+
+``--async-db`` variant: the items routes use ``get_async_db``, so the test DB is
+a temp SQLite *file* reached by both the sync engine (``get_db``) and an
+aiosqlite engine (``get_async_db``) — rows written on one path are visible on
+the other, e.g. a bulk import (sync) followed by a list (async).
+"""
+
+import pytest
+from typing import Generator
+from unittest.mock import MagicMock
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool, StaticPool
+
+from app.main import app
+from app.api.v1.endpoints import items as items_endpoints
+from app.infrastructure.cache import AsyncCache, Cache, MemoryBackend, cache
+from app.infrastructure.database import get_db, get_db_readonly
+from app.infrastructure.database_async import get_async_db
+from app.infrastructure.orm.base import Base
+
+
+@pytest.fixture(scope="session")
+def test_db_path(tmp_path_factory):
+    """Path of the SQLite file shared by the sync and async test engines."""
+    return tmp_path_factory.mktemp("db") / "test.db"
+
+
+@pytest.fixture(scope="session")
+def test_engine(test_db_path):
+    """Create a test database engine (session-scoped for performance)."""
+    engine = create_engine(
+        f"sqlite:///{test_db_path}",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    # Create all tables
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    # Drop all tables after tests
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def clear_app_cache():
+    """Start every test with an empty application cache.
+
+    Each test's rows are rolled back, so cached reads from an earlier test
+    would be stale.
+    """
+    if cache is not None and isinstance(cache.backend, MemoryBackend):
+        cache.backend.clear()
+
+
+@pytest.fixture
+def app_cache(monkeypatch):
+    """Turn the item cache on for one test (``CACHE_BACKEND`` defaults to none)."""
+    backend = MemoryBackend(max_entries=1000)
+    monkeypatch.setattr(items_endpoints, "cache", Cache(backend))
+    monkeypatch.setattr(items_endpoints, "async_cache", AsyncCache(backend))
+    return backend
+
+
+@pytest.fixture(scope="function")
+def db_session(test_engine) -> Generator[Session, None, None]:
+    """
+    Create a new database session for each test function.
+
+    Rolls back after each test for isolation.
+    """
+    TestingSessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, bind=test_engine
+    )
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+@pytest.fixture(scope="function")
+def client(db_session: Session, test_db_path) -> Generator[TestClient, None, None]:
+    """
+    Create a test client with overridden database dependencies.
+
+    Both the primary and the read-only (replica-routed) session resolve to the
+    same rolled-back ``db_session``; ``get_async_db`` opens aiosqlite sessions
+    on the same file, so async routes see rows committed by the sync path.
+    """
+
+    def override_get_db():
+        try:
+            yield db_session
+        finally:
+            pass
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_readonly] = override_get_db
+
+    # NullPool: TestClient runs the app on its own event loop per client, and
+    # aiosqlite connections must not outlive the loop that opened them.
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{test_db_path}", poolclass=NullPool
+    )
+    async_factory = async_sessionmaker(
+        bind=async_engine, expire_on_commit=False, class_=AsyncSession
+    )
+
+    async def override_get_async_db():
+        async with async_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def mock_settings():
+    """Create mock settings for testing."""
+    settings = MagicMock()
+    settings.debug = True
+    settings.environment = "test"
+    settings.project_name = "Test App"
+    settings.api_v1_str = "/api/v1"
+    return settings
+
+
+# Add more fixtures as needed:
+# - authenticated_client (with JWT token)
+# - sample_user (creates a test user)
+# - sample_data (populates test data)
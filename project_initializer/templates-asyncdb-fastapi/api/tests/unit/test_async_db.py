@@ -1,16 +1,33 @@
 """Unit tests for the opt-in async DB path (#20).
 
-Exercises the asyncpg URL derivation, the async session factory, and the
-``AsyncBaseRepository`` CRUD against an in-memory async SQLite (aiosqlite) —
+Exercises the asyncpg URL derivation, the async session factory and pool
+sizing, the ``AsyncBaseRepository`` CRUD plus ``count``/``exists``, and the
+``AsyncItemService`` transaction rules against an in-memory async SQLite (aiosqlite) —
 no live PostgreSQL needed. ``asyncio_mode = auto`` (pytest.ini) collects the
 ``async def`` tests; the module-level async engine is built lazily, so importing
 it does not open a connection.
 """
 
+import inspect
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.infrastructure.database_async import async_session_factory, get_async_db, to_asyncpg_url
+from app.api.v1.endpoints import items as items_endpoints
+from app.api.v1.endpoints import users as users_endpoints
+from app.application.services.async_item_service import AsyncItemService
+from app.infrastructure.cache import AsyncCache, MemoryBackend
+from app.domain.ports.async_item_repository import AsyncItemRepositoryPort
+from app.infrastructure.database_async import (
+    async_db_lifespan,
+    async_engine,
+    async_session_factory,
+    build_async_connect_args,
+    get_async_db,
+    to_asyncpg_url,
+)
+from app.infrastructure.repositories.item_async import AsyncItemRepository
+from app.infrastructure.settings import settings
 from app.infrastructure.orm.base import Base
 from app.infrastructure.orm.item import Item
 from app.infrastructure.repositories.base_async import AsyncBaseRepository
@@ -53,6 +70,41 @@ def test_when_url_has_no_sslmode_then_driver_is_asyncpg_and_no_ssl():
     assert connect_args == {}
 
 
+def test_when_url_targets_transaction_pooler_port_then_prepared_statements_are_off():
+    """when the URL uses port 6543, statement caches are zeroed and names made unique."""
+    _, connect_args = to_asyncpg_url("postgresql://u:p@pooler.example.com:6543/db")
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    assert (
+        connect_args["prepared_statement_name_func"]()
+        != connect_args["prepared_statement_name_func"]()
+    )
+
+
+def test_when_url_has_pgbouncer_flag_then_it_is_stripped_and_caches_disabled():
+    """when the URL carries pgbouncer=true, the param is dropped and caches are off."""
+    url, connect_args = to_asyncpg_url("postgresql://u:p@host:5432/db?pgbouncer=true")
+    assert "pgbouncer" not in url
+    assert connect_args["statement_cache_size"] == 0
+
+
+def test_when_prepared_statements_forced_on_then_pooler_port_is_ignored():
+    """when disable_prepared_statements=False, the 6543 auto-detection is overridden."""
+    _, connect_args = to_asyncpg_url("postgresql://u:p@host:6543/db", False)
+    assert "statement_cache_size" not in connect_args
+
+
+def test_when_connect_args_built_then_settings_tuning_applies_under_pooler_overrides():
+    """when connect args are built, settings fill the gaps and pooler zeros win."""
+    tuned = build_async_connect_args({})
+    assert tuned["statement_cache_size"] == settings.database_statement_cache_size
+    assert tuned["command_timeout"] == settings.database_command_timeout
+
+    pooled = build_async_connect_args(to_asyncpg_url("postgresql://u:p@h:6543/db")[1])
+    assert pooled["statement_cache_size"] == 0
+    assert pooled["prepared_statement_cache_size"] == 0
+
+
 def test_when_session_factory_built_then_it_makes_async_sessions():
     """when the async session factory is built, it produces an AsyncSession."""
     assert isinstance(async_session_factory, async_sessionmaker)
@@ -112,3 +164,96 @@ async def test_when_missing_item_deleted_then_false_is_returned(session):
     """when a missing id is deleted, False is returned."""
     repo = ItemAsyncRepository(session)
     assert await repo.delete("nope") is False
+
+
+def test_when_async_engine_built_then_pool_is_sized_from_settings():
+    """when the async engine is built, its pool uses the database_pool_* settings."""
+    assert async_engine.pool.size() == settings.database_pool_size
+    assert async_engine.pool._max_overflow == settings.database_max_overflow
+
+
+async def test_when_items_counted_then_total_rows_are_returned(session):
+    """when items are counted, the full row count is returned."""
+    repo = AsyncItemRepository(session)
+    before = await repo.count()
+    await repo.create(ItemCreate(name="One"))
+    await repo.create(ItemCreate(name="Two"))
+    assert await repo.count() == before + 2
+
+
+async def test_when_exists_checked_then_only_present_ids_match(session):
+    """when exists is checked, a created id matches and an unknown id does not."""
+    repo = AsyncItemRepository(session)
+    created = await repo.create(ItemCreate(name="Present"))
+    assert await repo.exists(created.id) is True
+    assert await repo.exists("missing") is False
+
+
+async def test_when_repository_checked_then_it_satisfies_the_async_port(session):
+    """when the async adapter is checked, it implements AsyncItemRepositoryPort."""
+    assert isinstance(AsyncItemRepository(session), AsyncItemRepositoryPort)
+
+
+async def test_when_service_creates_item_then_it_is_committed(session):
+    """when the async service creates an item, it survives a rollback (committed)."""
+    service = AsyncItemService(AsyncItemRepository(session))
+    created = await service.create(ItemCreate(name="Committed"))
+    await session.rollback()
+    assert await service.get(created.id) is not None
+    assert await service.exists(created.id) is True
+
+
+async def test_when_service_updates_missing_item_then_none_is_returned(session):
+    """when the async service updates a missing id, None is returned."""
+    service = AsyncItemService(AsyncItemRepository(session))
+    assert await service.update("missing", ItemUpdate(name="x")) is None
+    assert await service.delete("missing") is False
+
+
+async def test_when_service_reads_are_cached_then_writes_invalidate_them(session):
+    """when the async service caches a read, only its own writes refresh it."""
+    cache = AsyncCache(MemoryBackend(max_entries=100))
+    service = AsyncItemService(AsyncItemRepository(session), cache=cache, ttl=60)
+    created = await service.create(ItemCreate(name="Cached"))
+    assert await service.count() == 1
+
+    await ItemAsyncRepository(session).create(ItemCreate(name="Behind"))
+    assert await service.count() == 1
+    await service.update(created.id, ItemUpdate(name="Renamed"))
+    assert await service.count() == 2
+    assert (await service.get(created.id)).name == "Renamed"
+
+
+def test_when_async_routes_inspected_then_crud_handlers_are_coroutines():
+    """when the overlay routers are inspected, CRUD + /users/me are async def."""
+    for handler in (
+        items_endpoints.list_items,
+        items_endpoints.create_item,
+        items_endpoints.get_item,
+        items_endpoints.update_item,
+        items_endpoints.delete_item,
+        users_endpoints.read_current_user,
+    ):
+        assert inspect.iscoroutinefunction(handler), handler.__name__
+    # The blocking COPY import stays a sync handler on purpose.
+    assert not inspect.iscoroutinefunction(items_endpoints.import_items)
+    assert items_endpoints.router.lifespan_context is async_db_lifespan
+
+
+def _dependency_calls(dependant):
+    for dependency in dependant.dependencies:
+        yield dependency.call
+        yield from _dependency_calls(dependency)
+
+
+def test_when_read_routes_resolve_dependencies_then_none_takes_a_thread():
+    """when list/search/get run, every dependency is a coroutine (no threadpool hop)."""
+    reads = {"list_items", "search_items", "get_item"}
+    routes = [r for r in items_endpoints.router.routes if r.name in reads]
+
+    assert len(routes) == len(reads)
+    for route in routes:
+        for call in _dependency_calls(route.dependant):
+            assert inspect.iscoroutinefunction(call) or inspect.isasyncgenfunction(
+                call
+            ), f"{route.name}: {getattr(call, '__name__', call)}"
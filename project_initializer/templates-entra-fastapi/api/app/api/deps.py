@@ -1,9 +1,9 @@
 """Global dependencies for the application"""
 
 import logging
-import time
 from typing import Annotated, Optional
 
+import anyio
 import jwt
 from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -11,10 +11,39 @@ from jwt import PyJWKClient
 from sqlalchemy.orm import Session
 
 from app.infrastructure.settings import settings
-from app.infrastructure.database import get_db
+from app.infrastructure.admission import admit_db_request
+from app.infrastructure.database import get_db, get_db_readonly
+from app.infrastructure.metrics import RATE_LIMIT_REJECTED_TOTAL
+from app.infrastructure.rate_limiter import create_rate_limiter
+from app.infrastructure.tracing import traced
 
 logger = logging.getLogger(__name__)
 
+
+# ===========================
+# Database Sessions
+# ===========================
+# Routes depend on these rather than on get_db/get_db_readonly: the request
+# takes a DB admission slot (app.infrastructure.admission) before its session
+# is opened, so a saturated pool sheds it with 503 instead of parking a worker
+# thread in the pool queue. ``async def`` so the wrapper costs no thread hop.
+
+
+async def get_admitted_db(
+    _slot: None = Depends(admit_db_request), db: Session = Depends(get_db)
+) -> Session:
+    """Primary-database session, opened once the request holds a DB slot."""
+    return db
+
+
+async def get_admitted_db_readonly(
+    _slot: None = Depends(admit_db_request),
+    db: Session = Depends(get_db_readonly),
+) -> Session:
+    """Read-only session (replica-routed), opened once the request holds a slot."""
+    return db
+
+
 # JWKS client — module-level singleton; PyJWKClient caches keys and auto-refreshes
 # on key rotation (no hard-coded schedule needed).
 _jwks_client = PyJWKClient(settings.entra_jwks_url)
@@ -109,6 +138,7 @@ def _verify_scope(claims: dict) -> None:
         )
 
 
+@traced("auth.get_current_user")
 async def get_current_user(
     credentials: Annotated[
         Optional[HTTPAuthorizationCredentials], Depends(_bearer_scheme)
@@ -122,7 +152,8 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    claims = _validate_token(credentials.credentials)
+    # A JWKS cache miss makes PyJWKClient fetch keys over blocking HTTP
+    claims = await anyio.to_thread.run_sync(_validate_token, credentials.credentials)
     return {
         "id": claims.get("oid") or claims.get("sub", ""),
         "email": claims.get("preferred_username") or claims.get("email", ""),
@@ -132,6 +163,7 @@ async def get_current_user(
     }
 
 
+@traced("auth.get_optional_user")
 async def get_optional_user(
     credentials: Annotated[
         Optional[HTTPAuthorizationCredentials], Depends(_bearer_scheme)
@@ -157,7 +189,9 @@ OptionalUser = Annotated[Optional[dict], Depends(get_optional_user)]
 UserId = Annotated[str, Depends(get_user_id)]
 
 # Database session shortcut
-DBSession = Annotated[Session, Depends(get_db)]
+DBSession = Annotated[Session, Depends(get_admitted_db)]
+# Replica-routed session for handlers that only read (see get_db_readonly)
+ReadOnlyDBSession = Annotated[Session, Depends(get_admitted_db_readonly)]
 
 
 # ===========================
@@ -166,34 +200,31 @@ DBSession = Annotated[Session, Depends(get_db)]
 
 
 class RateLimiter:
-    """In-memory rate limiting dependency"""
+    """Rate limiting dependency (backend chosen by ``rate_limit_backend``)"""
 
     def __init__(self, requests: int = 100, window: int = 60, per_user: bool = False):
         self.requests = requests
         self.window = window
         self.per_user = per_user
-        self._in_memory_cache: dict[str, list[float]] = {}
+        self._limiter = create_rate_limiter(
+            requests, window, namespace=f"deps:{requests}/{window}"
+        )
 
-    def __call__(self, request: Request, current_user: Optional[dict] = None):
+    async def __call__(self, request: Request, current_user: Optional[dict] = None):
         key = self._build_key(request, current_user)
-        current_time = time.time()
-        window_start = current_time - self.window
-
-        if key not in self._in_memory_cache:
-            self._in_memory_cache[key] = []
-
-        self._in_memory_cache[key] = [
-            ts for ts in self._in_memory_cache[key] if ts > window_start
-        ]
-
-        if len(self._in_memory_cache[key]) >= self.requests:
+        # Budgets are per route, so shared backends keep routes apart too.
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", request.url.path)
+        decision = await self._limiter.check(f"{route_path}|{key}")
+        if not decision.allowed:
             from app.domain.exceptions import RateLimitError
 
+            RATE_LIMIT_REJECTED_TOTAL.labels(limiter="dependency").inc()
+
             raise RateLimitError(
-                message=f"Rate limit exceeded: {len(self._in_memory_cache[key])}/{self.requests} requests per {self.window}s"
+                message=f"Rate limit exceeded: {self.requests} requests per {self.window}s",
+                retry_after=decision.retry_after_seconds,
             )
-
-        self._in_memory_cache[key].append(current_time)
         return True
 
     def _build_key(self, request: Request, current_user: Optional[dict]) -> str:
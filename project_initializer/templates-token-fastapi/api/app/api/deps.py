@@ -1,7 +1,6 @@
 """Global dependencies for the application — token-based authentication"""
 
 import secrets
-import time
 import logging
 from typing import Optional, Annotated, Any
 
@@ -15,12 +14,41 @@ from sqlalchemy.orm import Session
 
 from app.infrastructure.settings import settings
 from app.infrastructure.security import decode_token
-from app.infrastructure.database import get_db
+from app.infrastructure.admission import admit_db_request
+from app.infrastructure.database import get_db, get_db_readonly
+from app.infrastructure.metrics import RATE_LIMIT_REJECTED_TOTAL
+from app.infrastructure.rate_limiter import create_rate_limiter
+from app.infrastructure.tracing import traced
 from app.infrastructure.orm import User
 from jose import JWTError
 
 logger = logging.getLogger(__name__)
 
+
+# ===========================
+# Database Sessions
+# ===========================
+# Routes depend on these rather than on get_db/get_db_readonly: the request
+# takes a DB admission slot (app.infrastructure.admission) before its session
+# is opened, so a saturated pool sheds it with 503 instead of parking a worker
+# thread in the pool queue. ``async def`` so the wrapper costs no thread hop.
+
+
+async def get_admitted_db(
+    _slot: None = Depends(admit_db_request), db: Session = Depends(get_db)
+) -> Session:
+    """Primary-database session, opened once the request holds a DB slot."""
+    return db
+
+
+async def get_admitted_db_readonly(
+    _slot: None = Depends(admit_db_request),
+    db: Session = Depends(get_db_readonly),
+) -> Session:
+    """Read-only session (replica-routed), opened once the request holds a slot."""
+    return db
+
+
 # Warn on insecure token at import time
 if settings.auth_token == "changeme" or len(settings.auth_token) < 16:
     logger.warning(
@@ -53,6 +81,7 @@ def _validate_token(credentials: Optional[HTTPAuthorizationCredentials]) -> None
 # ===========================
 
 
+@traced("auth.get_current_user")
 def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer_scheme),
 ) -> dict:
@@ -72,6 +101,7 @@ def get_current_user(
     }
 
 
+@traced("auth.get_optional_user")
 def get_optional_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer_scheme),
 ) -> Optional[dict]:
@@ -104,7 +134,9 @@ def get_user_id(
 CurrentUser = Annotated[dict, Depends(get_current_user)]
 OptionalUser = Annotated[Optional[dict], Depends(get_optional_user)]
 UserId = Annotated[str, Depends(get_user_id)]
-DBSession = Annotated[Session, Depends(get_db)]
+DBSession = Annotated[Session, Depends(get_admitted_db)]
+# Replica-routed session for handlers that only read (see get_db_readonly)
+ReadOnlyDBSession = Annotated[Session, Depends(get_admitted_db_readonly)]
 
 
 # ===========================
@@ -126,7 +158,7 @@ _CREDENTIALS_EXC = HTTPException(
 
 def get_current_user_jwt(
     token: Optional[str] = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_admitted_db),
 ) -> User:
     """Decode the bearer JWT, load the User by `sub`, or 401."""
     if token is None:
@@ -167,10 +199,10 @@ ActiveJWTUser = Annotated[User, Depends(get_current_active_user)]
 
 class RateLimiter:
     """
-    In-memory rate limiting dependency
+    Rate limiting dependency (backend chosen by ``rate_limit_backend``)
 
     Features:
-    - Sliding window rate limiting
+    - Sliding-window counter: O(1) per request, bounded LRU of client keys
     - IP-based and user-based limiting
     - Configurable requests per window
     """
@@ -179,13 +211,15 @@ class RateLimiter:
         self.requests = requests
         self.window = window
         self.per_user = per_user
-        self._in_memory_cache: dict[str, list[float]] = {}
+        self._limiter = create_rate_limiter(
+            requests, window, namespace=f"deps:{requests}/{window}"
+        )
 
-    def __call__(self, request: Request, current_user: Optional[dict] = None):
+    async def __call__(self, request: Request, current_user: Optional[dict] = None):
         """Check rate limit for the request"""
-        return self._check_memory_rate_limit(request, current_user)
+        return await self._check_rate_limit(request, current_user)
 
-    def _check_memory_rate_limit(
+    async def _check_rate_limit(
         self, request: Request, current_user: Optional[dict] = None
     ) -> bool:
         if self.per_user and current_user:
@@ -193,26 +227,19 @@ class RateLimiter:
         else:
             key = f"ip:{self._get_client_ip(request)}"
 
-        current_time = time.time()
-        window_start = current_time - self.window
-
-        if key not in self._in_memory_cache:
-            self._in_memory_cache[key] = []
-
-        self._in_memory_cache[key] = [
-            timestamp
-            for timestamp in self._in_memory_cache[key]
-            if timestamp > window_start
-        ]
-
-        if len(self._in_memory_cache[key]) >= self.requests:
+        # Budgets are per route, so shared backends keep routes apart too.
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", request.url.path)
+        decision = await self._limiter.check(f"{route_path}|{key}")
+        if not decision.allowed:
             from app.domain.exceptions import RateLimitError
 
+            RATE_LIMIT_REJECTED_TOTAL.labels(limiter="dependency").inc()
+
             raise RateLimitError(
-                message=f"Rate limit exceeded: {len(self._in_memory_cache[key])}/{self.requests} requests per {self.window}s"
+                message=f"Rate limit exceeded: {self.requests} requests per {self.window}s",
+                retry_after=decision.retry_after_seconds,
             )
-
-        self._in_memory_cache[key].append(current_time)
         return True
 
     def _get_client_ip(self, request: Request) -> str:
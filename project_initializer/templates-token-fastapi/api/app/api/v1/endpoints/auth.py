@@ -39,8 +39,7 @@ from sqlalchemy.orm import Session
 
 from app.infrastructure.settings import settings
 from app.infrastructure.security import create_access_token, hash_password, verify_password
-from app.infrastructure.database import get_db
-from app.api.deps import ActiveJWTUser, CurrentUser
+from app.api.deps import ActiveJWTUser, CurrentUser, get_admitted_db
 from app.infrastructure.orm import User
 from app.infrastructure.repositories.base import BaseRepository
 from app.api.schemas import UserCreate, UserPublic
@@ -116,7 +115,7 @@ async def get_me(current_user: CurrentUser):
     response_description="The newly created user (no credentials in the body).",
     responses={**EMAIL_TAKEN_RESPONSE},
 )
-def register(user_in: UserCreate, db: Session = Depends(get_db)) -> User:
+def register(user_in: UserCreate, db: Session = Depends(get_admitted_db)) -> User:
     """Create a new user account and return the public user representation."""
     repo = BaseRepository(User, db)
     if repo.get_by_field("email", user_in.email):
@@ -138,7 +137,7 @@ def register(user_in: UserCreate, db: Session = Depends(get_db)) -> User:
     responses={**BAD_CREDENTIALS_RESPONSE},
 )
 def login(
-    form: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
+    form: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_admitted_db)
 ) -> TokenResponse:
     """Mint a signed JWT for a registered user (OAuth2 password flow)."""
     user = BaseRepository(User, db).get_by_field("email", form.username)
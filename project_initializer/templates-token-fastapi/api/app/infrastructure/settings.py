@@ -2,7 +2,7 @@
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
-from typing import List
+from typing import Dict, List, Optional
 
 
 class Settings(BaseSettings):
@@ -32,8 +32,92 @@ class Settings(BaseSettings):
     database_pool_pre_ping: bool = Field(default=True)
     database_echo: bool = Field(default=False)
     database_pool_reset_on_return: str = Field(default="rollback")
+    # Read replicas - optional, comma-separated. Reads route to the least-loaded
+    # replica within the lag budget and fall back to the primary otherwise.
+    database_replica_urls: str = Field(default="", alias="DATABASE_REPLICA_URLS")
+    database_replica_max_lag: float = Field(default=10.0)
+    database_replica_lag_check_interval: float = Field(default=5.0)
+
+    @property
+    def database_replica_urls_list(self) -> List[str]:
+        """Get read-replica URLs as a list (empty when none are configured)"""
+        return [
+            url.strip() for url in self.database_replica_urls.split(",") if url.strip()
+        ]
+
+    # Sync driver - "psycopg2" (default) or "psycopg" (psycopg 3). With psycopg 3
+    # a statement is prepared server-side after database_prepare_threshold
+    # executions (off behind a transaction-mode pooler, as for asyncpg, or with
+    # DATABASE_DISABLE_PREPARED_STATEMENTS).
+    database_driver: str = Field(default="psycopg2")
+    database_prepare_threshold: Optional[int] = Field(default=5)
+
+    # Async engine (--async-db) asyncpg tuning. Prepared statements are turned
+    # off automatically behind a transaction-mode pooler (port 6543 or
+    # ?pgbouncer=true); set DATABASE_DISABLE_PREPARED_STATEMENTS to force it.
+    database_statement_cache_size: int = Field(default=100)
+    database_prepared_statement_cache_size: int = Field(default=100)
+    database_command_timeout: Optional[float] = Field(default=60.0)
+    database_disable_prepared_statements: Optional[bool] = Field(default=None)
+
+    # Startup warm-up - open pool_size connections and build one BAML request
+    # before serving, so a new replica's first requests skip that setup.
+    startup_warm_pool: bool = Field(default=True)
+    startup_warm_baml: bool = Field(default=True)
+
+    # Health monitor - background DB/LLM probes every interval (± jitter, as a
+    # fraction); /health/ready serves the cached result, never a query.
+    health_probe_interval: float = Field(default=10.0)
+    health_probe_jitter: float = Field(default=0.2)
+    health_probe_timeout: float = Field(default=2.0)
+    health_probe_llm: bool = Field(default=True)
+
+    # Backpressure - threadpool size and DB admission control. In-flight
+    # DB-using requests are capped at pool_size + max_overflow; a request that
+    # cannot get a slot within db_admission_timeout seconds is shed with 503.
+    # That is the primary's capacity, and one limiter covers every engine.
+    threadpool_max_workers: int = Field(default=40)
+    db_admission_enabled: bool = Field(default=True)
+    db_admission_timeout: float = Field(default=0.1)
+    db_admission_retry_after: int = Field(default=1)
+
+    # Query instrumentation - per-request SQL count/time, slow-query log, N+1
+    db_query_stats_enabled: bool = Field(default=True)
+    db_slow_query_ms: float = Field(default=200.0)
+    db_slow_query_explain: bool = Field(default=False)
+    db_n_plus_one_threshold: int = Field(default=10)
+
+    # Application cache (app.infrastructure.cache), off by default: "none",
+    # "redis" (shared, at REDIS_URL) or "memory" (per process, TTL+LRU bounded
+    # by cache_max_entries). With "memory" every worker keeps its own copy, so
+    # a write on one worker is not seen by the others, whose ETags keep
+    # answering 304, for up to cache_ttl_default seconds. Item reads are
+    # cached for cache_ttl_default seconds
     cache_ttl_default: int = Field(default=300)
-    cache_ttl_users: int = Field(default=600)
+    cache_backend: str = Field(default="none")
+    cache_max_entries: int = Field(default=10_000)
+
+    # Cache-Control per read route, by handler name (JSON object in the env).
+    # "no-cache" lets browsers keep a response but revalidate it every time,
+    # which the ETag turns into a cheap 304 (see app.api.conditional)
+    http_cache_control: Dict[str, str] = Field(
+        default_factory=lambda: {
+            "list_items": "private, no-cache",
+            "get_item": "private, no-cache",
+        }
+    )
+
+    # Response compression (CompressionMiddleware): gzip, or br when the brotli
+    # package is installed, for bodies of at least minimum_size bytes whose
+    # media type starts with an entry of content_types. text/event-stream is
+    # never compressed; a route opts out with Depends(no_compression)
+    compression_enabled: bool = Field(default=True)
+    compression_minimum_size: int = Field(default=1024)
+    compression_content_types: List[str] = Field(
+        default_factory=lambda: ["application/json", "application/x-ndjson", "text/"]
+    )
+    compression_gzip_level: int = Field(default=6)
+    compression_brotli_quality: int = Field(default=4)
 
     # CORS
     cors_origins: str = Field(default="http://localhost:4200,http://localhost:4300")
@@ -64,14 +148,52 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_requests: int = Field(default=100)
     rate_limit_window: int = Field(default=60)
+    # Most client keys a limiter tracks; the least recently seen is evicted
+    rate_limit_max_keys: int = Field(default=10_000)
+    # "memory" (per process), "shared_memory" (workers on one host) or "redis"
+    rate_limit_backend: str = Field(default="memory")
+    # tmpfs file backing the shared_memory backend
+    rate_limit_shm_path: str = Field(default="/dev/shm/app-ratelimit")
+    # Shared backends: seconds a key may be decided locally between syncs,
+    # and the share of its remaining budget it may spend locally
+    rate_limit_sync_interval: float = Field(default=1.0)
+    rate_limit_local_fraction: float = Field(default=0.1)
+    redis_url: str = Field(default="redis://localhost:6379/0", alias="REDIS_URL")
 
     # Logging
     log_level: str = Field(default="INFO")
     log_format: str = Field(default="json")
+    # Response body logging (LoggingMiddleware): off unless sampled in. A body
+    # is captured at a sample_rate fraction of requests, always for 5xx when
+    # on_5xx is set, and always for paths starting with a comma-separated prefix
+    # in paths; at most max_bytes are kept
+    log_response_body_sample_rate: float = Field(default=0.0)
+    log_response_body_on_5xx: bool = Field(default=False)
+    log_response_body_paths: str = Field(default="")
+    log_response_body_max_bytes: int = Field(default=4096)
 
     # Monitoring
     enable_metrics: bool = Field(default=True)
     metrics_path: str = Field(default="/metrics")
+    # Tracing (app.infrastructure.tracing): exporter is "otlp_file" (OTLP/JSON
+    # lines at file_path), "memory" or "module:factory"; sample_rate applies to
+    # requests without an incoming traceparent
+    tracing_enabled: bool = Field(default=False)
+    tracing_exporter: str = Field(default="otlp_file")
+    tracing_file_path: str = Field(default="traces.jsonl")
+    tracing_sample_rate: float = Field(default=1.0)
+    # On-demand profiling: X-Profile: 1 is honoured only in debug or staging;
+    # speedscope files go to profile_dir (newest max_files kept), listed at
+    # /debug/profiles
+    profiling_enabled: bool = Field(default=True)
+    profile_dir: str = Field(default=".profiles")
+    profile_max_files: int = Field(default=50)
+    profile_interval_ms: float = Field(default=1.0)
+    # Event-loop watchdog: lag sampled every interval_ms into a histogram; a
+    # stall longer than threshold_ms logs the loop thread's blocking frame
+    loop_watchdog_enabled: bool = Field(default=True)
+    loop_watchdog_interval_ms: float = Field(default=100.0)
+    loop_watchdog_threshold_ms: float = Field(default=250.0)
 
     # Performance
     connection_timeout: int = Field(default=10)